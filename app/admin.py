@@ -16,8 +16,14 @@ from datetime import datetime
 from django.utils.html import mark_safe
 from .utils.datetime_handlers import DateTimeHandler
 from .mixins.assignment_mixins import AssignmentAdminMixin
+from .services.availability import get_weekly_availability
+from .services.conflicts import SCHEDULED_STATUSES, find_batch_conflicts, find_conflicts
+from .services.matching import invalidate_language_index
+from .services.reference_data import invalidate_reference_data
 from . import models
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Prefetch
 # =======================================================
 # 1. UTILITAIRES POUR LE FUSEAU HORAIRE
 # =======================================================
@@ -152,6 +158,20 @@ class CustomAssignmentForm(forms.ModelForm):
             if end_time <= start_time:
                 raise ValidationError({'end_time': 'End time must be after start time.'})
 
+            # Conflits avec les missions engagées de l'interprète
+            interpreter = cleaned_data.get('interpreter')
+            if interpreter and cleaned_data.get('status') in SCHEDULED_STATUSES:
+                conflicts = find_conflicts(
+                    interpreter,
+                    [(start_time, end_time)],
+                    exclude_ids=[self.instance.pk] if self.instance.pk else None
+                )[0]
+                if conflicts:
+                    ids = ', '.join(f"#{conflict.id}" for conflict in conflicts)
+                    raise ValidationError({
+                        'interpreter': f'Schedule conflict: this interpreter is already booked on assignment(s) {ids}.'
+                    })
+
         return cleaned_data
 
 class CustomQuoteRequestForm(forms.ModelForm):
@@ -171,12 +191,26 @@ class CustomPublicQuoteRequestForm(forms.ModelForm):
 # =======================================================
 # 4. ACTIONS PERSONNALISÉES
 # =======================================================
+def set_active(queryset, value):
+    """
+    (Dés)activation en masse : update() n'envoie aucun signal, les caches
+    qui dépendent de l'état actif sont invalidés ici.
+    """
+    model = queryset.model
+    field = 'is_active' if any(f.name == 'is_active' for f in model._meta.fields) else 'active'
+    updated = queryset.update(**{field: value})
+    if model in (models.User, models.Interpreter):
+        transaction.on_commit(invalidate_language_index)
+    elif model in (models.Language, models.ServiceType):
+        invalidate_reference_data()
+    return updated
+
 def mark_as_active(modeladmin, request, queryset):
-    queryset.update(active=True)
+    set_active(queryset, True)
 mark_as_active.short_description = "Mark as active"
 
 def mark_as_inactive(modeladmin, request, queryset):
-    queryset.update(active=False)
+    set_active(queryset, False)
 mark_as_inactive.short_description = "Mark as inactive"
 
 def reset_password(modeladmin, request, queryset):
@@ -194,6 +228,12 @@ class InterpreterLanguageInline(admin.TabularInline):
     classes = ['collapse']
     fields = ('language', 'proficiency', 'is_primary', 'certified', 'certification_details')
 
+class InterpreterAvailabilityExceptionInline(admin.TabularInline):
+    model = models.InterpreterAvailabilityException
+    extra = 0
+    classes = ['collapse']
+    fields = ('date', 'start_minute', 'end_minute', 'is_available', 'reason')
+
 class AssignmentInline(admin.TabularInline):
     model = models.Assignment
     extra = 0
@@ -283,12 +323,14 @@ class InterpreterAdmin(admin.ModelAdmin):
         'state',
         'zip_code'
     )
-    inlines = [InterpreterLanguageInline]
+    inlines = [InterpreterLanguageInline, InterpreterAvailabilityExceptionInline]
+    readonly_fields = ('weekly_availability',)
+    list_select_related = ('user',)
     fieldsets = (
         ('Status', {'fields': (('user', 'active'),)}),
         ('Profile Information', {'fields': ('profile_image', 'bio')}),
         ('Contact Information', {'fields': ('address', ('city', 'state', 'zip_code'), 'radius_of_service')}),
-        ('Professional Information', {'fields': ('hourly_rate', 'certifications', 'specialties', 'availability')}),
+        ('Professional Information', {'fields': ('hourly_rate', 'certifications', 'specialties', 'availability', 'weekly_availability')}),
         ('Compliance', {'fields': (('background_check_date', 'background_check_status'), 'w9_on_file'),
                         'classes': ('collapse',)}),
         ('Banking Information (ACH)', {'fields': ('bank_name', 'account_holder_name', 'routing_number', 'account_number', 'account_type'),
@@ -299,6 +341,11 @@ class InterpreterAdmin(admin.ModelAdmin):
         return f"{obj.user.first_name} {obj.user.last_name}"
     get_full_name.short_description = 'Interpreter Name'
     get_full_name.admin_order_field = 'user__last_name'
+    def get_queryset(self, request):
+        # Langues de la liste chargées en une requête pour toute la page
+        return super().get_queryset(request).prefetch_related(
+            Prefetch('interpreterlanguage_set', queryset=models.InterpreterLanguage.objects.select_related('language'))
+        )
     def get_languages(self, obj):
         languages = obj.interpreterlanguage_set.all()
         language_list = []
@@ -308,10 +355,20 @@ class InterpreterAdmin(admin.ModelAdmin):
             language_list.append(f"{lang.language.name} ({lang.get_proficiency_display()}){cert_icon}{primary_icon}")
         return mark_safe("<br>".join(language_list))
     get_languages.short_description = 'Languages'
+    def weekly_availability(self, obj):
+        """Créneaux normalisés, générés depuis le JSON availability"""
+        if not obj or not obj.pk:
+            return "-"
+        lines = [
+            f"{day['day']}: {', '.join(day['slots'])}"
+            for day in get_weekly_availability(obj) if day['slots']
+        ]
+        return mark_safe("<br>".join(lines)) if lines else "No weekly availability declared"
+    weekly_availability.short_description = 'Weekly Availability (parsed)'
     def get_readonly_fields(self, request, obj=None):
         if obj:
-            return ('user',)
-        return ()
+            return ('user', 'weekly_availability')
+        return ('weekly_availability',)
     def save_model(self, request, obj, form, change):
         if not change:
             obj.active = True
@@ -325,11 +382,11 @@ class InterpreterAdmin(admin.ModelAdmin):
         return form
     actions = ['activate_interpreters', 'deactivate_interpreters']
     def activate_interpreters(self, request, queryset):
-        updated = queryset.update(active=True)
+        updated = set_active(queryset, True)
         self.message_user(request, f'{updated} interpreter(s) have been successfully activated.')
     activate_interpreters.short_description = "Activate selected interpreters"
     def deactivate_interpreters(self, request, queryset):
-        updated = queryset.update(active=False)
+        updated = set_active(queryset, False)
         self.message_user(request, f'{updated} interpreter(s) have been successfully deactivated.')
     deactivate_interpreters.short_description = "Deactivate selected interpreters"
 
@@ -365,6 +422,7 @@ class QuoteRequestAdmin(admin.ModelAdmin):
 @admin.register(models.Quote)
 class QuoteAdmin(admin.ModelAdmin):
     list_display = ('reference_number', 'get_client', 'amount', 'status', 'created_at')
+    list_select_related = ('quote_request__client',)
     list_filter = ('status', 'created_at')
     search_fields = ('reference_number', 'quote_request__client__company_name')
     readonly_fields = ('created_at', 'updated_at')
@@ -392,6 +450,7 @@ class AssignmentAdmin(AssignmentAdminMixin, admin.ModelAdmin):
         'get_status_display',
         'get_payment_status'
     )
+    list_select_related = ('interpreter__user', 'service_type', 'source_language', 'target_language')
     list_filter = (
         'status', 
         'service_type',
@@ -407,20 +466,22 @@ class AssignmentAdmin(AssignmentAdminMixin, admin.ModelAdmin):
         'interpreter__user__last_name'
     )
     raw_id_fields = ('quote', 'interpreter')
+    actions = ['check_schedule_conflicts']
     readonly_fields = (
         'created_at', 
         'updated_at', 
         'completed_at', 
         'total_interpreter_payment',
         'formatted_start_time_detail',
-        'formatted_end_time_detail'
+        'formatted_end_time_detail',
+        'matching_interpreters_link'
     )
 
     fieldsets = (
         ('Assignment Information', {
             'fields': (
                 ('quote', 'service_type'), 
-                ('interpreter',),
+                ('interpreter', 'matching_interpreters_link'),
                 ('client_name', 'client_email', 'client_phone')
             ),
             'description': 'All client information fields (name, email, phone) are optional. You can leave them all empty if no client information is available yet.'
@@ -463,6 +524,31 @@ class AssignmentAdmin(AssignmentAdminMixin, admin.ModelAdmin):
         }),
     )
 
+    def matching_interpreters_link(self, obj):
+        """Lien vers les interprètes disponibles pour cette mission"""
+        if not obj or not obj.pk:
+            return "-"
+        return format_html(
+            '<a href="{}" target="_blank">Find available interpreters</a>',
+            reverse('admin:assignment-matching-interpreters', args=[obj.pk])
+        )
+    matching_interpreters_link.short_description = "Matching"
+
+    def check_schedule_conflicts(self, request, queryset):
+        """Vérifie en lot les conflits d'horaire des missions sélectionnées"""
+        active = queryset.filter(status__in=SCHEDULED_STATUSES).exclude(interpreter__isnull=True)
+        conflicts = find_batch_conflicts(list(active))
+        for assignment, conflicting in conflicts:
+            ids = ', '.join(f"#{conflict.id}" for conflict in conflicting)
+            self.message_user(
+                request,
+                f'Assignment #{assignment.id} overlaps assignment(s) {ids} for the same interpreter.',
+                messages.WARNING
+            )
+        if not conflicts:
+            self.message_user(request, 'No schedule conflicts found in the selected assignments.')
+    check_schedule_conflicts.short_description = "Check schedule conflicts"
+
     def get_languages(self, obj):
         """Display languages"""
         return f"{obj.source_language.name} → {obj.target_language.name}"
@@ -624,6 +710,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
 @admin.register(models.AuditLog)
 class AuditLogAdmin(admin.ModelAdmin):
     list_display = ('timestamp', 'user', 'action', 'model_name', 'object_id')
+    list_select_related = ('user',)
     list_filter = ('action', 'model_name', 'timestamp')
     search_fields = ('user__email', 'action', 'changes')
     readonly_fields = ('timestamp', 'user', 'action', 'model_name', 'object_id', 'changes', 'ip_address')
@@ -824,6 +911,7 @@ class InterpreterPaymentAdmin(admin.ModelAdmin):
 @admin.register(models.Expense)
 class ExpenseAdmin(admin.ModelAdmin):
     list_display = ('transaction_id', 'expense_type', 'amount', 'status', 'formatted_date_incurred')
+    list_select_related = ('transaction',)
     list_filter = ('status', 'expense_type', 'date_incurred')
     search_fields = ('description', 'notes')
     raw_id_fields = ('transaction', 'approved_by')
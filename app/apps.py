@@ -6,7 +6,8 @@ class AppConfig(AppConfig):
     name = "app"
     
     def ready(self):
+        import app.receivers  # Agrégats journaliers (InterpreterDailyRollup)
         try:
             import app.signals  # Import des signals
         except ImportError:
-            pass
\ No newline at end of file
+            pass
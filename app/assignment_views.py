@@ -23,6 +23,8 @@ from email.utils import make_msgid
 from icalendar import Calendar, Event, vCalAddress
 
 from app.models import Assignment, AuditLog, User
+from app.services.conflicts import get_conflicts
+from app.tasks import enqueue_on_commit, send_assignment_response_admin_email, send_assignment_response_email
 
 # Définir le timezone de Boston
 BOSTON_TZ = pytz.timezone('America/New_York')
@@ -76,6 +78,16 @@ class AssignmentResponseBaseMixin:
             'login_url': reverse('dbdint:login')
         })
 
+    def handle_schedule_conflict(self, request):
+        """
+        Rend une page indiquant que l'interprète a déjà une mission sur ce créneau.
+        """
+        return render(request, 'pages/already_processed.html', {
+            'title': _('Schedule Conflict'),
+            'message': _('You already have an assignment during this time period.'),
+            'login_url': reverse('dbdint:login')
+        })
+
     def log_action(self, assignment, action, user, changes=None):
         """
         Log l'action réalisée sur l'Assignment dans l'AuditLog.
@@ -337,14 +349,17 @@ class AssignmentAcceptView(AssignmentResponseBaseMixin, TemplateView):
             if assignment.status != Assignment.Status.PENDING:
                 return self.handle_already_processed(request)
 
+            if get_conflicts(assignment):
+                return self.handle_schedule_conflict(request)
+
             # Update assignment status
             old_status = assignment.status
             assignment.status = Assignment.Status.CONFIRMED
             assignment.save()
 
-            # Notifications
-            self.send_confirmation_to_interpreter(assignment)
-            self.notify_admin(assignment, 'accepted', assignment.interpreter)
+            # Notifications (Celery, après commit)
+            enqueue_on_commit(send_assignment_response_email, assignment.id, 'accepted', assignment.interpreter_id)
+            enqueue_on_commit(send_assignment_response_admin_email, assignment.id, 'accepted', assignment.interpreter_id)
 
             # Log
             self.log_action(
@@ -409,9 +424,9 @@ class AssignmentDeclineView(AssignmentResponseBaseMixin, TemplateView):
             assignment.interpreter = None
             assignment.save()
 
-            # Notifications
-            self.send_decline_confirmation(assignment, interpreter)
-            self.notify_admin(assignment, 'declined', interpreter)
+            # Notifications (Celery, après commit)
+            enqueue_on_commit(send_assignment_response_email, assignment.id, 'declined', interpreter.pk)
+            enqueue_on_commit(send_assignment_response_admin_email, assignment.id, 'declined', interpreter.pk)
 
             # Log
             self.log_action(
@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+# Profils chargés avec l'utilisateur (jointures gauches) : un profil absent est
+# mis en cache comme tel, hasattr(user, 'client_profile') ne fait plus de requête
+PROFILE_RELATIONS = ('client_profile', 'interpreter_profile')
+
+
+class ProfileModelBackend(ModelBackend):
+    """ModelBackend dont get_user / aget_user (à chaque requête authentifiée) chargent aussi le profil"""
+
+    def get_users(self):
+        return get_user_model()._default_manager.select_related(*PROFILE_RELATIONS)
+
+    def get_user(self, user_id):
+        try:
+            user = self.get_users().get(pk=user_id)
+        except get_user_model().DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        # request.auser() (vues async) : ModelBackend.aget_user n'appelle pas get_user
+        try:
+            user = await self.get_users().aget(pk=user_id)
+        except get_user_model().DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,156 @@
+"""
+Cache partagé de l'application (Redis, obligatoire hors DEBUG ; locmem en test / dev,
+voir CACHES). Chaque usage déclare un CacheNamespace :
+
+- clés préfixées par le nom de l'espace ("unread:notifications:12") ;
+- versions par entité : invalider = supprimer une clé, en O(1) ; les
+  données des anciennes versions deviennent inaccessibles et expirent ;
+- get_or_build : recalcul anticipé probabiliste (XFetch), un seul processus
+  recalcule en général avant l'expiration, sans verrou ;
+- métriques hits / misses / recalculs par espace, par processus.
+"""
+import math
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+MISSING = object()
+# Plus beta est grand, plus le recalcul anticipé est précoce (1.0 : valeur de l'article XFetch)
+EARLY_REFRESH_BETA = 1.0
+
+_metrics = Counter()
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """{espace: {événement: nombre}} pour ce processus"""
+    with _metrics_lock:
+        metrics = {}
+        for (namespace, event), count in _metrics.items():
+            metrics.setdefault(namespace, {})[event] = count
+    return metrics
+
+
+def reset_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+
+
+class CacheNamespace:
+    """Espace de clés du cache partagé"""
+
+    def __init__(self, name, timeout=300, version_timeout=None):
+        self.name = name
+        self.timeout = timeout
+        self.version_timeout = version_timeout
+
+    def _record(self, event, count=1):
+        if count:
+            with _metrics_lock:
+                _metrics[(self.name, event)] += count
+
+    def make_key(self, key):
+        """Clé complète ; `key` est une valeur ou un tuple de parties"""
+        parts = key if isinstance(key, tuple) else (key,)
+        return ':'.join([self.name, *map(str, parts)])
+
+    def _timeout(self, timeout):
+        return self.timeout if timeout is MISSING else timeout
+
+    # Opérations simples
+
+    def get(self, key, default=None):
+        value = cache.get(self.make_key(key), MISSING)
+        self._record('hits' if value is not MISSING else 'misses')
+        return default if value is MISSING else value
+
+    def get_many(self, keys):
+        """{clé: valeur} pour les clés présentes"""
+        full_keys = {self.make_key(key): key for key in keys}
+        values = cache.get_many(list(full_keys))
+        self._record('hits', len(values))
+        self._record('misses', len(full_keys) - len(values))
+        return {full_keys[full_key]: value for full_key, value in values.items()}
+
+    def set(self, key, value, timeout=MISSING):
+        cache.set(self.make_key(key), value, self._timeout(timeout))
+
+    def set_many(self, mapping, timeout=MISSING):
+        cache.set_many(
+            {self.make_key(key): value for key, value in mapping.items()}, self._timeout(timeout)
+        )
+
+    def add(self, key, value, timeout=MISSING):
+        return cache.add(self.make_key(key), value, self._timeout(timeout))
+
+    def incr(self, key, delta=1):
+        """ValueError si la clé est absente (comme cache.incr)"""
+        return cache.incr(self.make_key(key), delta)
+
+    def delete(self, key):
+        cache.delete(self.make_key(key))
+
+    def delete_many(self, keys):
+        cache.delete_many([self.make_key(key) for key in keys])
+
+    # Versions par entité
+
+    def get_version(self, entity):
+        """
+        Version courante de l'entité. Une version absente (invalidée, expirée
+        ou évincée) est recréée à partir de l'horloge : elle est donc toujours
+        plus récente que toutes les précédentes.
+        """
+        key = self.make_key(('version', entity))
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), self.version_timeout)
+            version = cache.get(key)
+        return version
+
+    def bump(self, *entities):
+        """Invalide tout ce qui dépend de la version de ces entités"""
+        entities = set(entities) - {None}
+        if entities:
+            self._record('invalidations', len(entities))
+            cache.delete_many([self.make_key(('version', entity)) for entity in entities])
+
+    def bump_on_commit(self, *entities):
+        """bump() après commit : un recalcul ne peut pas reprendre l'état d'avant la transaction"""
+        entities = set(entities) - {None}
+        if entities:
+            transaction.on_commit(lambda: self.bump(*entities))
+
+    # Valeurs calculées
+
+    def get_or_build(self, key, build, timeout=MISSING):
+        """
+        Valeur en cache, ou build() (mise en cache). Avant l'expiration, une
+        lecture déclenche le recalcul avec une probabilité qui croît à
+        l'approche de l'échéance et avec la durée du calcul (XFetch) : les
+        lectures concurrentes ne recalculent pas toutes en même temps.
+        """
+        full_key = self.make_key(key)
+        entry = cache.get(full_key)
+        if entry is not None:
+            value, duration, expires_at = entry
+            # 1 - random() dans ]0, 1] : log défini
+            if time.time() - duration * EARLY_REFRESH_BETA * math.log(1.0 - random.random()) < expires_at:
+                self._record('hits')
+                return value
+            self._record('early_refreshes')
+        else:
+            self._record('misses')
+
+        started = time.monotonic()
+        value = build()
+        duration = time.monotonic() - started
+        timeout = self._timeout(timeout)
+        expires_at = math.inf if timeout is None else time.time() + timeout
+        cache.set(full_key, (value, duration, expires_at), timeout)
+        return value
@@ -1,6 +1,7 @@
 # custom_storage.py
 from django.core.files.storage import Storage
 from supabase import create_client
+from app.utils.request_timing import track_outbound
 import os
 import io
 
@@ -17,21 +18,24 @@ class SupabaseStorage(Storage):
         file_bytes = content.read()
         
         # Upload sur Supabase
-        self.supabase.storage.from_(self.bucket_name).upload(
-            file=file_bytes, 
-            path=name, 
-            file_options={"content-type": content.content_type}
-        )
+        with track_outbound('supabase'):
+            self.supabase.storage.from_(self.bucket_name).upload(
+                file=file_bytes, 
+                path=name, 
+                file_options={"content-type": content.content_type}
+            )
         return name
 
     def exists(self, name):
         try:
             # Vérifier si le fichier existe
-            self.supabase.storage.from_(self.bucket_name).get(name)
+            with track_outbound('supabase'):
+                self.supabase.storage.from_(self.bucket_name).get(name)
             return True
         except:
             return False
 
     def url(self, name):
         # Générer l'URL publique du fichier
-        return self.supabase.storage.from_(self.bucket_name).get_public_url(name)
\ No newline at end of file
+        with track_outbound('supabase'):
+            return self.supabase.storage.from_(self.bucket_name).get_public_url(name)
\ No newline at end of file
@@ -29,6 +29,82 @@ from .models import (
 )
 from .models import PayrollDocument, Service
 from django.forms import modelformset_factory
+from django.forms.models import ModelChoiceIterator
+import copy
+from .services.reference_data import get_active_languages, get_active_service_types
+
+
+class ReferenceChoiceIterator(ModelChoiceIterator):
+    """Choix lus dans les référentiels en mémoire (aucune requête)"""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.field.get_reference_objects():
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(self.field.get_reference_objects()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.get_reference_objects())
+
+
+class ReferenceChoiceMixin:
+    """
+    Champ de choix sur un référentiel (langues, types de service) : choix et
+    validation depuis le cache en mémoire (app.services.reference_data) ; le
+    queryset n'est jamais évalué.
+    """
+    iterator = ReferenceChoiceIterator
+    get_reference_objects = None
+
+    def get_reference_object(self, value):
+        if isinstance(value, self.queryset.model):
+            value = value.pk
+        for obj in self.get_reference_objects():
+            if str(obj.pk) == str(value):
+                return copy.copy(obj)  # les instances du cache sont partagées
+        raise ValidationError(
+            self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value}
+        )
+
+
+class ReferenceModelChoiceField(ReferenceChoiceMixin, forms.ModelChoiceField):
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        return self.get_reference_object(value)
+
+
+class ReferenceModelMultipleChoiceField(ReferenceChoiceMixin, forms.ModelMultipleChoiceField):
+
+    def clean(self, value):
+        value = self.prepare_value(value)
+        if not value:
+            if self.required:
+                raise ValidationError(self.error_messages['required'], code='required')
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError(self.error_messages['invalid_list'], code='invalid_list')
+        objects = [self.get_reference_object(pk) for pk in dict.fromkeys(value)]
+        self.run_validators(value)
+        return objects
+
+
+class LanguageChoiceField(ReferenceModelChoiceField):
+    get_reference_objects = staticmethod(get_active_languages)
+
+
+class LanguageMultipleChoiceField(ReferenceModelMultipleChoiceField):
+    get_reference_objects = staticmethod(get_active_languages)
+
+
+class ServiceTypeChoiceField(ReferenceModelChoiceField):
+    get_reference_objects = staticmethod(get_active_service_types)
+
+
 class PublicQuoteRequestForm(forms.ModelForm):
     class Meta:
         model = PublicQuoteRequest
@@ -38,6 +114,12 @@ class PublicQuoteRequestForm(forms.ModelForm):
             'requested_date', 'duration', 'location', 'city', 
             'state', 'zip_code', 'special_requirements'
         ]
+        # Langues et types de service actifs, depuis le cache en mémoire
+        field_classes = {
+            'source_language': LanguageChoiceField,
+            'target_language': LanguageChoiceField,
+            'service_type': ServiceTypeChoiceField,
+        }
         widgets = {
             'requested_date': forms.DateTimeInput(
                 attrs={'type': 'datetime-local'},
@@ -84,8 +166,7 @@ class PublicQuoteRequestForm(forms.ModelForm):
             if field_name != 'special_requirements':
                 field.required = True
         
-        # Only show active services in the dropdown
-        self.fields['service_type'].queryset = ServiceType.objects.filter(active=True)
+        # Only show active services in the dropdown (ServiceTypeChoiceField)
         
         # Optional: Customize the empty label
         self.fields['service_type'].empty_label = "Select a service type"
@@ -234,6 +315,7 @@ class ClientRegistrationForm2(forms.ModelForm):
     class Meta:
         model = Client
         fields = ['company_name', 'address', 'city', 'state', 'zip_code', 'preferred_language']
+        field_classes = {'preferred_language': LanguageChoiceField}
         widgets = {
             'company_name': forms.TextInput(attrs={
                 'class': 'form-control',
@@ -264,8 +346,7 @@ class ClientRegistrationForm2(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Filtrer les langues actives
-        self.fields['preferred_language'].queryset = Language.objects.filter(is_active=True)
+        # Langues actives : LanguageChoiceField
         # Ajouter un placeholder vide au début de la liste
         self.fields['preferred_language'].empty_label = "Select your preferred language"
         
@@ -293,6 +374,7 @@ class NotificationPreferencesForm(forms.ModelForm):
     class Meta:
         model = NotificationPreference
         exclude = ['user']
+        field_classes = {'preferred_language': LanguageChoiceField}
         widgets = {
             'email_quote_updates': forms.CheckboxInput(attrs={
                 'class': 'form-check-input'
@@ -326,9 +408,6 @@ class NotificationPreferencesForm(forms.ModelForm):
             })
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['preferred_language'].queryset = Language.objects.filter(is_active=True)
 
 class CustomPasswordResetForm(PasswordResetForm):
     """Custom password reset form with styling"""
@@ -377,6 +456,12 @@ class QuoteRequestForm(forms.ModelForm):
             'target_language',
             'special_requirements'
         ]
+        # Types de service et langues actifs, depuis le cache en mémoire
+        field_classes = {
+            'service_type': ServiceTypeChoiceField,
+            'source_language': LanguageChoiceField,
+            'target_language': LanguageChoiceField,
+        }
         widgets = {
             'service_type': forms.Select(attrs={
                 'class': 'form-control'
@@ -414,19 +499,14 @@ class QuoteRequestForm(forms.ModelForm):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         
-        # Filter active service types
-        self.fields['service_type'].queryset = ServiceType.objects.filter(active=True)
-        
-        # Filter active languages
-        active_languages = Language.objects.filter(is_active=True)
-        self.fields['source_language'].queryset = active_languages
-        self.fields['target_language'].queryset = active_languages
+        # Types de service et langues actifs : Meta.field_classes
 
         # Set preferred language if available
         if user and hasattr(user, 'client_profile'):
-            preferred_language = user.client_profile.preferred_language
-            if preferred_language:
-                self.fields['source_language'].initial = preferred_language
+            # L'id suffit comme valeur initiale : pas de requête sur Language
+            preferred_language_id = user.client_profile.preferred_language_id
+            if preferred_language_id:
+                self.fields['source_language'].initial = preferred_language_id
 
     def clean(self):
         cleaned_data = super().clean()
@@ -532,7 +612,7 @@ class QuoteFilterForm(forms.Form):
         })
     )
 
-    service_type = forms.ModelChoiceField(
+    service_type = ServiceTypeChoiceField(
         queryset=ServiceType.objects.filter(active=True),
         required=False,
         empty_label="All Services",
@@ -693,7 +773,7 @@ class InterpreterRegistrationForm1(forms.ModelForm):
        return username
 class InterpreterRegistrationForm2(forms.ModelForm):
     """Formulaire étape 2: Qualifications professionnelles"""
-    languages = forms.ModelMultipleChoiceField(
+    languages = LanguageMultipleChoiceField(
         queryset=Language.objects.filter(is_active=True),
         widget=forms.SelectMultiple(attrs={
             'class': 'form-control',
@@ -0,0 +1,136 @@
+import asyncio
+import statistics
+import time
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncRequestFactory
+from django.utils import timezone
+
+from app import views
+from app.models import Assignment, Interpreter
+from app.utils.datetime_handlers import DateTimeHandler
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare le débit des API JSON interprète, versions sync et async (ORM async), "
+        "sous requêtes concurrentes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interpreter', type=int, help="ID d'interprète, par défaut le premier actif")
+        parser.add_argument('--requests', type=int, default=200, help="Requêtes par API et par version")
+        parser.add_argument('--concurrency', type=int, default=20, help="Requêtes simultanées")
+
+    def get_endpoints(self, interpreter):
+        today = timezone.localdate()
+        month_start, month_end = DateTimeHandler.month_range(today.year, today.month)
+        endpoints = [
+            (
+                'calendar_data_api',
+                f'/api/interpreter/calendar-data/{today.year}/{today.month}/', {},
+                views.calendar_data_api, views.calendar_data_api_async,
+                {'year': today.year, 'month': today.month},
+            ),
+            (
+                'daily_missions_api',
+                f'/api/interpreter/missions/{today.isoformat()}/', {},
+                views.daily_missions_api, views.daily_missions_api_async,
+                {'date_str': today.isoformat()},
+            ),
+            (
+                'earnings_data_api',
+                '/api/earnings/month/', {},
+                views.earnings_data_api, views.earnings_data_api_async,
+                {'period': 'month'},
+            ),
+            (
+                'get_calendar_assignments',
+                '/interpreter/schedule/assignments/',
+                {'start': month_start.isoformat(), 'end': month_end.isoformat()},
+                views.get_calendar_assignments, views.get_calendar_assignments_async,
+                {},
+            ),
+        ]
+        assignment_id = Assignment.objects.filter(
+            interpreter=interpreter
+        ).order_by('-start_time').values_list('pk', flat=True).first()
+        if assignment_id:
+            endpoints.append((
+                'AssignmentDetailView',
+                f'/interpreter/assignments/{assignment_id}/details/', {},
+                views.AssignmentDetailView.as_view(), views.AssignmentDetailAsyncView.as_view(),
+                {'pk': assignment_id},
+            ))
+        return endpoints
+
+    async def run(self, user, path, params, view, kwargs, is_async, total, concurrency):
+        """
+        Exécute `total` requêtes, `concurrency` à la fois. Comme ASGIHandler,
+        chaque requête a son propre ThreadSensitiveContext ; une vue sync est
+        exécutée via sync_to_async, comme Django le fait sous ASGI.
+        """
+        factory = AsyncRequestFactory()
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def auser():
+            return user
+
+        async def one():
+            request = factory.get(path, params)
+            request.user = user
+            request.auser = auser
+            async with semaphore:
+                async with ThreadSensitiveContext():
+                    started = time.perf_counter()
+                    if is_async:
+                        response = await view(request, **kwargs)
+                    else:
+                        response = await sync_to_async(view)(request, **kwargs)
+                    latencies.append(time.perf_counter() - started)
+                    # Comme request_finished : libère la connexion du thread de la requête
+                    await sync_to_async(connections.close_all)()
+            if response.status_code != 200:
+                raise CommandError(f"{path} -> HTTP {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        return {
+            'rps': total / elapsed,
+            'p50': statistics.median(latencies) * 1000,
+            'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        }
+
+    def handle(self, *args, **options):
+        interpreters = Interpreter.objects.select_related('user').filter(active=True, user__is_active=True)
+        if options['interpreter']:
+            interpreters = interpreters.filter(pk=options['interpreter'])
+        interpreter = interpreters.order_by('pk').first()
+        if interpreter is None:
+            raise CommandError("Aucun interprète actif trouvé")
+
+        total = max(options['requests'], 1)
+        concurrency = max(options['concurrency'], 1)
+        self.stdout.write(
+            f"Interprète {interpreter.pk}, {total} requêtes par version, {concurrency} simultanées"
+        )
+        self.stdout.write(f"{'API':<26}{'version':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+
+        for name, path, params, sync_view, async_view, kwargs in self.get_endpoints(interpreter):
+            results = {}
+            for label, view, is_async in (('sync', sync_view, False), ('async', async_view, True)):
+                results[label] = asyncio.run(self.run(
+                    interpreter.user, path, params, view, kwargs, is_async, total, concurrency
+                ))
+                result = results[label]
+                self.stdout.write(
+                    f"{name:<26}{label:<8}{result['rps']:>10.1f}{result['p50']:>10.1f}{result['p95']:>10.1f}"
+                )
+            self.stdout.write(self.style.SUCCESS(
+                f"{name:<26}async/sync x{results['async']['rps'] / results['sync']['rps']:.2f}"
+            ))
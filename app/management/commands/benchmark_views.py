@@ -0,0 +1,189 @@
+import json
+import statistics
+import time
+from io import StringIO
+
+from django.conf import settings
+from django.contrib import admin
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client as TestClient
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app.management.commands.generate_workload import USERNAME_PREFIX
+from app.models import (
+    Assignment, AuditLog, Client, Interpreter, Notification, Payment, PayrollDocument, Quote, QuoteRequest,
+    User
+)
+from app.utils.datetime_handlers import DateTimeHandler
+
+
+class Command(BaseCommand):
+    help = (
+        "Chronomètre les tableaux de bord, calendriers, gains, listes de l'admin et l'export PDF "
+        "à plusieurs volumes de données (générés avec generate_workload) et écrit un rapport JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10,50,200',
+                            help="Nombres cumulés d'interprètes générés, séparés par des virgules")
+        parser.add_argument('--clients-per-interpreter', type=float, default=0.5)
+        parser.add_argument('--years', type=float, default=3, help="Années d'historique générées")
+        parser.add_argument('--repeat', type=int, default=5, help="Mesures par chemin")
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--no-generate', action='store_true',
+                            help="Mesure les données existantes, sans rien générer")
+        parser.add_argument('--output', default='benchmark-report.json', help="Fichier du rapport JSON")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options['sizes'].split(',') if size.strip()})
+        except ValueError:
+            raise CommandError("--sizes attend des entiers séparés par des virgules")
+        if options['no_generate']:
+            sizes = [None]
+        elif not sizes or sizes[0] <= 0:
+            raise CommandError("--sizes attend des entiers positifs")
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'repeat': max(options['repeat'], 1),
+            'runs': [],
+        }
+        for target in sizes:
+            if target is not None:
+                self.grow_workload(target, options)
+            run = {'size': self.get_size(), 'paths': self.run_paths(report['repeat'])}
+            report['runs'].append(run)
+
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Rapport écrit dans {options['output']}"))
+
+    def grow_workload(self, target, options):
+        """Complète la charge générée jusqu'à `target` interprètes"""
+        existing = Interpreter.objects.filter(user__username__startswith=USERNAME_PREFIX).count()
+        missing = target - existing
+        if missing <= 0:
+            return
+        self.stdout.write(f"Génération de {missing} interprètes (total {target})...")
+        call_command(
+            'generate_workload', interpreters=missing,
+            clients=max(int(missing * options['clients_per_interpreter']), 1),
+            years=options['years'], seed=options['seed'] + target, stdout=StringIO()
+        )
+
+    def get_size(self):
+        return {
+            'interpreters': Interpreter.objects.count(),
+            'clients': Client.objects.count(),
+            'quote_requests': QuoteRequest.objects.count(),
+            'quotes': Quote.objects.count(),
+            'assignments': Assignment.objects.count(),
+            'payments': Payment.objects.count(),
+            'notifications': Notification.objects.count(),
+            'audit_logs': AuditLog.objects.count(),
+        }
+
+    def get_users(self):
+        interpreter = Interpreter.objects.select_related('user').filter(
+            user__username__startswith=USERNAME_PREFIX
+        ).order_by('pk').first() or Interpreter.objects.select_related('user').order_by('pk').first()
+        client = Client.objects.select_related('user').filter(
+            user__username__startswith=USERNAME_PREFIX
+        ).order_by('pk').first() or Client.objects.select_related('user').order_by('pk').first()
+        admin_user = User.objects.filter(is_superuser=True, is_active=True).order_by('pk').first()
+        if interpreter is None or admin_user is None:
+            raise CommandError("Aucun interprète ou administrateur : lancez d'abord generate_workload")
+        return {
+            'interpreter': interpreter.user,
+            'client': client.user if client else None,
+            'admin': admin_user,
+        }
+
+    def get_paths(self):
+        """(catégorie, nom, rôle, url, paramètres GET)"""
+        today = timezone.localdate()
+        month_start, month_end = DateTimeHandler.month_range(today.year, today.month)
+        paths = [
+            ('dashboard', 'interpreter_dashboard', 'interpreter', reverse('dbdint:interpreter_dashboard'), {}),
+            ('dashboard', 'new_interpreter_dashboard', 'interpreter',
+             reverse('dbdint:new_interpreter_dashboard'), {}),
+            ('dashboard', 'interpreter_assignments', 'interpreter',
+             reverse('dbdint:interpreter_assignments'), {}),
+            ('dashboard', 'interpreter_notifications', 'interpreter',
+             reverse('dbdint:interpreter_notifications'), {}),
+            ('dashboard', 'client_dashboard', 'client', reverse('dbdint:client_dashboard'), {}),
+            ('dashboard', 'client_quote_list', 'client', reverse('dbdint:client_quote_list'), {}),
+            ('calendar', 'interpreter_schedule', 'interpreter', reverse('dbdint:interpreter_schedule'), {}),
+            ('calendar', 'interpreter_calendar', 'interpreter', reverse('dbdint:interpreter_calendar'), {}),
+            ('calendar', 'calendar_data_api', 'interpreter',
+             reverse('dbdint:calendar_data_api', kwargs={'year': today.year, 'month': today.month}), {}),
+            ('calendar', 'daily_missions_api', 'interpreter',
+             reverse('dbdint:daily_missions_api', kwargs={'date_str': today.isoformat()}), {}),
+            ('calendar', 'get_calendar_assignments', 'interpreter',
+             reverse('dbdint:get_calendar_assignments'),
+             {'start': month_start.isoformat(), 'end': month_end.isoformat()}),
+            ('earnings', 'translator_earnings', 'interpreter', reverse('dbdint:translator_earnings'), {}),
+            ('earnings', 'interpreter_payments', 'interpreter', reverse('dbdint:interpreter_payments'), {}),
+            ('earnings', 'new_interpreter_stats', 'interpreter', reverse('dbdint:new_interpreter_stats'), {}),
+        ]
+        for period in ('week', 'month', 'year'):
+            paths.append(('earnings', f'earnings_data_api_{period}', 'interpreter',
+                          reverse('dbdint:earnings_data', kwargs={'period': period}), {}))
+        paths.append(('earnings', 'earnings_data_year', 'interpreter',
+                      reverse('dbdint:earnings_data_year', kwargs={'year': today.year}), {}))
+
+        for model in admin.site._registry:
+            opts = model._meta
+            paths.append(('admin', f'{opts.app_label}.{opts.model_name}', 'admin',
+                          reverse(f'admin:{opts.app_label}_{opts.model_name}_changelist'), {}))
+
+        payroll = PayrollDocument.objects.order_by('-services__id').first()
+        if payroll:
+            paths.append(('export', 'payroll_pdf', 'admin',
+                          reverse('dbdint:payroll_detail', kwargs={'pk': payroll.pk}), {'export': 'pdf'}))
+        return paths
+
+    def run_paths(self, repeat):
+        users = self.get_users()
+        clients = {}
+        results = []
+        self.stdout.write(f"{'chemin':<42}{'statut':>7}{'req.':>6}{'méd. ms':>10}{'p95 ms':>10}")
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for category, name, role, url, params in self.get_paths():
+                if users[role] is None:
+                    continue
+                if role not in clients:
+                    clients[role] = TestClient()
+                    clients[role].force_login(users[role])
+                client = clients[role]
+
+                client.get(url, params)  # chauffe (caches, compilation des templates)
+                timings = []
+                for _ in range(repeat):
+                    with CaptureQueriesContext(connection) as queries:
+                        started = time.perf_counter()
+                        response = client.get(url, params)
+                        timings.append((time.perf_counter() - started) * 1000)
+                timings.sort()
+                result = {
+                    'category': category,
+                    'name': name,
+                    'url': url,
+                    'status': response.status_code,
+                    'queries': len(queries),
+                    'median_ms': round(statistics.median(timings), 2),
+                    'p95_ms': round(timings[max(int(len(timings) * 0.95) - 1, 0)], 2),
+                    'min_ms': round(timings[0], 2),
+                }
+                results.append(result)
+                self.stdout.write(
+                    f"{category + ':' + name:<42}{result['status']:>7}{result['queries']:>6}"
+                    f"{result['median_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+                )
+        return results
@@ -0,0 +1,452 @@
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from app.models import (
+    Assignment, AuditLog, Client, FinancialTransaction, Interpreter, InterpreterLanguage,
+    InterpreterPayment, Language, Notification, Payment, PayrollDocument, Quote, QuoteRequest, Service,
+    ServiceType, User
+)
+from app.services.rollups import local_day, rebuild_daily_rollups
+from app.services.unread_counters import reconcile_unread_counters
+from app.utils.geo import load_zip_centroids, zip_to_coordinates
+
+# Comptes générés : reconnaissables, et comptés pour les générations incrémentales
+USERNAME_PREFIX = 'workload-'
+
+LANGUAGES = [
+    ('English', 'en'), ('Spanish', 'es'), ('Portuguese', 'pt'), ('Haitian Creole', 'ht'),
+    ('Cape Verdean Creole', 'kea'), ('Mandarin', 'zh'), ('Vietnamese', 'vi'), ('Arabic', 'ar'),
+    ('Russian', 'ru'), ('French', 'fr'),
+]
+SERVICE_TYPES = [
+    ('Medical', Decimal('55')), ('Legal', Decimal('70')), ('Educational', Decimal('45')),
+    ('Business', Decimal('60')), ('Social Services', Decimal('45')),
+]
+# Préfixe à 3 chiffres du code postal -> (état, ville)
+ZIP_PREFIX_STATES = [
+    (27, 'MA', 'Boston'), (29, 'RI', 'Providence'), (38, 'NH', 'Manchester'), (49, 'ME', 'Portland'),
+    (59, 'VT', 'Burlington'), (69, 'CT', 'Hartford'), (89, 'NJ', 'Newark'), (149, 'NY', 'New York'),
+]
+
+DEFAULT_STATUS_WEIGHTS = 'COMPLETED=80,CANCELLED=12,NO_SHOW=3,CONFIRMED=5'
+DEFAULT_FUTURE_WEIGHTS = 'CONFIRMED=60,PENDING=40'
+
+
+def parse_weights(value, option):
+    """'COMPLETED=80,CANCELLED=12' -> ([statuts], [poids])"""
+    statuses, weights = [], []
+    for item in value.split(','):
+        status, _, weight = item.partition('=')
+        status = status.strip().upper()
+        if status not in Assignment.Status.values:
+            raise CommandError(f"{option} : statut inconnu '{status}'")
+        try:
+            weights.append(float(weight))
+        except ValueError:
+            raise CommandError(f"{option} : poids invalide pour {status}")
+        statuses.append(status)
+    if not statuses or sum(weights) <= 0:
+        raise CommandError(f"{option} : au moins un poids positif est requis")
+    return statuses, weights
+
+
+def zip_location(zip_code):
+    prefix = int(zip_code[:3])
+    for last_prefix, state, city in ZIP_PREFIX_STATES:
+        if prefix <= last_prefix:
+            return state, city
+    return ZIP_PREFIX_STATES[-1][1:]
+
+
+def bulk_insert(model, objects, batch_size):
+    """
+    bulk_create qui renseigne toujours les clés primaires : MySQL ne les
+    retourne pas, elles sont alors attribuées à la suite de la plus grande.
+    """
+    if not connection.features.can_return_rows_from_bulk_insert:
+        next_pk = (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+        for offset, obj in enumerate(objects):
+            obj.pk = next_pk + offset
+    return model.objects.bulk_create(objects, batch_size=batch_size)
+
+
+@contextmanager
+def keep_timestamps(*models):
+    """Désactive auto_now / auto_now_add pour conserver les dates générées (bulk_create)"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Peuple la base avec une charge synthétique réaliste (interprètes, clients, plusieurs "
+        "années de missions issues de devis, paiements, notifications et journal d'audit) pour les "
+        "benchmarks. "
+        "Chaque exécution ajoute de nouveaux comptes préfixés 'workload-'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interpreters', type=int, default=50, help="Interprètes à créer")
+        parser.add_argument('--clients', type=int, default=20, help="Clients à créer")
+        parser.add_argument('--years', type=float, default=3, help="Années d'historique")
+        parser.add_argument('--future-days', type=int, default=60, help="Jours de missions à venir")
+        parser.add_argument('--assignments-per-week', type=float, default=4,
+                            help="Missions par interprète et par semaine (moyenne)")
+        parser.add_argument('--status-weights', default=DEFAULT_STATUS_WEIGHTS,
+                            help="Répartition des statuts des missions passées")
+        parser.add_argument('--future-status-weights', default=DEFAULT_FUTURE_WEIGHTS,
+                            help="Répartition des statuts des missions à venir")
+        parser.add_argument('--notifications-per-assignment', type=float, default=1.5,
+                            help="Notifications par mission (moyenne)")
+        parser.add_argument('--unread-ratio', type=float, default=0.1,
+                            help="Part des notifications non lues")
+        parser.add_argument('--payment-ratio', type=float, default=0.9,
+                            help="Part des missions terminées déjà payées")
+        parser.add_argument('--open-quote-requests', type=int, default=3,
+                            help="Demandes de devis en attente par client (sans mission)")
+        parser.add_argument('--batch-size', type=int, default=2000, help="Taille des bulk_create")
+        parser.add_argument('--seed', type=int, help="Graine aléatoire (génération reproductible)")
+
+    def handle(self, *args, **options):
+        if options['interpreters'] < 0 or options['clients'] < 0 or options['years'] <= 0:
+            raise CommandError("--interpreters / --clients doivent être positifs et --years > 0")
+        self.random = random.Random(options['seed'])
+        self.batch_size = max(options['batch_size'], 1)
+        self.now = timezone.now()
+        self.past_statuses = parse_weights(options['status_weights'], '--status-weights')
+        self.future_statuses = parse_weights(options['future_status_weights'], '--future-status-weights')
+        self.zips = [f'{zip_code:05d}' for zip_code in load_zip_centroids()[0]]
+
+        with transaction.atomic():
+            self.admin = self.get_admin()
+            self.languages = self.get_languages()
+            self.service_types = self.get_service_types()
+            interpreters = self.create_interpreters(options['interpreters'])
+            clients = self.create_clients(options['clients'])
+            with keep_timestamps(QuoteRequest, Quote, Assignment, Payment, InterpreterPayment,
+                                 FinancialTransaction, Notification, AuditLog):
+                assignments = self.create_assignments(interpreters, clients, options)
+                quote_requests = self.create_open_quote_requests(clients, options['open_quote_requests'])
+                payments = self.create_payments(assignments, options['payment_ratio'])
+                notifications = self.create_notifications(assignments, options)
+                audit_logs = self.create_audit_logs(assignments)
+            payrolls = self.create_payrolls(interpreters)
+
+        # Tables dérivées (alimentées par les receivers, contournés par bulk_create)
+        if interpreters:
+            start_day = local_day(self.now - timedelta(days=365 * options['years']))
+            end_day = local_day(self.now + timedelta(days=options['future_days']))
+            rebuild_daily_rollups(start_day, end_day, [interpreter.pk for interpreter in interpreters])
+        reconcile_unread_counters()
+
+        quotes = sum(1 for assignment in assignments if assignment.quote_id)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(interpreters)} interprètes, {len(clients)} clients, {len(assignments)} missions, "
+            f"{quotes} devis, {quote_requests} demandes de devis en attente, "
+            f"{payments} paiements, {notifications} notifications, {audit_logs} entrées d'audit, "
+            f"{payrolls} relevés de paie"
+        ))
+
+    def next_index(self, role):
+        return User.objects.filter(username__startswith=f'{USERNAME_PREFIX}{role}-').count() + 1
+
+    def make_users(self, role, count):
+        first = self.next_index(role.lower())
+        password = make_password(None)
+        users = [
+            User(
+                username=f'{USERNAME_PREFIX}{role.lower()}-{index}',
+                email=f'{USERNAME_PREFIX}{role.lower()}-{index}@example.invalid',
+                first_name=role.title(), last_name=str(index), role=role, password=password,
+                registration_complete=True
+            )
+            for index in range(first, first + count)
+        ]
+        return bulk_insert(User, users, self.batch_size)
+
+    def get_admin(self):
+        admin = User.objects.filter(username=f'{USERNAME_PREFIX}admin').first()
+        if admin is None:
+            admin = User.objects.create_superuser(
+                username=f'{USERNAME_PREFIX}admin', email=f'{USERNAME_PREFIX}admin@example.invalid',
+                password=None, role='ADMIN'
+            )
+        return admin
+
+    def get_languages(self):
+        languages = []
+        for name, code in LANGUAGES:
+            language = Language.objects.filter(code=code).first()
+            if language is None:
+                language = Language.objects.create(name=name, code=code)
+            languages.append(language)
+        return languages
+
+    def get_service_types(self):
+        return [
+            ServiceType.objects.get_or_create(
+                name=name, defaults={'description': name, 'base_rate': rate, 'cancellation_policy': '24h'}
+            )[0]
+            for name, rate in SERVICE_TYPES
+        ]
+
+    def create_interpreters(self, count):
+        users = self.make_users('INTERPRETER', count)
+        interpreters = []
+        for user in users:
+            zip_code = self.random.choice(self.zips)
+            state, city = zip_location(zip_code)
+            coordinates = zip_to_coordinates(zip_code) or (None, None)
+            interpreters.append(Interpreter(
+                user=user, address=f'{self.random.randint(1, 999)} Main St', city=city, state=state,
+                zip_code=zip_code, latitude=coordinates[0], longitude=coordinates[1],
+                radius_of_service=self.random.choice([25, 50, 75, 100]),
+                hourly_rate=Decimal(self.random.randrange(35, 85)), active=True
+            ))
+        interpreters = bulk_insert(Interpreter, interpreters, self.batch_size)
+
+        # Anglais + 1 à 3 autres langues (la première d'entre elles est la langue principale)
+        interpreter_languages = []
+        for interpreter in interpreters:
+            others = self.random.sample(self.languages[1:], self.random.randint(1, 3))
+            interpreter.target_language_ids = [language.pk for language in others]
+            for position, language in enumerate([self.languages[0]] + others):
+                interpreter_languages.append(InterpreterLanguage(
+                    interpreter=interpreter, language=language, is_primary=position == 1,
+                    proficiency=self.random.choice(InterpreterLanguage.Proficiency.values),
+                    certified=self.random.random() < 0.3
+                ))
+        InterpreterLanguage.objects.bulk_create(interpreter_languages, batch_size=self.batch_size)
+        return interpreters
+
+    def create_clients(self, count):
+        users = self.make_users('CLIENT', count)
+        clients = []
+        for user in users:
+            zip_code = self.random.choice(self.zips)
+            state, city = zip_location(zip_code)
+            clients.append(Client(
+                user=user, company_name=f'Workload Company {user.last_name}',
+                address=f'{self.random.randint(1, 999)} Market St', city=city, state=state,
+                zip_code=zip_code
+            ))
+        return bulk_insert(Client, clients, self.batch_size)
+
+    def create_assignments(self, interpreters, clients, options):
+        history_days = int(365 * options['years'])
+        total_days = history_days + options['future_days']
+        per_interpreter = options['assignments_per_week'] * total_days / 7
+        assignments, quoted = [], []
+        for interpreter in interpreters:
+            count = max(int(self.random.gauss(per_interpreter, per_interpreter * 0.2)), 0)
+            for _ in range(count):
+                start = self.now + timedelta(
+                    days=self.random.randint(-history_days, options['future_days']),
+                    hours=self.random.randint(-6, 6), minutes=self.random.choice([0, 15, 30, 45])
+                )
+                end = start + timedelta(minutes=self.random.choice([60, 90, 120, 180, 240]))
+                statuses, weights = self.past_statuses if start < self.now else self.future_statuses
+                status = self.random.choices(statuses, weights)[0]
+                client = self.random.choice(clients) if clients else None
+                target = self.random.choice(interpreter.target_language_ids)
+                service_type = self.random.choice(self.service_types)
+                rate = interpreter.hourly_rate
+                duration = Assignment.compute_duration_hours(start, end)
+                created_at = start - timedelta(days=self.random.randint(1, 30))
+                assignment = Assignment(
+                    interpreter=interpreter, service_type=service_type,
+                    source_language=self.languages[0], target_language_id=target,
+                    client_name=client.company_name if client else None,
+                    client_email=client.user.email if client else None,
+                    start_time=start, end_time=end, location='Workload site', city=interpreter.city,
+                    state=interpreter.state, zip_code=interpreter.zip_code, status=status,
+                    interpreter_rate=rate, duration_hours=duration,
+                    total_interpreter_payment=rate * max(duration, Decimal(2)),
+                    completed_at=end if status == Assignment.Status.COMPLETED else None,
+                    created_at=created_at, updated_at=min(end, self.now)
+                )
+                assignments.append(assignment)
+                if client:
+                    quoted.append((assignment, client))
+        self.create_quotes(quoted)
+        return bulk_insert(Assignment, assignments, self.batch_size)
+
+    def create_quotes(self, quoted):
+        """Demande de devis et devis accepté à l'origine de chaque mission d'un client"""
+        quote_requests = bulk_insert(QuoteRequest, [
+            QuoteRequest(
+                client=client, service_type=assignment.service_type,
+                requested_date=assignment.start_time,
+                duration=int((assignment.end_time - assignment.start_time).total_seconds() // 60),
+                location=assignment.location, city=assignment.city, state=assignment.state,
+                zip_code=assignment.zip_code, source_language=assignment.source_language,
+                target_language_id=assignment.target_language_id, status=QuoteRequest.Status.ACCEPTED,
+                created_at=assignment.created_at - timedelta(days=2), updated_at=assignment.created_at
+            )
+            for assignment, client in quoted
+        ], self.batch_size)
+        quotes = bulk_insert(Quote, [
+            Quote(
+                quote_request=quote_request, reference_number=f'WL-{uuid.uuid4().hex[:16]}',
+                amount=assignment.service_type.base_rate * max(assignment.duration_hours, Decimal(2)),
+                valid_until=(assignment.created_at + timedelta(days=30)).date(), terms='Net 30',
+                status=Quote.Status.ACCEPTED, created_by=self.admin,
+                created_at=assignment.created_at - timedelta(days=1), updated_at=assignment.created_at
+            )
+            for (assignment, _), quote_request in zip(quoted, quote_requests)
+        ], self.batch_size)
+        for (assignment, _), quote in zip(quoted, quotes):
+            assignment.quote = quote
+
+    def create_open_quote_requests(self, clients, count):
+        """Demandes récentes encore sans devis, ou avec un devis envoyé"""
+        quote_requests = []
+        for client in clients:
+            for _ in range(count):
+                created_at = self.now - timedelta(days=self.random.randint(0, 14))
+                quote_requests.append(QuoteRequest(
+                    client=client, service_type=self.random.choice(self.service_types),
+                    requested_date=self.now + timedelta(days=self.random.randint(7, 60)),
+                    duration=self.random.choice([60, 90, 120, 180]), location='Workload site',
+                    city=client.city, state=client.state, zip_code=client.zip_code,
+                    source_language=self.languages[0], target_language=self.random.choice(self.languages[1:]),
+                    status=self.random.choice([QuoteRequest.Status.PENDING, QuoteRequest.Status.QUOTED]),
+                    created_at=created_at, updated_at=created_at
+                ))
+        quote_requests = bulk_insert(QuoteRequest, quote_requests, self.batch_size)
+        Quote.objects.bulk_create([
+            Quote(
+                quote_request=quote_request, reference_number=f'WL-{uuid.uuid4().hex[:16]}',
+                amount=quote_request.service_type.base_rate * Decimal(max(quote_request.duration, 120)) / 60,
+                valid_until=(quote_request.created_at + timedelta(days=30)).date(), terms='Net 30',
+                status=Quote.Status.SENT, created_by=self.admin,
+                created_at=quote_request.created_at, updated_at=quote_request.created_at
+            )
+            for quote_request in quote_requests if quote_request.status == QuoteRequest.Status.QUOTED
+        ], batch_size=self.batch_size)
+        return len(quote_requests)
+
+    def create_payments(self, assignments, payment_ratio):
+        completed = [
+            assignment for assignment in assignments
+            if assignment.status == Assignment.Status.COMPLETED and self.random.random() < payment_ratio
+        ]
+        transactions = bulk_insert(FinancialTransaction, [
+            FinancialTransaction(
+                transaction_id=uuid.uuid4(), type=FinancialTransaction.TransactionType.EXPENSE,
+                amount=assignment.total_interpreter_payment, description=f'Assignment {assignment.pk}',
+                created_by=self.admin, date=assignment.completed_at + timedelta(days=7)
+            )
+            for assignment in completed
+        ], self.batch_size)
+
+        payments, interpreter_payments = [], []
+        for assignment, financial_transaction in zip(completed, transactions):
+            paid_at = assignment.completed_at + timedelta(days=self.random.randint(3, 21))
+            status = Payment.Status.COMPLETED if paid_at < self.now else Payment.Status.PENDING
+            payments.append(Payment(
+                assignment=assignment, payment_type=Payment.PaymentType.INTERPRETER_PAYMENT,
+                amount=assignment.total_interpreter_payment, payment_method='ACH',
+                transaction_id=f'{USERNAME_PREFIX}{financial_transaction.transaction_id}',
+                status=status, payment_date=paid_at, last_updated=paid_at
+            ))
+            interpreter_payments.append(InterpreterPayment(
+                transaction=financial_transaction, interpreter_id=assignment.interpreter_id,
+                assignment=assignment, amount=assignment.total_interpreter_payment,
+                payment_method=InterpreterPayment.PaymentMethod.ACH,
+                status=(InterpreterPayment.Status.COMPLETED if status == Payment.Status.COMPLETED
+                        else InterpreterPayment.Status.PENDING),
+                scheduled_date=paid_at, processed_date=paid_at if paid_at < self.now else None,
+                created_at=assignment.completed_at, updated_at=paid_at,
+                reference_number=f'WL-{financial_transaction.transaction_id.hex[:20]}'
+            ))
+        Payment.objects.bulk_create(payments, batch_size=self.batch_size)
+        InterpreterPayment.objects.bulk_create(interpreter_payments, batch_size=self.batch_size)
+        Assignment.objects.filter(pk__in=[assignment.pk for assignment in completed]).update(is_paid=True)
+        return len(payments)
+
+    def create_notifications(self, assignments, options):
+        users = dict(Interpreter.objects.filter(
+            pk__in={assignment.interpreter_id for assignment in assignments}
+        ).values_list('pk', 'user_id'))
+        types = [
+            (Notification.Type.ASSIGNMENT_OFFER, 'New assignment offer'),
+            (Notification.Type.ASSIGNMENT_REMINDER, 'Assignment reminder'),
+            (Notification.Type.PAYMENT_RECEIVED, 'Payment received'),
+            (Notification.Type.SYSTEM, 'System update'),
+        ]
+        per_assignment = options['notifications_per_assignment']
+        notifications = []
+        for assignment in assignments:
+            count = int(per_assignment) + (self.random.random() < per_assignment % 1)
+            for _ in range(count):
+                notification_type, title = self.random.choice(types)
+                created_at = min(assignment.created_at + timedelta(hours=self.random.randint(0, 72)), self.now)
+                notifications.append(Notification(
+                    recipient_id=users[assignment.interpreter_id], type=notification_type, title=title,
+                    content=f'{title} for assignment #{assignment.pk}',
+                    read=self.random.random() >= options['unread_ratio'],
+                    link=f'/interpreter/assignments/{assignment.pk}/details/', created_at=created_at
+                ))
+        Notification.objects.bulk_create(notifications, batch_size=self.batch_size)
+        return len(notifications)
+
+    def create_audit_logs(self, assignments):
+        logs = []
+        for assignment in assignments:
+            logs.append(AuditLog(
+                user=self.admin, action='CREATE', model_name='Assignment', object_id=str(assignment.pk),
+                changes={'status': assignment.status}, timestamp=assignment.created_at
+            ))
+            if assignment.status != Assignment.Status.PENDING:
+                logs.append(AuditLog(
+                    user=self.admin, action='STATUS_CHANGE', model_name='Assignment',
+                    object_id=str(assignment.pk), changes={'status': assignment.status},
+                    timestamp=min(assignment.updated_at, self.now)
+                ))
+        AuditLog.objects.bulk_create(logs, batch_size=self.batch_size)
+        return len(logs)
+
+    def create_payrolls(self, interpreters):
+        """Un relevé de paie par interprète : ses missions terminées du mois écoulé"""
+        since = self.now - timedelta(days=30)
+        payrolls = bulk_insert(PayrollDocument, [
+            PayrollDocument(
+                interpreter_name=interpreter.user.get_full_name(), interpreter_email=interpreter.user.email,
+                document_number=f'WL-{uuid.uuid4().hex[:16]}', document_date=self.now.date()
+            )
+            for interpreter in interpreters
+        ], self.batch_size)
+        payroll_by_interpreter = {interpreter.pk: payroll for interpreter, payroll in zip(interpreters, payrolls)}
+        services = [
+            Service(
+                payroll=payroll_by_interpreter[assignment.interpreter_id], date=assignment.start_time.date(),
+                client=assignment.client_name or '', source_language=assignment.source_language.name,
+                target_language=assignment.target_language.name, duration=assignment.duration_hours,
+                rate=assignment.interpreter_rate
+            )
+            for assignment in Assignment.objects.filter(
+                interpreter__in=interpreters, status=Assignment.Status.COMPLETED, start_time__gte=since
+            ).select_related('source_language', 'target_language')
+        ]
+        Service.objects.bulk_create(services, batch_size=self.batch_size)
+        return len(payrolls)
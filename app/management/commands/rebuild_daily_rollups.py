@@ -0,0 +1,55 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from app.models import Assignment
+from app.services.rollups import local_day, rebuild_daily_rollups
+
+
+class Command(BaseCommand):
+    help = "Reconstruit la table InterpreterDailyRollup pour une période (jours locaux inclus)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help="Premier jour (YYYY-MM-DD), par défaut la première mission")
+        parser.add_argument('--end', help="Dernier jour (YYYY-MM-DD), par défaut la dernière mission")
+        parser.add_argument('--interpreter', type=int, action='append', dest='interpreters',
+                            help="ID d'interprète (répétable), par défaut tous")
+        parser.add_argument('--chunk-days', type=int, default=31,
+                            help="Nombre de jours reconstruits par transaction")
+
+    def _parse_day(self, value, option):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            raise CommandError(f"{option} doit être au format YYYY-MM-DD")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        bounds = Assignment.objects.aggregate(first=Min('start_time'), last=Max('start_time'))
+
+        if options['start']:
+            start_day = self._parse_day(options['start'], '--start')
+        else:
+            start_day = local_day(bounds['first']) if bounds['first'] else today
+
+        if options['end']:
+            end_day = self._parse_day(options['end'], '--end')
+        else:
+            end_day = max(local_day(bounds['last']), today) if bounds['last'] else today
+
+        if start_day > end_day:
+            raise CommandError("--start doit précéder --end")
+
+        chunk = datetime.timedelta(days=max(options['chunk_days'], 1))
+        total = 0
+        current = start_day
+        while current <= end_day:
+            chunk_end = min(current + chunk - datetime.timedelta(days=1), end_day)
+            total += rebuild_daily_rollups(current, chunk_end, options['interpreters'])
+            current = chunk_end + datetime.timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{total} lignes reconstruites du {start_day} au {end_day}"
+        ))
@@ -0,0 +1,133 @@
+import json
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections
+from django.utils.functional import SimpleLazyObject, empty
+
+from app.models import User
+from app.utils.request_timing import end_request, start_request
+
+logger = logging.getLogger('app.request_timing')
+
+
+class ServerTimingMiddleware:
+    """
+    Mesure chaque requête : requêtes SQL et temps base, rendu des templates,
+    hits / misses du cache, appels sortants (SMTP, Supabase). Les mesures sont
+    renvoyées dans l'en-tête Server-Timing (onglet Timing du navigateur) et
+    journalisées sur une ligne JSON par requête, par nom d'URL.
+
+    À placer en tête de MIDDLEWARE pour inclure les autres middlewares.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics, token = start_request()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            end_request(token)
+
+        total_ms = metrics.total_ms
+        if getattr(settings, 'SERVER_TIMING_HEADER', True):
+            response['Server-Timing'] = self.get_header(metrics, total_ms)
+
+        match = getattr(request, 'resolver_match', None)
+        logger.info('request_timing %s', json.dumps({
+            'url_name': match.view_name if match else None,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'user_id': self.get_user_id(request),
+            'total_ms': round(total_ms, 1),
+            'db_queries': metrics.db_queries,
+            'db_ms': round(metrics.db_ms, 1),
+            'template_ms': round(metrics.template_ms, 1),
+            'cache_hits': metrics.cache_hits,
+            'cache_misses': metrics.cache_misses,
+            'outbound_ms': {name: round(ms, 1) for name, ms in metrics.outbound_ms.items()},
+        }))
+        return response
+
+    @staticmethod
+    def get_user_id(request):
+        # Uniquement si la vue a déjà chargé l'utilisateur : pas de requête en plus.
+        # Les vues async passent par request.auser(), mis en cache dans _acached_user
+        user = getattr(request, '_acached_user', None)
+        if user is None:
+            user = getattr(request, 'user', None)
+            if user is None or getattr(user, '_wrapped', None) is empty:
+                return None
+        return user.pk
+
+    @staticmethod
+    def get_header(metrics, total_ms):
+        entries = [
+            f'db;dur={metrics.db_ms:.1f};desc="{metrics.db_queries} queries"',
+            f'tpl;dur={metrics.template_ms:.1f};desc="templates"',
+            f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+        ]
+        entries += [f'{name};dur={ms:.1f}' for name, ms in sorted(metrics.outbound_ms.items())]
+        entries.append(f'total;dur={total_ms:.1f}')
+        return ', '.join(entries)
+
+
+class Actor:
+    """
+    Utilisateur courant, son rôle et le profil correspondant (client ou
+    interprète, None sinon). Avec ProfileModelBackend, le profil est chargé
+    dans la même requête que l'utilisateur.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.role = getattr(user, 'role', None) if user.is_authenticated else None
+        self.client = self._get_profile('client_profile') if self.role == User.Roles.CLIENT else None
+        self.interpreter = self._get_profile('interpreter_profile') if self.role == User.Roles.INTERPRETER else None
+
+    def _get_profile(self, name):
+        try:
+            return getattr(self.user, name)
+        except ObjectDoesNotExist:
+            return None
+
+    @property
+    def is_authenticated(self):
+        return self.user.is_authenticated
+
+    @property
+    def is_client(self):
+        return self.role == User.Roles.CLIENT
+
+    @property
+    def is_interpreter(self):
+        return self.role == User.Roles.INTERPRETER
+
+    @property
+    def is_admin(self):
+        return self.role == User.Roles.ADMIN
+
+    def __repr__(self):
+        return f'<Actor {self.role or "anonymous"} user={self.user.pk}>'
+
+
+class ActorMiddleware:
+    """
+    Ajoute request.actor (Actor), évalué à la première utilisation.
+    À placer après AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.actor = SimpleLazyObject(lambda: Actor(request.user))
+        return self.get_response(request)
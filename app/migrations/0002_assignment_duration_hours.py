@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:24
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def backfill_duration_hours(apps, schema_editor):
+    Assignment = apps.get_model('app', 'Assignment')
+    batch = []
+    queryset = Assignment.objects.only('id', 'start_time', 'end_time').order_by('pk')
+    for assignment in queryset.iterator(chunk_size=2000):
+        if not assignment.start_time or not assignment.end_time:
+            continue
+        seconds = Decimal(str((assignment.end_time - assignment.start_time).total_seconds()))
+        assignment.duration_hours = (seconds / Decimal('3600')).quantize(Decimal('0.01'))
+        batch.append(assignment)
+        if len(batch) >= 2000:
+            Assignment.objects.bulk_update(batch, ['duration_hours'])
+            batch = []
+    if batch:
+        Assignment.objects.bulk_update(batch, ['duration_hours'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignment',
+            name='duration_hours',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text="Durée réelle en heures (end_time - start_time), calculée à l'enregistrement", max_digits=7, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['interpreter', 'status', 'start_time', 'duration_hours'], name='assignment_hours_idx'),
+        ),
+        migrations.RunPython(backfill_duration_hours, migrations.RunPython.noop),
+    ]
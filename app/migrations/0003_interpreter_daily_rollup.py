@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:27
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_assignment_duration_hours'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterpreterDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('assignments_count', models.PositiveIntegerField(default=0)),
+                ('pending_count', models.PositiveIntegerField(default=0)),
+                ('confirmed_count', models.PositiveIntegerField(default=0)),
+                ('in_progress_count', models.PositiveIntegerField(default=0)),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('cancelled_count', models.PositiveIntegerField(default=0)),
+                ('no_show_count', models.PositiveIntegerField(default=0)),
+                ('completed_hours', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=9)),
+                ('earnings', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Somme des total_interpreter_payment des missions complétées', max_digits=12)),
+                ('payments_count', models.PositiveIntegerField(default=0)),
+                ('payments_completed_count', models.PositiveIntegerField(default=0)),
+                ('payments_completed', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('payments_pending', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('interpreter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='app.interpreter')),
+            ],
+            options={
+                'ordering': ['interpreter', 'day'],
+                'constraints': [models.UniqueConstraint(fields=('interpreter', 'day'), name='unique_interpreter_daily_rollup')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_interpreter_daily_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='dashboard_version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Version du snapshot du dashboard en cache, incrémentée à chaque changement'),
+        ),
+    ]
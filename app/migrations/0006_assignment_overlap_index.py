@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_assignment_interpreter_start_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['interpreter', 'status', 'end_time', 'start_time'], name='assignment_overlap_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from app.utils.availability import parse_availability
+
+
+def populate_availability_slots(apps, schema_editor):
+    Interpreter = apps.get_model('app', 'Interpreter')
+    InterpreterAvailabilitySlot = apps.get_model('app', 'InterpreterAvailabilitySlot')
+    slots = []
+    for interpreter_id, availability in Interpreter.objects.exclude(
+        availability__isnull=True
+    ).values_list('id', 'availability').iterator():
+        slots.extend(
+            InterpreterAvailabilitySlot(
+                interpreter_id=interpreter_id,
+                weekday=weekday,
+                start_minute=start,
+                end_minute=end
+            )
+            for weekday, start, end in parse_availability(availability)
+        )
+    InterpreterAvailabilitySlot.objects.bulk_create(slots, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_assignment_overlap_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterpreterAvailabilityException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('start_minute', models.PositiveSmallIntegerField(default=0, help_text='Minutes depuis minuit (0 = début de journée)')),
+                ('end_minute', models.PositiveSmallIntegerField(default=1440, help_text='Minutes depuis minuit (1440 = fin de journée)')),
+                ('is_available', models.BooleanField(default=False, help_text='Coché : disponibilité supplémentaire. Sinon : indisponible')),
+                ('reason', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('interpreter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_exceptions', to='app.interpreter')),
+            ],
+            options={
+                'ordering': ['date', 'start_minute'],
+                'indexes': [models.Index(fields=['date', 'interpreter', 'is_available'], name='availability_exc_lookup_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InterpreterAvailabilitySlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')])),
+                ('start_minute', models.PositiveSmallIntegerField(help_text='Minutes depuis minuit (0-1439)')),
+                ('end_minute', models.PositiveSmallIntegerField(help_text='Minutes depuis minuit (1-1440)')),
+                ('interpreter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_slots', to='app.interpreter')),
+            ],
+            options={
+                'ordering': ['interpreter', 'weekday', 'start_minute'],
+                'indexes': [models.Index(fields=['weekday', 'start_minute', 'end_minute', 'interpreter'], name='availability_slot_lookup_idx')],
+            },
+        ),
+        migrations.RunPython(populate_availability_slots, migrations.RunPython.noop),
+    ]
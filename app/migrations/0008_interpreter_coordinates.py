@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:38
+
+from django.db import migrations, models
+
+from app.utils.geo import zip_to_coordinates
+
+
+def backfill_coordinates(apps, schema_editor):
+    Interpreter = apps.get_model('app', 'Interpreter')
+    batch = []
+    for interpreter in Interpreter.objects.only('id', 'zip_code').order_by('pk').iterator(chunk_size=2000):
+        coordinates = zip_to_coordinates(interpreter.zip_code)
+        if coordinates is None:
+            continue
+        interpreter.latitude, interpreter.longitude = coordinates
+        batch.append(interpreter)
+    Interpreter.objects.bulk_update(batch, ['latitude', 'longitude'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_interpreter_availability'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interpreter',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='interpreter',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='interpreter',
+            index=models.Index(fields=['latitude', 'longitude'], name='interpreter_geo_idx'),
+        ),
+        migrations.RunPython(backfill_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_notification_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quoterequest',
+            index=models.Index(fields=['client', 'created_at', 'id'], name='quote_request_client_idx'),
+        ),
+    ]
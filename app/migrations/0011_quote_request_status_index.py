@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_quote_request_client_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quoterequest',
+            index=models.Index(fields=['client', 'status', 'created_at'], name='quote_request_status_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_quote_request_status_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['model_name', 'object_id', 'timestamp'], name='auditlog_object_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interpreterpayment',
+            index=models.Index(fields=['assignment', 'created_at'], name='ip_assignment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['assignment', 'payment_type', 'status', 'payment_date'], name='payment_assignment_type_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='client',
+            name='dashboard_version',
+        ),
+    ]
@@ -4,7 +4,7 @@ from django.utils import timezone
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.urls import path, reverse
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.utils.html import strip_tags
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
@@ -21,6 +21,9 @@ import uuid
 import logging
 from datetime import datetime, timedelta
 
+from app.services.conflicts import get_conflicts
+from app.services.matching import find_matching_interpreters
+
 logger = logging.getLogger(__name__)
 
 BOSTON_TZ = pytz.timezone('America/New_York')  # Fuseau horaire de Boston
@@ -41,9 +44,46 @@ class AssignmentAdminMixin:
                 self.admin_site.admin_view(self.decline_assignment_view),
                 name='assignment-decline',
             ),
+            path(
+                '<path:object_id>/matching-interpreters/',
+                self.admin_site.admin_view(self.matching_interpreters_view),
+                name='assignment-matching-interpreters',
+            ),
         ]
         return custom_urls + urls
 
+    def matching_interpreters_view(self, request, object_id):
+        """Interprètes disponibles et classés pour une mission (JSON)."""
+        assignment = self.get_object(request, object_id)
+        if assignment is None:
+            return JsonResponse({'error': 'Assignment not found'}, status=404)
+
+        matches = find_matching_interpreters(
+            assignment.source_language_id,
+            assignment.target_language_id,
+            assignment.service_type,
+            assignment.start_time,
+            assignment.end_time,
+            zip_code=assignment.zip_code,
+            exclude_assignment_ids=[assignment.pk]
+        )
+        return JsonResponse({
+            'assignment': assignment.pk,
+            'interpreters': [
+                {
+                    'id': match['interpreter'].pk,
+                    'name': match['interpreter'].user.get_full_name(),
+                    'email': match['interpreter'].user.email,
+                    'zip_code': match['interpreter'].zip_code,
+                    'hourly_rate': str(match['interpreter'].hourly_rate or ''),
+                    'certified': match['certified'],
+                    'distance_miles': match['distance_miles'],
+                    'availability_confirmed': match['availability_confirmed'],
+                }
+                for match in matches
+            ]
+        })
+
     def save_model(self, request, obj, form, change):
         """
         Override save_model pour gérer les changements de statut d'assignment, 
@@ -269,8 +309,13 @@ class AssignmentAdminMixin:
             return None
 
     def send_assignment_email(self, request, assignment, email_type='new'):
+        """Envoie un email lié à l'Assignment (liens vers le site de la requête)"""
+        return self.deliver_assignment_email(f"{request.scheme}://{request.get_host()}", assignment, email_type)
+
+    def deliver_assignment_email(self, site_url, assignment, email_type='new', fail_silently=True):
         """
-        Envoie un email lié à l'Assignment.
+        Envoie un email lié à l'Assignment, sans requête (utilisable depuis une tâche).
+        fail_silently=False : l'erreur d'envoi est propagée (tâche Celery relancée).
         
         - Utilise un seul email multi-part (HTML + ICS si nécessaire).
         - Génère un Message-ID unique pour chaque email.
@@ -282,7 +327,7 @@ class AssignmentAdminMixin:
 
         try:
             # 1) Contexte et config du template
-            context = self.get_email_context(request, assignment, email_type)
+            context = self.get_email_context(site_url, assignment, email_type)
             template_config = self.get_email_template_config(email_type)
 
             # 2) Rendu du HTML
@@ -340,11 +385,13 @@ class AssignmentAdminMixin:
 
         except Exception as e:
             logger.error(f"Error sending {email_type} email: {str(e)}", exc_info=True)
+            if not fail_silently:
+                raise
             return False
         
-    def get_email_context(self, request, assignment, email_type):
+    def get_email_context(self, site_url, assignment, email_type):
         """
-        Construit le contexte pour les templates d'email.
+        Construit le contexte pour les templates d'email (site_url : "https://hôte").
         L'heure est déjà en fuseau Boston, pas besoin de conversion.
         """
         # Simplification des références client
@@ -364,7 +411,7 @@ class AssignmentAdminMixin:
             'rate': assignment.interpreter_rate,
             'source_language': assignment.source_language.name,
             'target_language': assignment.target_language.name,
-            'site_url': f"{request.scheme}://{request.get_host()}"
+            'site_url': site_url
         }
 
         if email_type == 'new':
@@ -372,12 +419,8 @@ class AssignmentAdminMixin:
             decline_token = self.generate_assignment_token(assignment.id, 'decline')
             
             context.update({
-                'accept_url': request.build_absolute_uri(
-                    reverse('dbdint:assignment-accept', args=[accept_token])
-                ),
-                'decline_url': request.build_absolute_uri(
-                    reverse('dbdint:assignment-decline', args=[decline_token])
-                )
+                'accept_url': site_url + reverse('dbdint:assignment-accept', args=[accept_token]),
+                'decline_url': site_url + reverse('dbdint:assignment-decline', args=[decline_token])
             })
 
         return context
@@ -505,6 +548,11 @@ class AssignmentAdminMixin:
             if assignment.status != self.model.Status.PENDING:
                 return HttpResponse("Assignment is no longer available", status=400)
 
+            conflicts = get_conflicts(assignment)
+            if conflicts:
+                ids = ', '.join(f"#{conflict.id}" for conflict in conflicts)
+                return HttpResponse(f"Schedule conflict with assignment(s) {ids}", status=409)
+
             # Update assignment status
             assignment.status = self.model.Status.CONFIRMED
             assignment.save()
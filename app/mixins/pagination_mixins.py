@@ -0,0 +1,62 @@
+from django.http import Http404, JsonResponse
+
+from app.utils.pagination import InvalidCursor, paginate_by_cursor
+
+
+class KeysetPaginationMixin:
+    """
+    Pagination par curseur pour les ListView : ordre stable sur
+    (keyset_field, id), curseurs opaques (?cursor= / ?before=), coût constant
+    quel que soit le rang de la page (ni OFFSET ni COUNT).
+
+    Avec ?format=json, la vue répond en JSON (serialize_object par élément).
+    À placer avant ListView dans les bases de la vue.
+    """
+    paginate_by = 20
+    keyset_field = 'created_at'
+    keyset_descending = True
+    cursor_param = 'cursor'
+    before_param = 'before'
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = paginate_by_cursor(
+                queryset,
+                cursor=self.request.GET.get(self.cursor_param),
+                before=self.request.GET.get(self.before_param),
+                page_size=page_size,
+                field=self.keyset_field,
+                descending=self.keyset_descending
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        page['next_url'] = self._page_url(self.cursor_param, page['next_cursor'])
+        page['previous_url'] = self._page_url(self.before_param, page['previous_cursor'])
+        return None, page, page['items'], page['has_next'] or page['has_previous']
+
+    def _page_url(self, param, cursor):
+        """Query string de la page voisine, filtres courants conservés"""
+        if not cursor:
+            return None
+        params = self.request.GET.copy()
+        for key in (self.cursor_param, self.before_param, 'page'):
+            params.pop(key, None)
+        params[param] = cursor
+        return f'?{params.urlencode()}'
+
+    def serialize_object(self, obj):
+        return {'id': obj.pk}
+
+    def get(self, request, *args, **kwargs):
+        # Réponse JSON sans le reste du contexte de la page (statistiques, formulaires...)
+        if request.GET.get('format') == 'json':
+            self.object_list = self.get_queryset()
+            _, page, items, _ = self.paginate_queryset(self.object_list, self.get_paginate_by(self.object_list))
+            return JsonResponse({
+                'results': [self.serialize_object(obj) for obj in items],
+                'next_cursor': page['next_cursor'],
+                'previous_cursor': page['previous_cursor'],
+                'has_next': page['has_next'],
+                'has_previous': page['has_previous'],
+            })
+        return super().get(request, *args, **kwargs)
@@ -0,0 +1,15 @@
+from django.contrib.auth.mixins import UserPassesTestMixin
+
+
+class ClientRequiredMixin(UserPassesTestMixin):
+    """Réservé aux clients (rôle lu sur request.actor, sans requête)"""
+
+    def test_func(self):
+        return self.request.actor.is_client
+
+
+class InterpreterRequiredMixin(UserPassesTestMixin):
+    """Réservé aux interprètes (rôle lu sur request.actor, sans requête)"""
+
+    def test_func(self):
+        return self.request.actor.is_interpreter
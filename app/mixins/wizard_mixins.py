@@ -0,0 +1,73 @@
+import secrets
+
+from django.conf import settings
+from django.core import signing
+
+from app.cache import CacheNamespace
+
+
+WIZARD_MAX_AGE = 60 * 60
+
+wizard_states = CacheNamespace('wizard', WIZARD_MAX_AGE)
+
+
+class CachedWizardMixin:
+    """
+    État d'un formulaire en plusieurs étapes ({étape: données}) conservé dans
+    le cache partagé pour une durée courte, sous un jeton aléatoire. Le
+    navigateur ne reçoit que ce jeton, signé : aucune donnée saisie (mot de
+    passe, email, téléphone) côté client, aucune écriture dans django_session.
+
+    À placer avant FormView dans les bases de la vue.
+    """
+    wizard_cookie_name = 'dbdint_wizard'
+    wizard_salt = 'app.wizard'
+    wizard_max_age = WIZARD_MAX_AGE
+
+    def get_wizard_token(self):
+        value = self.request.COOKIES.get(self.wizard_cookie_name)
+        if not value:
+            return None
+        try:
+            return signing.loads(value, salt=self.wizard_salt, max_age=self.wizard_max_age)
+        except signing.BadSignature:  # altéré ou expiré (SignatureExpired)
+            return None
+
+    def get_wizard_state(self):
+        if not hasattr(self, '_wizard_state'):
+            self._wizard_token = self.get_wizard_token()
+            state = wizard_states.get(self._wizard_token) if self._wizard_token else None
+            self._wizard_state = state if isinstance(state, dict) else {}
+        return self._wizard_state
+
+    def get_wizard_step(self, step):
+        return self.get_wizard_state().get(step)
+
+    def set_wizard_step(self, step, data):
+        self.get_wizard_state()[step] = data
+        self._wizard_changed = True
+
+    def clear_wizard_state(self):
+        self.get_wizard_state()
+        self._wizard_state = {}
+        self._wizard_changed = True
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        if getattr(self, '_wizard_changed', False):
+            if self._wizard_state:
+                token = self._wizard_token or secrets.token_urlsafe(32)
+                wizard_states.set(token, self._wizard_state, self.wizard_max_age)
+                response.set_cookie(
+                    self.wizard_cookie_name,
+                    signing.dumps(token, salt=self.wizard_salt),
+                    max_age=self.wizard_max_age,
+                    secure=settings.SESSION_COOKIE_SECURE,
+                    httponly=True,
+                    samesite='Lax',
+                )
+            else:
+                if self._wizard_token:
+                    wizard_states.delete(self._wizard_token)
+                response.delete_cookie(self.wizard_cookie_name, samesite='Lax')
+        return response
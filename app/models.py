@@ -7,6 +7,24 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 from decimal import Decimal
+
+from app.utils.geo import zip_to_coordinates
+
+
+class LoadedValuesMixin:
+    """
+    Conserve les valeurs chargées depuis la base (instance._loaded_values) :
+    les receivers comparent l'ancien et le nouvel état sans relire la ligne
+    (agrégats journaliers, compteurs de non-lus, index de matching).
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+
 class Language(models.Model):
     name = models.CharField(max_length=100, unique=True)
     code = models.CharField(max_length=10, unique=True)  # ISO code
@@ -29,7 +47,7 @@ class Languagee(models.Model):
     def __str__(self):
         return self.name
 
-class User(AbstractUser):
+class User(LoadedValuesMixin, AbstractUser):
     class Roles(models.TextChoices):
         CLIENT = 'CLIENT', _('Client')
         INTERPRETER = 'INTERPRETER', _('Interprète')
@@ -109,7 +127,7 @@ class InterpreterLanguage(models.Model):
     class Meta:
         unique_together = ['interpreter', 'language']
 
-class Interpreter(models.Model):
+class Interpreter(LoadedValuesMixin, models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='interpreter_profile')
     languages = models.ManyToManyField(Language, through=InterpreterLanguage)
     profile_image = models.ImageField(upload_to='interpreter_profiles/', null=True, blank=True)
@@ -123,6 +141,9 @@ class Interpreter(models.Model):
     availability = models.JSONField(null=True, blank=True)  # Format: {"monday": ["9:00-17:00"]}
     radius_of_service = models.IntegerField(null=True, blank=True)
     hourly_rate = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    # Centroïde du code postal (app/data/zip_centroids.csv), mis à jour à l'enregistrement
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     
     
     
@@ -143,6 +164,77 @@ class Interpreter(models.Model):
     w9_on_file = models.BooleanField(default=False)
     active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            # Préfiltre géographique (bounding box) avant le calcul des distances
+            models.Index(fields=['latitude', 'longitude'], name='interpreter_geo_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        coordinates = zip_to_coordinates(self.zip_code)
+        self.latitude, self.longitude = coordinates if coordinates else (None, None)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'zip_code' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude'}
+        super().save(*args, **kwargs)
+
+class InterpreterAvailabilitySlot(models.Model):
+    """
+    Créneau hebdomadaire de disponibilité (heure de Boston), généré à
+    l'enregistrement depuis Interpreter.availability.
+    """
+    class Weekday(models.IntegerChoices):
+        MONDAY = 0, _('Monday')
+        TUESDAY = 1, _('Tuesday')
+        WEDNESDAY = 2, _('Wednesday')
+        THURSDAY = 3, _('Thursday')
+        FRIDAY = 4, _('Friday')
+        SATURDAY = 5, _('Saturday')
+        SUNDAY = 6, _('Sunday')
+
+    interpreter = models.ForeignKey(Interpreter, on_delete=models.CASCADE, related_name='availability_slots')
+    weekday = models.PositiveSmallIntegerField(choices=Weekday.choices)
+    start_minute = models.PositiveSmallIntegerField(help_text="Minutes depuis minuit (0-1439)")
+    end_minute = models.PositiveSmallIntegerField(help_text="Minutes depuis minuit (1-1440)")
+
+    class Meta:
+        ordering = ['interpreter', 'weekday', 'start_minute']
+        indexes = [
+            models.Index(fields=['weekday', 'start_minute', 'end_minute', 'interpreter'],
+                         name='availability_slot_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.interpreter} - {self.get_weekday_display()} {self.start_minute // 60:02d}:{self.start_minute % 60:02d}-{self.end_minute // 60:02d}:{self.end_minute % 60:02d}"
+
+class InterpreterAvailabilityException(models.Model):
+    """
+    Exception ponctuelle au planning hebdomadaire : indisponibilité (congé,
+    rendez-vous) ou disponibilité supplémentaire pour une date donnée.
+    """
+    interpreter = models.ForeignKey(Interpreter, on_delete=models.CASCADE, related_name='availability_exceptions')
+    date = models.DateField()
+    start_minute = models.PositiveSmallIntegerField(default=0, help_text="Minutes depuis minuit (0 = début de journée)")
+    end_minute = models.PositiveSmallIntegerField(default=1440, help_text="Minutes depuis minuit (1440 = fin de journée)")
+    is_available = models.BooleanField(default=False, help_text="Coché : disponibilité supplémentaire. Sinon : indisponible")
+    reason = models.CharField(max_length=255, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['date', 'start_minute']
+        indexes = [
+            models.Index(fields=['date', 'interpreter', 'is_available'], name='availability_exc_lookup_idx'),
+        ]
+
+    def clean(self):
+        if self.end_minute is not None and self.start_minute is not None:
+            if not 0 <= self.start_minute < self.end_minute <= 1440:
+                raise ValidationError({'end_minute': _('End must be after start, within the same day (0-1440).')})
+
+    def __str__(self):
+        kind = 'available' if self.is_available else 'unavailable'
+        return f"{self.interpreter} - {self.date} ({kind})"
+
 # models.py
 class ServiceType(models.Model):
     name = models.CharField(max_length=100)
@@ -180,6 +272,14 @@ class QuoteRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Liste des demandes du client : pages par curseur (created_at, id)
+            models.Index(fields=['client', 'created_at', 'id'], name='quote_request_client_idx'),
+            # Compteurs par statut (GROUP BY status) et filtre par statut de la liste
+            models.Index(fields=['client', 'status', 'created_at'], name='quote_request_status_idx'),
+        ]
+
 class Quote(models.Model):
     class Status(models.TextChoices):
         DRAFT = 'DRAFT', _('Draft')
@@ -200,7 +300,7 @@ class Quote(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-class Assignment(models.Model):
+class Assignment(LoadedValuesMixin, models.Model):
     class Status(models.TextChoices):
         PENDING = 'PENDING', _('Pending')  # Assigné à un interprète, en attente de confirmation
         CONFIRMED = 'CONFIRMED', _('Confirmed')  # Accepté par l'interprète
@@ -242,6 +342,14 @@ class Assignment(models.Model):
     interpreter_rate = models.DecimalField(max_digits=10, decimal_places=2, help_text="Taux horaire de l'interprète")
     minimum_hours = models.IntegerField(default=2)
     total_interpreter_payment = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    duration_hours = models.DecimalField(
+        max_digits=7,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Durée réelle en heures (end_time - start_time), calculée à l'enregistrement"
+    )
     
     # Informations additionnelles
     notes = models.TextField(blank=True, null=True)
@@ -255,6 +363,18 @@ class Assignment(models.Model):
         indexes = [
             models.Index(fields=['status', 'interpreter', 'start_time']),
             models.Index(fields=['created_at']),
+            # Calendrier : plages semi-ouvertes sur start_time par interprète
+            models.Index(fields=['interpreter', 'start_time'], name='assignment_interp_start_idx'),
+            # Détection de conflits : start_time < fin AND end_time > début
+            models.Index(
+                fields=['interpreter', 'status', 'end_time', 'start_time'],
+                name='assignment_overlap_idx'
+            ),
+            # Index couvrant pour les agrégats d'heures (SUM(duration_hours))
+            models.Index(
+                fields=['interpreter', 'status', 'start_time', 'duration_hours'],
+                name='assignment_hours_idx'
+            ),
         ]
 
     def __str__(self):
@@ -267,8 +387,27 @@ class Assignment(models.Model):
     #    # Suppression complète des validations client
     #    pass
 
+    @staticmethod
+    def compute_duration_hours(start_time, end_time):
+        """Calcule la durée en heures entre deux datetimes"""
+        if not start_time or not end_time:
+            return None
+        seconds = Decimal(str((end_time - start_time).total_seconds()))
+        return (seconds / Decimal('3600')).quantize(Decimal('0.01'))
+
+    @property
+    def billable_hours(self):
+        """Heures facturables (durée réelle, avec le minimum d'heures)"""
+        if self.duration_hours is None:
+            return None
+        return max(self.duration_hours, Decimal(self.minimum_hours))
+
     def save(self, *args, **kwargs):
         # No validation required for client fields
+        self.duration_hours = self.compute_duration_hours(self.start_time, self.end_time)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'start_time', 'end_time'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'duration_hours'}
         super().save(*args, **kwargs)
 
     def can_be_confirmed(self):
@@ -332,7 +471,7 @@ class AssignmentFeedback(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(User, on_delete=models.PROTECT)
 
-class Payment(models.Model):
+class Payment(LoadedValuesMixin, models.Model):
     class Status(models.TextChoices):
         PENDING = 'PENDING', _('Pending')
         COMPLETED = 'COMPLETED', _('Completed')
@@ -355,7 +494,52 @@ class Payment(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     notes = models.TextField(blank=True, null=True)
 
-class Notification(models.Model):
+    class Meta:
+        indexes = [
+            # Paiements d'une mission par type / statut, les plus récents d'abord
+            models.Index(fields=['assignment', 'payment_type', 'status', 'payment_date'],
+                         name='payment_assignment_type_idx'),
+        ]
+
+class InterpreterDailyRollup(models.Model):
+    """
+    Agrégats journaliers par interprète (jour local America/New_York),
+    maintenus par les signaux Assignment/Payment et reconstruits avec
+    la commande rebuild_daily_rollups.
+    """
+    interpreter = models.ForeignKey(Interpreter, on_delete=models.CASCADE, related_name='daily_rollups')
+    day = models.DateField()
+
+    # Missions (rattachées au jour local de start_time)
+    assignments_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    confirmed_count = models.PositiveIntegerField(default=0)
+    in_progress_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    cancelled_count = models.PositiveIntegerField(default=0)
+    no_show_count = models.PositiveIntegerField(default=0)
+    completed_hours = models.DecimalField(max_digits=9, decimal_places=2, default=Decimal('0.00'))
+    earnings = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'),
+                                   help_text="Somme des total_interpreter_payment des missions complétées")
+
+    # Paiements interprète (rattachés au jour local de payment_date)
+    payments_count = models.PositiveIntegerField(default=0)
+    payments_completed_count = models.PositiveIntegerField(default=0)
+    payments_completed = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    payments_pending = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['interpreter', 'day']
+        constraints = [
+            models.UniqueConstraint(fields=['interpreter', 'day'], name='unique_interpreter_daily_rollup'),
+        ]
+
+    def __str__(self):
+        return f"{self.interpreter} - {self.day}"
+
+class Notification(LoadedValuesMixin, models.Model):
     class Type(models.TextChoices):
         QUOTE_REQUEST = 'QUOTE_REQUEST', _('Quote Request')
         QUOTE_READY = 'QUOTE_READY', _('Quote Ready')
@@ -372,6 +556,13 @@ class Notification(models.Model):
     link = models.CharField(max_length=200, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Centre de notifications : non lues, puis pages par curseur (created_at, id)
+            models.Index(fields=['recipient', 'read', 'created_at'], name='notification_unread_idx'),
+            models.Index(fields=['recipient', 'created_at', 'id'], name='notification_recipient_idx'),
+        ]
+
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
@@ -391,6 +582,12 @@ class AuditLog(models.Model):
     changes = models.JSONField()
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Historique d'un objet (model_name, object_id), dans l'ordre chronologique
+            models.Index(fields=['model_name', 'object_id', 'timestamp'], name='auditlog_object_idx'),
+        ]
     
     
 class PublicQuoteRequest(models.Model):
@@ -483,7 +680,7 @@ class NotificationPreference(models.Model):
         super().save(*args, **kwargs)
         
         
-class AssignmentNotification(models.Model):
+class AssignmentNotification(LoadedValuesMixin, models.Model):
     assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, related_name='notifications')
     interpreter = models.ForeignKey(Interpreter, on_delete=models.CASCADE, related_name='assignment_notifications')
     is_read = models.BooleanField(default=False)
@@ -503,6 +700,7 @@ class AssignmentNotification(models.Model):
     def create_for_new_assignment(cls, assignment):
         """
         Crée une notification pour un nouvel assignment
+        (le compteur de non-lus en cache est incrémenté après commit, voir app.receivers)
         """
         return cls.objects.create(
             assignment=assignment,
@@ -513,11 +711,10 @@ class AssignmentNotification(models.Model):
     def get_unread_count(cls, interpreter):
         """
         Retourne le nombre de notifications non lues pour un interprète
+        (compteur en cache, compté en base seulement s'il est absent)
         """
-        return cls.objects.filter(
-            interpreter=interpreter,
-            is_read=False
-        ).count()
+        from app.services.unread_counters import ASSIGNMENTS, get_unread_count
+        return get_unread_count(ASSIGNMENTS, interpreter.user_id)
 
     def mark_as_read(self):
         """
@@ -694,6 +891,8 @@ class InterpreterPayment(models.Model):
             models.Index(fields=['status', 'scheduled_date'], name='ip_status_scheduled_idx'),
             models.Index(fields=['interpreter', 'status'], name='ip_interpreter_status_idx'),
             models.Index(fields=['created_at'], name='ip_created_at_idx'),
+            # assignment.interpreterpayment_set.latest('created_at')
+            models.Index(fields=['assignment', 'created_at'], name='ip_assignment_created_idx'),
         ]
 
     def __str__(self):
@@ -0,0 +1,299 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    Assignment, AssignmentNotification, Interpreter, InterpreterLanguage, Language, Notification, Payment,
+    Quote, QuoteRequest, ServiceType, User
+)
+from .services.availability import sync_availability_slots
+from .services.client_dashboard import snapshots as client_snapshots
+from .services.events import publish_event
+from .services.interpreter_fragments import invalidate_interpreter_fragments
+from .services.matching import invalidate_language_index
+from .services.reference_data import invalidate_reference_data
+from .services.rollups import schedule_rollup_refresh
+from .services.unread_counters import (
+    ASSIGNMENTS, NOTIFICATIONS, adjust_unread_count, invalidate_unread_count
+)
+
+
+# Champs d'une mission affichés par le dashboard client
+ASSIGNMENT_SNAPSHOT_FIELDS = ('quote_id', 'status', 'start_time', 'completed_at', 'service_type_id')
+
+
+def _remember_values(instance, *fields):
+    """Met à jour les valeurs de référence après un save"""
+    loaded = getattr(instance, '_loaded_values', {})
+    loaded.update({field: getattr(instance, field) for field in fields})
+    instance._loaded_values = loaded
+
+
+@receiver(post_save, sender=Assignment)
+def assignment_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    _refresh_assignment_rollups(instance, loaded, created)
+    _invalidate_assignment_client(instance, loaded, created)
+    invalidate_interpreter_fragments({instance.interpreter_id, loaded.get('interpreter_id')})
+    _push_assignment_status(instance, loaded, created)
+    _remember_values(instance, 'interpreter_id', *ASSIGNMENT_SNAPSHOT_FIELDS)
+
+
+def _refresh_assignment_rollups(instance, loaded, created):
+    """Recalcule les jours (ancien et nouveau) touchés par une mission"""
+    old_interpreter_id = loaded.get('interpreter_id')
+    keys = {
+        (instance.interpreter_id, instance.start_time),
+        (old_interpreter_id, loaded.get('start_time')),
+    }
+
+    # Les paiements d'une mission suivent son interprète
+    if not created and old_interpreter_id != instance.interpreter_id:
+        for payment_date in Payment.objects.filter(
+            assignment=instance,
+            payment_type=Payment.PaymentType.INTERPRETER_PAYMENT
+        ).values_list('payment_date', flat=True):
+            keys.add((instance.interpreter_id, payment_date))
+            keys.add((old_interpreter_id, payment_date))
+
+    schedule_rollup_refresh(keys)
+
+
+def _quote_client_ids(*quote_ids):
+    """Clients des devis donnés (une requête)"""
+    quote_ids = set(quote_ids) - {None}
+    if not quote_ids:
+        return []
+    return Quote.objects.filter(pk__in=quote_ids).values_list('quote_request__client_id', flat=True)
+
+
+def _invalidate_assignment_client(instance, loaded, created):
+    """Invalide le dashboard du client de la mission (et de l'ancien devis) si un champ affiché change"""
+    if not created and all(
+        field in loaded and loaded[field] == getattr(instance, field)
+        for field in ASSIGNMENT_SNAPSHOT_FIELDS
+    ):
+        return
+    client_snapshots.bump_on_commit(*_quote_client_ids(instance.quote_id, loaded.get('quote_id')))
+
+
+def _push_assignment_status(instance, loaded, created):
+    """Pousse le changement de statut à l'interprète et au client (SSE), après commit"""
+    previous_status = loaded.get('status')
+    if created or 'status' not in loaded or previous_status == instance.status:
+        return
+    data = {
+        'assignment_id': instance.pk,
+        'status': instance.status,
+        'previous_status': previous_status,
+    }
+
+    def push():
+        recipients = Assignment.objects.filter(pk=instance.pk).values_list(
+            'interpreter__user_id', 'quote__quote_request__client__user_id'
+        ).first() or ()
+        for user_id in set(recipients):
+            publish_event(user_id, 'assignment_status', data)
+
+    transaction.on_commit(push)
+
+
+@receiver(post_delete, sender=Assignment)
+def assignment_deleted(sender, instance, **kwargs):
+    schedule_rollup_refresh({(instance.interpreter_id, instance.start_time)})
+    client_snapshots.bump_on_commit(*_quote_client_ids(instance.quote_id))
+    invalidate_interpreter_fragments({instance.interpreter_id})
+
+
+@receiver(post_save, sender=Payment)
+def payment_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    # Interprète et client des missions (nouvelle et ancienne) du paiement, en une requête
+    assignments = _payment_assignments(instance.assignment_id, loaded.get('assignment_id'))
+    _refresh_payment_rollups(instance, loaded, assignments)
+    client_snapshots.bump_on_commit(*(client_id for _, client_id in assignments.values()))
+    invalidate_interpreter_fragments({interpreter_id for interpreter_id, _ in assignments.values()})
+    _remember_values(instance, 'assignment_id', 'payment_type', 'payment_date')
+
+
+def _payment_assignments(*assignment_ids):
+    """{assignment_id: (interpreter_id, client_id)}"""
+    return {
+        pk: (interpreter_id, client_id)
+        for pk, interpreter_id, client_id in Assignment.objects.filter(
+            pk__in=set(assignment_ids) - {None}
+        ).values_list('pk', 'interpreter_id', 'quote__quote_request__client_id')
+    }
+
+
+def _refresh_payment_rollups(instance, loaded, assignments):
+    """Recalcule les jours touchés par un paiement interprète"""
+    interpreter_payment = Payment.PaymentType.INTERPRETER_PAYMENT
+    if interpreter_payment not in (instance.payment_type, loaded.get('payment_type')):
+        return
+
+    old_assignment_id = loaded.get('assignment_id')
+    schedule_rollup_refresh({
+        (assignments.get(instance.assignment_id, (None, None))[0], instance.payment_date),
+        (assignments.get(old_assignment_id, (None, None))[0], loaded.get('payment_date')),
+    })
+
+
+@receiver(post_delete, sender=Payment)
+def payment_deleted(sender, instance, **kwargs):
+    interpreter_id, client_id = _payment_assignments(instance.assignment_id).get(
+        instance.assignment_id, (None, None)
+    )
+    client_snapshots.bump_on_commit(client_id)
+    invalidate_interpreter_fragments({interpreter_id})
+    if instance.payment_type == Payment.PaymentType.INTERPRETER_PAYMENT:
+        schedule_rollup_refresh({(interpreter_id, instance.payment_date)})
+
+
+@receiver([post_save, post_delete], sender=QuoteRequest)
+def quote_request_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        client_snapshots.bump_on_commit(instance.client_id)
+
+
+@receiver([post_save, post_delete], sender=Quote)
+def quote_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        client_snapshots.bump_on_commit(
+            *QuoteRequest.objects.filter(pk=instance.quote_request_id).values_list('client_id', flat=True)
+        )
+
+
+@receiver([post_save, post_delete], sender=InterpreterLanguage)
+@receiver(post_delete, sender=Interpreter)
+def interpreter_languages_changed(sender, raw=False, **kwargs):
+    """Index de matching : invalidé après commit pour ne pas recacher l'ancien état"""
+    if not raw:
+        transaction.on_commit(invalidate_language_index)
+
+
+# Champs de l'interprète utilisés par le matching (statut, localisation, rayon)
+INTERPRETER_MATCHING_FIELDS = ('active', 'zip_code', 'latitude', 'longitude', 'radius_of_service')
+
+
+@receiver(post_save, sender=Interpreter)
+def interpreter_saved(sender, instance, created=False, raw=False, **kwargs):
+    """Index de matching : invalidé seulement si un champ de matching change (ex. pas les infos bancaires)"""
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', None)
+    if created or loaded is None or any(
+        loaded.get(field, getattr(instance, field)) != getattr(instance, field)
+        for field in INTERPRETER_MATCHING_FIELDS
+    ):
+        transaction.on_commit(invalidate_language_index)
+    _remember_values(instance, *INTERPRETER_MATCHING_FIELDS)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created=False, raw=False, **kwargs):
+    """Index de matching : un compte (dés)activé entre ou sort de l'index"""
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    if not created and loaded.get('is_active', instance.is_active) != instance.is_active:
+        transaction.on_commit(invalidate_language_index)
+    _remember_values(instance, 'is_active')
+
+
+@receiver([post_save, post_delete], sender=Language)
+@receiver([post_save, post_delete], sender=ServiceType)
+def reference_data_changed(sender, raw=False, **kwargs):
+    """Référentiels en mémoire des processus : nouvelle génération"""
+    if not raw:
+        invalidate_reference_data()
+
+
+@receiver(post_save, sender=Interpreter)
+def sync_interpreter_availability(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Normalise Interpreter.availability en créneaux hebdomadaires"""
+    if raw or (update_fields is not None and 'availability' not in update_fields):
+        return
+    sync_availability_slots(instance)
+
+
+def _update_unread_counter(kind, user_id, instance, created, read_field, owner_field, old_user_id=None):
+    """
+    Répercute un save sur le compteur de non-lus, après commit.
+    Si l'état précédent est inconnu ou si le destinataire a changé, le
+    compteur est invalidé (recompté à la prochaine lecture).
+    """
+    loaded = getattr(instance, '_loaded_values', {})
+    is_read = getattr(instance, read_field)
+    if created:
+        delta = 0 if is_read else 1
+    elif read_field not in loaded or loaded.get(owner_field) != getattr(instance, owner_field):
+        delta = None
+    else:
+        delta = int(loaded[read_field]) - int(is_read)
+
+    if delta is None:
+        transaction.on_commit(lambda: invalidate_unread_count(kind, user_id))
+        if old_user_id and old_user_id != user_id:
+            transaction.on_commit(lambda: invalidate_unread_count(kind, old_user_id))
+    elif delta:
+        transaction.on_commit(lambda: adjust_unread_count(kind, user_id, delta))
+    _remember_values(instance, read_field, owner_field)
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    _update_unread_counter(
+        NOTIFICATIONS, instance.recipient_id, instance, created,
+        'read', 'recipient_id', old_user_id=loaded.get('recipient_id')
+    )
+    if created:
+        data = {
+            'id': instance.pk,
+            'type': instance.type,
+            'title': instance.title,
+            'link': instance.link,
+        }
+        transaction.on_commit(lambda: publish_event(instance.recipient_id, 'notification', data))
+
+
+@receiver(post_save, sender=AssignmentNotification)
+def assignment_notification_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    old_user_id = None
+    if not created and loaded.get('interpreter_id') not in (None, instance.interpreter_id):
+        old_user_id = Interpreter.objects.filter(
+            pk=loaded['interpreter_id']
+        ).values_list('user_id', flat=True).first()
+    user_id = instance.interpreter.user_id
+    _update_unread_counter(
+        ASSIGNMENTS, user_id, instance, created,
+        'is_read', 'interpreter_id', old_user_id=old_user_id
+    )
+    if created:
+        data = {'id': instance.pk, 'assignment_id': instance.assignment_id}
+        transaction.on_commit(lambda: publish_event(user_id, 'assignment_offer', data))
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, **kwargs):
+    if not instance.read:
+        transaction.on_commit(lambda: adjust_unread_count(NOTIFICATIONS, instance.recipient_id, -1))
+
+
+@receiver(post_delete, sender=AssignmentNotification)
+def assignment_notification_deleted(sender, instance, **kwargs):
+    if not instance.is_read:
+        user_id = Interpreter.objects.filter(
+            pk=instance.interpreter_id
+        ).values_list('user_id', flat=True).first()
+        transaction.on_commit(lambda: adjust_unread_count(ASSIGNMENTS, user_id, -1))
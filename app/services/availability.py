@@ -0,0 +1,120 @@
+from django.db import transaction
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q
+from django.utils import timezone
+
+from app.models import Interpreter, InterpreterAvailabilityException, InterpreterAvailabilitySlot
+from app.utils.availability import MINUTES_PER_DAY, format_minutes, parse_availability
+from app.utils.datetime_handlers import DateTimeHandler
+
+
+def sync_availability_slots(interpreter):
+    """Régénère les créneaux hebdomadaires depuis Interpreter.availability"""
+    slots = [
+        InterpreterAvailabilitySlot(
+            interpreter=interpreter,
+            weekday=weekday,
+            start_minute=start,
+            end_minute=end
+        )
+        for weekday, start, end in parse_availability(interpreter.availability)
+    ]
+    with transaction.atomic():
+        InterpreterAvailabilitySlot.objects.filter(interpreter=interpreter).delete()
+        InterpreterAvailabilitySlot.objects.bulk_create(slots)
+    return slots
+
+
+def split_window(start, end):
+    """
+    Découpe [start, end) en segments journaliers à Boston :
+    (date, weekday, minute de début, minute de fin).
+    """
+    current = start.astimezone(DateTimeHandler.BOSTON_TZ)
+    end = end.astimezone(DateTimeHandler.BOSTON_TZ)
+    segments = []
+    while current < end:
+        day = current.date()
+        next_midnight = DateTimeHandler.day_range(day)[1]
+        segment_end = min(end, next_midnight)
+        start_minute = current.hour * 60 + current.minute
+        if segment_end == next_midnight:
+            end_minute = MINUTES_PER_DAY
+        else:
+            end_minute = segment_end.hour * 60 + segment_end.minute
+            if segment_end.second or segment_end.microsecond:
+                end_minute += 1
+        segments.append((day, day.weekday(), start_minute, end_minute))
+        current = segment_end
+    return segments
+
+
+def availability_condition(start, end):
+    """
+    Condition SQL (sur Interpreter) : disponible sur tout [start, end).
+    Pour chaque jour du créneau : couvert par un créneau hebdomadaire et sans
+    indisponibilité ce jour-là, ou couvert par une disponibilité exceptionnelle.
+    """
+    condition = Q()
+    for day, weekday, start_minute, end_minute in split_window(start, end):
+        weekly = Exists(InterpreterAvailabilitySlot.objects.filter(
+            interpreter=OuterRef('pk'),
+            weekday=weekday,
+            start_minute__lte=start_minute,
+            end_minute__gte=end_minute
+        ))
+        blocked = Exists(InterpreterAvailabilityException.objects.filter(
+            interpreter=OuterRef('pk'),
+            date=day,
+            is_available=False,
+            start_minute__lt=end_minute,
+            end_minute__gt=start_minute
+        ))
+        extra = Exists(InterpreterAvailabilityException.objects.filter(
+            interpreter=OuterRef('pk'),
+            date=day,
+            is_available=True,
+            start_minute__lte=start_minute,
+            end_minute__gte=end_minute
+        ))
+        condition &= (Q(weekly) & ~Q(blocked)) | Q(extra)
+    return condition
+
+
+def get_available_interpreters(start, end, queryset=None):
+    """Interprètes actifs disponibles sur [start, end) — une seule requête"""
+    queryset = queryset if queryset is not None else Interpreter.objects.filter(active=True)
+    return queryset.filter(availability_condition(start, end))
+
+
+def get_availability_flags(interpreter_ids, start, end):
+    """
+    {interpreter_id: (a déclaré des disponibilités, disponible sur le créneau)}
+    en une requête. Les interprètes sans planning déclaré ne sont pas exclus
+    par le matching, mais classés après ceux qui sont confirmés disponibles.
+    """
+    rows = Interpreter.objects.filter(pk__in=interpreter_ids).annotate(
+        has_slots=Exists(InterpreterAvailabilitySlot.objects.filter(interpreter=OuterRef('pk'))),
+        is_available=ExpressionWrapper(availability_condition(start, end), output_field=BooleanField())
+    ).values_list('pk', 'has_slots', 'is_available')
+    return {pk: (has_slots, bool(is_available)) for pk, has_slots, is_available in rows}
+
+
+def get_weekly_availability(interpreter):
+    """Planning hebdomadaire lisible, pour l'affichage"""
+    slots = InterpreterAvailabilitySlot.objects.filter(interpreter=interpreter)
+    days = [
+        {'day': label, 'slots': []}
+        for _, label in InterpreterAvailabilitySlot.Weekday.choices
+    ]
+    for slot in slots:
+        days[slot.weekday]['slots'].append(
+            f"{format_minutes(slot.start_minute)}-{format_minutes(slot.end_minute)}"
+        )
+    return days
+
+
+def get_upcoming_exceptions(interpreter, limit=10):
+    return InterpreterAvailabilityException.objects.filter(
+        interpreter=interpreter,
+        date__gte=timezone.localdate()
+    ).order_by('date', 'start_minute')[:limit]
@@ -0,0 +1,55 @@
+import calendar
+
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+from app.models import Assignment
+from app.utils.datetime_handlers import DateTimeHandler
+
+
+# Bit i du masque = statut STATUS_ORDER[i]
+STATUS_ORDER = list(Assignment.Status.values)
+STATUS_BITS = {status: 1 << index for index, status in enumerate(STATUS_ORDER)}
+
+
+def _month_rows(interpreter, year, month):
+    month_start, month_end = DateTimeHandler.month_range(year, month)
+    return Assignment.objects.filter(
+        interpreter=interpreter,
+        start_time__gte=month_start,
+        start_time__lt=month_end
+    ).annotate(
+        day=TruncDate('start_time', tzinfo=DateTimeHandler.BOSTON_TZ)
+    ).values('day', 'status').annotate(
+        count=Count('id')
+    ).order_by()
+
+
+def _summarize_month(rows, year, month):
+    days = [[0, 0] for _ in range(calendar.monthrange(year, month)[1])]
+    for row in rows:
+        entry = days[row['day'].day - 1]
+        entry[0] += row['count']
+        entry[1] |= STATUS_BITS.get(row['status'], 0)
+
+    return {
+        'year': year,
+        'month': month,
+        'statuses': STATUS_ORDER,
+        'days': days,
+    }
+
+
+def get_month_summary(interpreter, year, month):
+    """
+    Résumé compact d'un mois pour le calendrier : une entrée [nombre, masque
+    de statuts] par jour (index 0 = le 1er), calculée avec un seul GROUP BY
+    sur le jour de Boston et le statut.
+    """
+    return _summarize_month(_month_rows(interpreter, year, month), year, month)
+
+
+async def aget_month_summary(interpreter, year, month):
+    """Version async (ORM async) de get_month_summary"""
+    rows = [row async for row in _month_rows(interpreter, year, month)]
+    return _summarize_month(rows, year, month)
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from app.cache import CacheNamespace
+from app.models import Assignment, Payment, QuoteRequest
+
+
+# Les compteurs "30 derniers jours" / "à venir" dérivent avec le temps
+SNAPSHOT_TIMEOUT = 15 * 60
+
+# Invalidation : snapshots.bump_on_commit(client_id), depuis les receivers qui
+# résolvent l'id client avec leur propre lecture (aucune écriture sur la ligne Client)
+snapshots = CacheNamespace('client_dashboard', SNAPSHOT_TIMEOUT)
+
+
+def get_snapshot_key(client):
+    """Clé versionnée : un changement de version rend l'ancien snapshot inaccessible"""
+    return (client.pk, f'v{snapshots.get_version(client.pk)}')
+
+
+def build_client_snapshot(client, now=None):
+    """
+    Construit le snapshot du dashboard client (statistiques et listes
+    récentes) sous forme de dictionnaires simples, sérialisables en cache.
+    """
+    now = now or timezone.now()
+    thirty_days_ago = now - timedelta(days=30)
+    active = Q(status__in=[Assignment.Status.CONFIRMED, Assignment.Status.IN_PROGRESS])
+
+    quotes = QuoteRequest.objects.filter(client=client)
+    assignments = Assignment.objects.filter(quote__quote_request__client=client)
+    payments = Payment.objects.filter(assignment__quote__quote_request__client=client)
+
+    assignment_stats = assignments.aggregate(
+        active_assignments=Count('id', filter=active),
+        completed_assignments=Count('id', filter=Q(
+            status=Assignment.Status.COMPLETED,
+            completed_at__gte=thirty_days_ago
+        )),
+    )
+
+    stats = {
+        'pending_quotes': quotes.filter(status=QuoteRequest.Status.PENDING).count(),
+        'active_assignments': assignment_stats['active_assignments'],
+        'completed_assignments': assignment_stats['completed_assignments'],
+        'total_spent': payments.filter(
+            status=Payment.Status.COMPLETED,
+            payment_date__gte=thirty_days_ago
+        ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00'),
+    }
+
+    recent_quotes = list(quotes.annotate(
+        service=F('service_type__name'),
+        estimated_amount=F('quote__amount')
+    ).values('service', 'created_at', 'status', 'estimated_amount').order_by('-created_at')[:5])
+
+    upcoming_assignments = list(assignments.filter(
+        active,
+        start_time__gte=now
+    ).annotate(
+        service=F('service_type__name'),
+        total_amount=F('quote__amount')
+    ).values('service', 'start_time', 'status', 'total_amount').order_by('start_time')[:5])
+
+    recent_payments = list(payments.annotate(
+        service=F('assignment__service_type__name')
+    ).values('service', 'payment_date', 'status', 'amount').order_by('-payment_date')[:5])
+
+    # Mêmes clés que les objets utilisés auparavant par le template
+    for row in recent_quotes + upcoming_assignments:
+        row['service_type'] = row.pop('service')
+    for row in recent_payments:
+        row['assignment'] = {'service_type': row.pop('service')}
+
+    return {
+        'stats': stats,
+        'recent_quotes': recent_quotes,
+        'upcoming_assignments': upcoming_assignments,
+        'recent_payments': recent_payments,
+    }
+
+
+def get_client_snapshot(client):
+    """Retourne le snapshot en cache, ou le reconstruit (et le met en cache)"""
+    return snapshots.get_or_build(get_snapshot_key(client), lambda: build_client_snapshot(client))
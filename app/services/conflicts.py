@@ -0,0 +1,128 @@
+from collections import defaultdict
+
+from django.db.models import Q
+
+from app.models import Assignment
+
+
+# Missions qui bloquent réellement l'agenda d'un interprète
+COMMITTED_STATUSES = [Assignment.Status.CONFIRMED, Assignment.Status.IN_PROGRESS]
+
+# Missions dont l'horaire est vérifié (une mission en attente ne doit pas
+# chevaucher les missions engagées)
+SCHEDULED_STATUSES = [Assignment.Status.PENDING] + COMMITTED_STATUSES
+
+
+def _overlaps(start_a, end_a, start_b, end_b):
+    """Chevauchement strict : deux créneaux qui se touchent ne sont pas en conflit"""
+    return start_a < end_b and end_a > start_b
+
+
+def find_conflicts(interpreter, windows, exclude_ids=None, statuses=None):
+    """
+    Vérifie un lot de créneaux (start, end) contre les missions engagées d'un
+    interprète, en une seule requête (index assignment_overlap_idx).
+
+    Retourne une liste alignée sur windows : pour chaque créneau, la liste des
+    missions en conflit (triées par start_time).
+    """
+    windows = list(windows)
+    results = [[] for _ in windows]
+    valid = [
+        (index, start, end) for index, (start, end) in enumerate(windows)
+        if start and end and end > start
+    ]
+    if interpreter is None or not valid:
+        return results
+
+    overlap = Q()
+    for _, start, end in valid:
+        overlap |= Q(start_time__lt=end, end_time__gt=start)
+
+    queryset = Assignment.objects.filter(
+        overlap,
+        interpreter=interpreter,
+        status__in=statuses or COMMITTED_STATUSES
+    ).order_by('start_time')
+    if exclude_ids:
+        queryset = queryset.exclude(pk__in=exclude_ids)
+
+    committed = list(queryset)
+    for index, start, end in valid:
+        results[index] = [
+            assignment for assignment in committed
+            if _overlaps(start, end, assignment.start_time, assignment.end_time)
+        ]
+    return results
+
+
+def get_busy_interpreter_ids(interpreter_ids, start, end, exclude_ids=None):
+    """
+    Parmi interpreter_ids, ceux qui ont une mission engagée chevauchant
+    [start, end) — une seule requête pour tous les candidats.
+    """
+    queryset = Assignment.objects.filter(
+        interpreter_id__in=interpreter_ids,
+        status__in=COMMITTED_STATUSES,
+        start_time__lt=end,
+        end_time__gt=start
+    )
+    if exclude_ids:
+        queryset = queryset.exclude(pk__in=exclude_ids)
+    return set(queryset.values_list('interpreter_id', flat=True).distinct())
+
+
+def get_conflicts(assignment, interpreter=None):
+    """Missions engagées en conflit avec une mission (elle-même exclue)"""
+    interpreter = interpreter or assignment.interpreter_id
+    exclude_ids = [assignment.pk] if assignment.pk else None
+    return find_conflicts(
+        interpreter,
+        [(assignment.start_time, assignment.end_time)],
+        exclude_ids=exclude_ids
+    )[0]
+
+
+def find_batch_conflicts(assignments):
+    """
+    Vérifie un lot de missions (ex. réservations en masse) : une requête par
+    interprète, plus les chevauchements entre missions du lot.
+
+    Retourne une liste de couples (mission, conflits) pour les missions en conflit.
+    """
+    by_interpreter = defaultdict(list)
+    for assignment in assignments:
+        if assignment.interpreter_id:
+            by_interpreter[assignment.interpreter_id].append(assignment)
+
+    conflicts = []
+    for interpreter_id, group in by_interpreter.items():
+        found = find_conflicts(
+            interpreter_id,
+            [(assignment.start_time, assignment.end_time) for assignment in group],
+            exclude_ids=[assignment.pk for assignment in group if assignment.pk]
+        )
+        for assignment, existing in zip(group, found):
+            in_batch = [
+                other for other in group
+                if other is not assignment and _overlaps(
+                    assignment.start_time, assignment.end_time,
+                    other.start_time, other.end_time
+                )
+            ]
+            if existing or in_batch:
+                conflicts.append((assignment, existing + in_batch))
+    return conflicts
+
+
+def describe_conflicts(conflicts):
+    """Représentation JSON des missions en conflit"""
+    return [
+        {
+            'id': assignment.id,
+            'start_time': assignment.start_time.isoformat(),
+            'end_time': assignment.end_time.isoformat(),
+            'status': assignment.status,
+        }
+        for assignment in conflicts
+    ]
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'events:user:'
+# Un abonné lent ne bloque pas les autres : au-delà, ses événements sont perdus
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def get_user_channel(user_id):
+    return f'{CHANNEL_PREFIX}{user_id}'
+
+
+def _offer(queue, message):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        logger.warning("Event queue full, dropping event")
+
+
+class LocalEventBus:
+    """
+    Bus en mémoire (un seul processus) : sert aux tests et au développement,
+    et à la distribution locale des messages reçus de Redis.
+    """
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        self.deliver(channel, message)
+
+    def deliver(self, channel, message):
+        """Remet un message aux abonnés du processus (appelable depuis n'importe quel thread)"""
+        with self._lock:
+            targets = list(self._subscribers.get(channel, ()))
+        for loop, queue in targets:
+            loop.call_soon_threadsafe(_offer, queue, message)
+
+    async def _on_subscribe(self):
+        pass
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        """File asyncio recevant les messages du canal, tant que le contexte est ouvert"""
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+        with self._lock:
+            self._subscribers[channel].add(entry)
+        try:
+            await self._on_subscribe()
+            yield entry[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(entry)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+
+class RedisEventBus(LocalEventBus):
+    """
+    Bus multi-workers : publication sur Redis, et par worker (boucle asyncio)
+    un seul abonnement PSUBSCRIBE qui redistribue aux abonnés locaux.
+    """
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self._client = redis.Redis.from_url(url)
+        self._listeners = {}
+
+    def publish(self, channel, message):
+        try:
+            self._client.publish(channel, message)
+        except redis.RedisError:
+            logger.exception("Could not publish event on %s", channel)
+
+    async def _on_subscribe(self):
+        loop = asyncio.get_running_loop()
+        listener = self._listeners.get(loop)
+        if listener is None or listener.done():
+            self._listeners[loop] = loop.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            client = aioredis.Redis.from_url(self.url)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(f'{CHANNEL_PREFIX}*')
+                async for message in pubsub.listen():
+                    if message['type'] == 'pmessage':
+                        self.deliver(message['channel'].decode(), message['data'].decode())
+            except redis.RedisError:
+                logger.exception("Event listener lost its Redis connection, retrying")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_event_bus():
+    """Redis si PUSH_EVENTS_REDIS_URL est défini, sinon le bus en mémoire"""
+    url = getattr(settings, 'PUSH_EVENTS_REDIS_URL', None)
+    return RedisEventBus(url) if url else LocalEventBus()
+
+
+def publish_event(user_id, event, data):
+    """Pousse un événement vers les connexions SSE d'un utilisateur"""
+    if not user_id:
+        return
+    message = json.dumps({'event': event, 'data': data}, cls=DjangoJSONEncoder)
+    get_event_bus().publish(get_user_channel(user_id), message)
+
+
+def format_sse(message):
+    """Message du bus -> trame text/event-stream"""
+    payload = json.loads(message)
+    return f"event: {payload['event']}\ndata: {json.dumps(payload['data'])}\n\n"
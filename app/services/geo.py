@@ -0,0 +1,63 @@
+import numpy as np
+from django.db.models import Q
+
+from app.models import Interpreter
+from app.utils.geo import bounding_box, haversine_miles, zip_to_coordinates
+
+
+# Rayon appliqué aux interprètes sans radius_of_service renseigné
+DEFAULT_SERVICE_RADIUS_MILES = 50
+# Plafond du préfiltre SQL : un rayon déclaré au-delà est ramené à cette valeur
+MAX_SERVICE_RADIUS_MILES = 150
+
+
+def get_service_distances(zip_code, interpreter_ids=None):
+    """
+    Interprètes dont le rayon de service couvre le code postal d'une mission.
+
+    Une requête (préfiltre bounding box sur interpreter_geo_idx), puis le calcul
+    des distances vectorisé. Retourne {interpreter_id: distance en miles, ou None
+    si le code postal de l'interprète est inconnu}. Retourne None si le code
+    postal de la mission est inconnu : aucun filtrage n'est alors possible.
+    """
+    origin = zip_to_coordinates(zip_code)
+    if origin is None:
+        return None
+    latitude, longitude = origin
+
+    lat_min, lat_max, lon_min, lon_max = bounding_box(latitude, longitude, MAX_SERVICE_RADIUS_MILES)
+    queryset = Interpreter.objects.filter(
+        Q(latitude__range=(lat_min, lat_max), longitude__range=(lon_min, lon_max))
+        | Q(latitude__isnull=True)
+    )
+    if interpreter_ids is not None:
+        queryset = queryset.filter(pk__in=interpreter_ids)
+    rows = list(queryset.values_list('pk', 'latitude', 'longitude', 'radius_of_service'))
+
+    distances = {}
+    located = []
+    for pk, lat, lon, radius in rows:
+        if lat is None or lon is None:
+            distances[pk] = None
+        else:
+            located.append((pk, lat, lon, radius))
+    if not located:
+        return distances
+
+    ids = np.array([row[0] for row in located])
+    miles = haversine_miles(
+        latitude,
+        longitude,
+        [row[1] for row in located],
+        [row[2] for row in located]
+    )
+    radii = np.array([
+        min(row[3], MAX_SERVICE_RADIUS_MILES) if row[3] and row[3] > 0 else DEFAULT_SERVICE_RADIUS_MILES
+        for row in located
+    ], dtype=np.float64)
+    within = miles <= radii
+    distances.update(
+        (int(pk), round(float(distance), 1))
+        for pk, distance in zip(ids[within], miles[within])
+    )
+    return distances
@@ -0,0 +1,31 @@
+from django.db.models import DEFERRED
+from django.utils import timezone
+
+from app.cache import CacheNamespace
+
+
+# Fragments de templates par interprète (accueil, calendrier, statistiques).
+# Les listes "à venir" / "aujourd'hui" dérivent avec l'heure : délai court.
+FRAGMENT_TIMEOUT = 5 * 60
+VERSION_TIMEOUT = 24 * 60 * 60
+
+fragments = CacheNamespace('interpreter_fragments', FRAGMENT_TIMEOUT, version_timeout=VERSION_TIMEOUT)
+
+
+def get_fragment_version(interpreter_id):
+    """Version courante des fragments de l'interprète"""
+    return fragments.get_version(interpreter_id)
+
+
+def get_fragment_key(interpreter):
+    """Clé à passer aux balises {% cache %} (vary_on) : interprète, version, jour local"""
+    return f'{interpreter.pk}:{get_fragment_version(interpreter.pk)}:{timezone.localdate().isoformat()}'
+
+
+def invalidate_interpreter_fragments(interpreter_ids):
+    """
+    Invalide les fragments des interprètes, après commit : les agrégats
+    journaliers (rafraîchis après commit eux aussi, planifiés avant) sont
+    alors à jour, un fragment reconstruit ne peut pas reprendre l'ancien état.
+    """
+    fragments.bump_on_commit(*(set(interpreter_ids) - {DEFERRED}))
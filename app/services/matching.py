@@ -0,0 +1,154 @@
+from collections import defaultdict
+
+from app.cache import CacheNamespace
+from app.models import Interpreter, InterpreterLanguage
+from app.services.availability import get_availability_flags
+from app.services.conflicts import get_busy_interpreter_ids
+from app.services.geo import get_service_distances
+
+
+LANGUAGE_INDEX_KEY = 'language_index'
+LANGUAGE_INDEX_TIMEOUT = 6 * 60 * 60
+
+matching_cache = CacheNamespace('matching', LANGUAGE_INDEX_TIMEOUT)
+
+PROFICIENCY_RANK = {
+    InterpreterLanguage.Proficiency.NATIVE: 4,
+    InterpreterLanguage.Proficiency.FLUENT: 3,
+    InterpreterLanguage.Proficiency.PROFESSIONAL: 2,
+    InterpreterLanguage.Proficiency.INTERMEDIATE: 1,
+}
+
+
+def build_language_index():
+    """
+    Construit l'index de matching des interprètes actifs :
+    - 'pairs' : (source_id, target_id) -> ensemble d'interpreter_id
+    - 'languages' : (interpreter_id, language_id) -> (rang de maîtrise, certifié)
+    """
+    rows = InterpreterLanguage.objects.filter(
+        interpreter__active=True,
+        interpreter__user__is_active=True
+    ).values_list('interpreter_id', 'language_id', 'proficiency', 'certified')
+
+    languages_by_interpreter = defaultdict(set)
+    languages = {}
+    for interpreter_id, language_id, proficiency, certified in rows:
+        languages_by_interpreter[interpreter_id].add(language_id)
+        languages[(interpreter_id, language_id)] = (PROFICIENCY_RANK.get(proficiency, 0), certified)
+
+    pairs = defaultdict(set)
+    for interpreter_id, language_ids in languages_by_interpreter.items():
+        for source_id in language_ids:
+            for target_id in language_ids:
+                if source_id != target_id:
+                    pairs[(source_id, target_id)].add(interpreter_id)
+
+    return {
+        'pairs': {pair: frozenset(ids) for pair, ids in pairs.items()},
+        'languages': languages,
+    }
+
+
+def get_language_index():
+    """Index de matching (lu depuis le cache, reconstruit si absent ou proche de l'expiration)"""
+    return matching_cache.get_or_build(LANGUAGE_INDEX_KEY, build_language_index)
+
+
+def invalidate_language_index():
+    matching_cache.delete(LANGUAGE_INDEX_KEY)
+
+
+# Tranches de distance (miles) : à maîtrise égale, 3 et 4 miles se valent
+DISTANCE_BUCKET_MILES = 5
+
+
+def _proximity_score(distance):
+    """Plus proche = plus haut ; distance inconnue classée en dernier"""
+    if distance is None:
+        return float('-inf')
+    return -int(distance // DISTANCE_BUCKET_MILES)
+
+
+def find_matching_interpreters(source_language, target_language, service_type,
+                               start_time, end_time, zip_code=None,
+                               exclude_assignment_ids=None, limit=20):
+    """
+    Interprètes actifs et disponibles pour une paire de langues, classés par
+    certification, proximité et maîtrise des deux langues.
+
+    Si service_type.requires_certification, l'interprète doit être certifié
+    pour les deux langues. Les interprètes ayant une mission engagée sur le
+    créneau, ou dont le planning déclaré ne couvre pas le créneau, sont exclus ;
+    ceux sans planning déclaré passent après les disponibilités confirmées.
+    Si le code postal de la mission est connu, les interprètes dont le rayon de
+    service ne le couvre pas sont exclus (voir app.services.geo).
+    """
+    index = get_language_index()
+    source_id = getattr(source_language, 'pk', source_language)
+    target_id = getattr(target_language, 'pk', target_language)
+    candidates = index['pairs'].get((source_id, target_id), frozenset())
+
+    requires_certification = bool(service_type and service_type.requires_certification)
+    eligible = []
+    for interpreter_id in candidates:
+        source_rank, source_certified = index['languages'][(interpreter_id, source_id)]
+        target_rank, target_certified = index['languages'][(interpreter_id, target_id)]
+        certified = source_certified and target_certified
+        if requires_certification and not certified:
+            continue
+        eligible.append((interpreter_id, certified, source_rank, target_rank))
+
+    if not eligible:
+        return []
+
+    distances = get_service_distances(zip_code, [entry[0] for entry in eligible]) if zip_code else None
+    scored = []
+    for interpreter_id, certified, source_rank, target_rank in eligible:
+        if distances is not None and interpreter_id not in distances:
+            continue
+        distance = distances.get(interpreter_id) if distances is not None else None
+        proximity = _proximity_score(distance) if distances is not None else 0
+        scored.append((
+            (int(certified), proximity, min(source_rank, target_rank), source_rank + target_rank),
+            interpreter_id,
+            certified,
+            distance,
+        ))
+
+    if not scored:
+        return []
+
+    busy = get_busy_interpreter_ids(
+        [interpreter_id for _, interpreter_id, _, _ in scored],
+        start_time,
+        end_time,
+        exclude_ids=exclude_assignment_ids
+    )
+    scored = [entry for entry in scored if entry[1] not in busy]
+
+    flags = get_availability_flags([interpreter_id for _, interpreter_id, _, _ in scored], start_time, end_time)
+    available = []
+    for score, interpreter_id, certified, distance in scored:
+        declared, is_available = flags.get(interpreter_id, (False, False))
+        if declared and not is_available:
+            continue
+        available.append(((int(is_available),) + score, interpreter_id, certified, distance))
+    scored = available
+    scored.sort(key=lambda entry: (entry[0], -entry[1]), reverse=True)
+    scored = scored[:limit] if limit else scored
+
+    interpreters = Interpreter.objects.select_related('user').in_bulk(
+        [interpreter_id for _, interpreter_id, _, _ in scored]
+    )
+    return [
+        {
+            'interpreter': interpreters[interpreter_id],
+            'score': score,
+            'certified': certified,
+            'distance_miles': distance,
+            'availability_confirmed': bool(score[0]),
+        }
+        for score, interpreter_id, certified, distance in scored
+        if interpreter_id in interpreters
+    ]
@@ -0,0 +1,59 @@
+from django.db.models import Count, Q
+
+from app.models import Notification
+from app.utils.pagination import paginate_by_cursor
+
+
+NOTIFICATION_PAGE_SIZE = 15
+
+# Onglets du centre de notifications -> types de notification
+NOTIFICATION_CATEGORIES = {
+    'quote': [Notification.Type.QUOTE_REQUEST, Notification.Type.QUOTE_READY],
+    'assignment': [Notification.Type.ASSIGNMENT_OFFER, Notification.Type.ASSIGNMENT_REMINDER],
+    'payment': [Notification.Type.PAYMENT_RECEIVED],
+    'system': [Notification.Type.SYSTEM],
+}
+NOTIFICATION_TABS = ['all', 'unread'] + list(NOTIFICATION_CATEGORIES)
+
+
+def get_category_filter(category):
+    """Condition d'un onglet ('all', 'unread' ou une clé de NOTIFICATION_CATEGORIES)"""
+    if category == 'unread':
+        return Q(read=False)
+    if category in NOTIFICATION_CATEGORIES:
+        return Q(type__in=NOTIFICATION_CATEGORIES[category])
+    return Q()
+
+
+def get_notification_counts(user):
+    """Compteurs de tous les onglets en une seule requête groupée"""
+    return Notification.objects.filter(recipient=user).aggregate(
+        all=Count('id'),
+        unread=Count('id', filter=Q(read=False)),
+        **{
+            category: Count('id', filter=Q(type__in=types))
+            for category, types in NOTIFICATION_CATEGORIES.items()
+        }
+    )
+
+
+def get_notification_page(user, category='all', cursor=None, page_size=NOTIFICATION_PAGE_SIZE):
+    """
+    Une page de notifications (les plus récentes d'abord), paginée par curseur
+    sur (created_at, id). Lève InvalidCursor si le curseur est illisible.
+    """
+    queryset = Notification.objects.filter(get_category_filter(category), recipient=user)
+    return paginate_by_cursor(queryset, cursor=cursor, page_size=page_size)
+
+
+def serialize_notification(notification):
+    return {
+        'id': notification.id,
+        'type': notification.type,
+        'type_display': notification.get_type_display(),
+        'title': notification.title,
+        'content': notification.content,
+        'link': notification.link,
+        'read': notification.read,
+        'created_at': notification.created_at.isoformat(),
+    }
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from app.cache import CacheNamespace
+from app.models import Language, ServiceType
+
+
+# Référentiels (langues, types de service) gardés en mémoire du processus.
+# Le numéro de génération est dans le cache partagé : un changement (receivers)
+# le supprime et chaque processus recharge ses copies à la lecture suivante.
+# LOCAL_TIMEOUT borne la dérive si le cache n'est pas partagé entre processus.
+LOCAL_TIMEOUT = 5 * 60
+
+reference_data = CacheNamespace('reference_data')
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+def get_generation():
+    return reference_data.get_version('generation')
+
+
+def _load_snapshot(generation):
+    return {
+        'generation': generation,
+        'loaded_at': time.monotonic(),
+        'languages': {language.pk: language for language in Language.objects.all()},
+        'service_types': {service_type.pk: service_type for service_type in ServiceType.objects.order_by('pk')},
+    }
+
+
+def get_snapshot():
+    """Toutes les langues et tous les types de service (par id), rechargés si la génération a changé"""
+    global _snapshot
+    generation = get_generation()
+    snapshot = _snapshot
+    if (
+        snapshot is None
+        or snapshot['generation'] != generation
+        or time.monotonic() - snapshot['loaded_at'] > LOCAL_TIMEOUT
+    ):
+        with _lock:
+            snapshot = _snapshot
+            if snapshot is None or snapshot['generation'] != generation or (
+                time.monotonic() - snapshot['loaded_at'] > LOCAL_TIMEOUT
+            ):
+                snapshot = _snapshot = _load_snapshot(generation)
+    return snapshot
+
+
+def get_active_languages():
+    """Langues actives, triées par nom (ordre du modèle). Instances partagées : ne pas modifier"""
+    return [language for language in get_snapshot()['languages'].values() if language.is_active]
+
+
+def get_active_service_types():
+    """Types de service actifs. Instances partagées : ne pas modifier"""
+    return [service_type for service_type in get_snapshot()['service_types'].values() if service_type.active]
+
+
+def attach_reference_data(objects, languages=('source_language', 'target_language'), service_types=('service_type',)):
+    """
+    Renseigne les clés étrangères vers les référentiels depuis le cache local,
+    à la place d'un select_related (aucune jointure ni requête). Retourne une liste.
+    """
+    objects = list(objects)
+    if not objects:
+        return objects
+    snapshot = get_snapshot()
+    model = type(objects[0])
+    relations = [(name, snapshot['languages']) for name in languages]
+    relations += [(name, snapshot['service_types']) for name in service_types]
+    for name, instances in relations:
+        field = model._meta.get_field(name)
+        for obj in objects:
+            instance = instances.get(getattr(obj, field.attname))
+            if instance is not None:
+                field.set_cached_value(obj, instance)
+    return objects
+
+
+def invalidate_reference_data():
+    """
+    Nouvelle génération tout de suite (lectures dans la transaction en cours)
+    et après commit (un processus a pu recharger l'ancien état entre-temps)
+    """
+    reference_data.bump('generation')
+    reference_data.bump_on_commit('generation')
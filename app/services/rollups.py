@@ -0,0 +1,198 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from app.models import Assignment, InterpreterDailyRollup, Payment
+from app.utils.datetime_handlers import DateTimeHandler
+
+
+COUNT_FIELDS = [
+    'assignments_count', 'pending_count', 'confirmed_count', 'in_progress_count',
+    'completed_count', 'cancelled_count', 'no_show_count',
+    'payments_count', 'payments_completed_count',
+]
+DECIMAL_FIELDS = ['completed_hours', 'earnings', 'payments_completed', 'payments_pending']
+ROLLUP_FIELDS = COUNT_FIELDS + DECIMAL_FIELDS
+
+
+def local_day(value):
+    """Jour local (America/New_York) d'un datetime"""
+    return timezone.localtime(value).date()
+
+
+def _empty_values():
+    values = {field: 0 for field in COUNT_FIELDS}
+    values.update({field: Decimal('0.00') for field in DECIMAL_FIELDS})
+    return values
+
+
+def _merge(values, row):
+    for field in ROLLUP_FIELDS:
+        if row.get(field) is not None:
+            values[field] = row[field]
+    return values
+
+
+def _assignment_aggregates():
+    completed = Q(status=Assignment.Status.COMPLETED)
+    return {
+        'assignments_count': Count('id'),
+        'pending_count': Count('id', filter=Q(status=Assignment.Status.PENDING)),
+        'confirmed_count': Count('id', filter=Q(status=Assignment.Status.CONFIRMED)),
+        'in_progress_count': Count('id', filter=Q(status=Assignment.Status.IN_PROGRESS)),
+        'completed_count': Count('id', filter=completed),
+        'cancelled_count': Count('id', filter=Q(status=Assignment.Status.CANCELLED)),
+        'no_show_count': Count('id', filter=Q(status=Assignment.Status.NO_SHOW)),
+        'completed_hours': Sum('duration_hours', filter=completed),
+        'earnings': Sum('total_interpreter_payment', filter=completed),
+    }
+
+
+def _payment_aggregates():
+    completed = Q(status=Payment.Status.COMPLETED)
+    return {
+        'payments_count': Count('id'),
+        'payments_completed_count': Count('id', filter=completed),
+        'payments_completed': Sum('amount', filter=completed),
+        'payments_pending': Sum('amount', filter=Q(status=Payment.Status.PENDING)),
+    }
+
+
+def _interpreter_payments():
+    return Payment.objects.filter(
+        payment_type=Payment.PaymentType.INTERPRETER_PAYMENT,
+        assignment__interpreter__isnull=False
+    )
+
+
+def refresh_daily_rollup(interpreter_id, day):
+    """
+    Recalcule la ligne d'agrégats d'un interprète pour un jour local.
+    Ne lit que les missions/paiements de ce jour (index sur interpreter + start_time).
+    """
+    start, end = DateTimeHandler.day_range(day)
+    values = _empty_values()
+    _merge(values, Assignment.objects.filter(
+        interpreter_id=interpreter_id,
+        start_time__gte=start,
+        start_time__lt=end
+    ).aggregate(**_assignment_aggregates()))
+    _merge(values, _interpreter_payments().filter(
+        assignment__interpreter_id=interpreter_id,
+        payment_date__gte=start,
+        payment_date__lt=end
+    ).aggregate(**_payment_aggregates()))
+
+    if not values['assignments_count'] and not values['payments_count']:
+        InterpreterDailyRollup.objects.filter(interpreter_id=interpreter_id, day=day).delete()
+        return None
+
+    rollup, _ = InterpreterDailyRollup.objects.update_or_create(
+        interpreter_id=interpreter_id,
+        day=day,
+        defaults=values
+    )
+    return rollup
+
+
+def schedule_rollup_refresh(keys):
+    """
+    Planifie (après commit) le recalcul des jours touchés.
+    keys : couples (interpreter_id, datetime).
+    """
+    days = {
+        (interpreter_id, local_day(moment))
+        for interpreter_id, moment in keys
+        if interpreter_id is not None and moment is not None
+    }
+    if not days:
+        return
+
+    def refresh():
+        for interpreter_id, day in days:
+            refresh_daily_rollup(interpreter_id, day)
+
+    transaction.on_commit(refresh)
+
+
+def rebuild_daily_rollups(start_day, end_day, interpreter_ids=None):
+    """
+    Reconstruit les agrégats de la période [start_day, end_day] avec deux
+    GROUP BY (missions, paiements). Retourne le nombre de lignes créées.
+    """
+    tz = timezone.get_current_timezone()
+    start, end = DateTimeHandler.day_range(start_day, end_day)
+
+    assignments = Assignment.objects.filter(
+        interpreter__isnull=False,
+        start_time__gte=start,
+        start_time__lt=end
+    )
+    payments = _interpreter_payments().filter(payment_date__gte=start, payment_date__lt=end)
+    rollups = InterpreterDailyRollup.objects.filter(day__gte=start_day, day__lte=end_day)
+    if interpreter_ids:
+        assignments = assignments.filter(interpreter_id__in=interpreter_ids)
+        payments = payments.filter(assignment__interpreter_id__in=interpreter_ids)
+        rollups = rollups.filter(interpreter_id__in=interpreter_ids)
+
+    rows = {}
+    assignment_rows = assignments.annotate(
+        day=TruncDate('start_time', tzinfo=tz)
+    ).values('interpreter_id', 'day').annotate(**_assignment_aggregates()).order_by()
+    for row in assignment_rows:
+        key = (row['interpreter_id'], row['day'])
+        _merge(rows.setdefault(key, _empty_values()), row)
+
+    payment_rows = payments.annotate(
+        day=TruncDate('payment_date', tzinfo=tz)
+    ).values('assignment__interpreter_id', 'day').annotate(**_payment_aggregates()).order_by()
+    for row in payment_rows:
+        key = (row['assignment__interpreter_id'], row['day'])
+        _merge(rows.setdefault(key, _empty_values()), row)
+
+    with transaction.atomic():
+        rollups.delete()
+        InterpreterDailyRollup.objects.bulk_create(
+            [
+                InterpreterDailyRollup(interpreter_id=interpreter_id, day=day, **values)
+                for (interpreter_id, day), values in rows.items()
+            ],
+            batch_size=1000
+        )
+    return len(rows)
+
+
+def get_rollup_totals(queryset):
+    """Somme de tous les compteurs d'un queryset d'InterpreterDailyRollup"""
+    totals = queryset.aggregate(**{field: Sum(field) for field in ROLLUP_FIELDS})
+    return _merge(_empty_values(), totals)
+
+
+def _series_rows(queryset, trunc):
+    return queryset.annotate(
+        period=trunc
+    ).values('period').annotate(
+        **{field: Sum(field) for field in ROLLUP_FIELDS}
+    ).order_by('period')
+
+
+def get_rollup_series(queryset, trunc):
+    """
+    Regroupe les agrégats journaliers par période (TruncMonth('day'),
+    TruncYear('day')...). Chaque élément contient 'period' et les sommes.
+    """
+    return [
+        _merge({'period': row['period'], **_empty_values()}, row)
+        for row in _series_rows(queryset, trunc)
+    ]
+
+
+async def aget_rollup_series(queryset, trunc):
+    """Version async (ORM async) de get_rollup_series"""
+    return [
+        _merge({'period': row['period'], **_empty_values()}, row)
+        async for row in _series_rows(queryset, trunc)
+    ]
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import ExtractWeekDay
+from django.utils import timezone
+
+from app.models import Assignment, QuoteRequest
+
+
+def get_period_bounds(now=None):
+    """
+    Retourne les bornes (début de semaine, début de mois, il y a 30 jours)
+    calculées dans le fuseau local (America/New_York).
+    """
+    now = timezone.localtime(now or timezone.now())
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        'now': now,
+        'week_start': start_of_day - timedelta(days=now.weekday()),
+        'month_start': start_of_day.replace(day=1),
+        'thirty_days_ago': now - timedelta(days=30),
+    }
+
+
+def get_assignment_stats(interpreter, now=None):
+    """
+    Calcule en une seule requête (agrégation conditionnelle) toutes les
+    statistiques de missions et de gains d'un interprète.
+
+    Les gains correspondent au total_interpreter_payment des missions
+    complétées, rattachées à la période par leur start_time.
+    """
+    bounds = get_period_bounds(now)
+    completed = Q(status=Assignment.Status.COMPLETED)
+
+    stats = Assignment.objects.filter(interpreter=interpreter).aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status=Assignment.Status.PENDING)),
+        confirmed=Count('id', filter=Q(status=Assignment.Status.CONFIRMED)),
+        upcoming=Count('id', filter=Q(
+            status=Assignment.Status.CONFIRMED,
+            start_time__gt=bounds['now']
+        )),
+        in_progress=Count('id', filter=Q(status=Assignment.Status.IN_PROGRESS)),
+        completed=Count('id', filter=completed),
+        completed_recent=Count('id', filter=completed & Q(
+            completed_at__gte=bounds['thirty_days_ago']
+        )),
+        paid=Count('id', filter=completed & Q(is_paid=True)),
+        weekly_earnings=Sum('total_interpreter_payment', filter=completed & Q(
+            start_time__gte=bounds['week_start']
+        )),
+        monthly_earnings=Sum('total_interpreter_payment', filter=completed & Q(
+            start_time__gte=bounds['month_start']
+        )),
+        recent_earnings=Sum('total_interpreter_payment', filter=completed & Q(
+            completed_at__gte=bounds['thirty_days_ago']
+        )),
+        lifetime_earnings=Sum('total_interpreter_payment', filter=completed),
+        weekly_hours=Sum('duration_hours', filter=completed & Q(
+            start_time__gte=bounds['week_start']
+        )),
+        monthly_hours=Sum('duration_hours', filter=completed & Q(
+            start_time__gte=bounds['month_start']
+        )),
+        lifetime_hours=Sum('duration_hours', filter=completed),
+        average_rating=Avg('assignmentfeedback__rating', filter=completed),
+    )
+
+    for key in ('weekly_earnings', 'monthly_earnings', 'recent_earnings', 'lifetime_earnings',
+                'weekly_hours', 'monthly_hours', 'lifetime_hours'):
+        if stats[key] is None:
+            stats[key] = Decimal('0.00')
+    stats['average_rating'] = stats['average_rating'] or 0
+    stats['unpaid'] = stats['completed'] - stats['paid']
+    stats['completion_rate'] = (
+        stats['completed'] / stats['total'] * 100 if stats['total'] else 0
+    )
+    stats['week_start'] = bounds['week_start']
+    stats['month_start'] = bounds['month_start']
+    return stats
+
+
+def get_quote_status_counts(queryset):
+    """
+    Nombre de demandes de devis par statut, en une requête groupée
+    (GROUP BY status) sur un queryset de QuoteRequest déjà filtré.
+    """
+    counts = dict.fromkeys(QuoteRequest.Status.values, 0)
+    counts.update(queryset.order_by().values_list('status').annotate(count=Count('id')))
+    return counts
+
+
+WEEKDAY_LABELS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def get_hours_totals(queryset):
+    """
+    Agrège côté base le nombre de missions, les heures et les gains
+    d'un queryset d'Assignment.
+    """
+    totals = queryset.aggregate(
+        count=Count('id'),
+        hours=Sum('duration_hours'),
+        earnings=Sum('total_interpreter_payment'),
+    )
+    totals['hours'] = totals['hours'] or Decimal('0.00')
+    totals['earnings'] = totals['earnings'] or Decimal('0.00')
+    totals['average_hours'] = (
+        totals['hours'] / totals['count'] if totals['count'] else Decimal('0.00')
+    )
+    return totals
+
+
+def get_hours_by_weekday(queryset, date_field='start_time', hours_field='duration_hours'):
+    """
+    Retourne la répartition des heures par jour de la semaine (lundi en
+    premier), calculée avec un GROUP BY sur le jour local de date_field.
+    """
+    rows = queryset.annotate(
+        weekday=ExtractWeekDay(date_field)
+    ).values('weekday').annotate(
+        hours=Sum(hours_field)
+    ).order_by()
+
+    # ExtractWeekDay : 1 = dimanche ... 7 = samedi
+    hours = {(row['weekday'] + 5) % 7: float(row['hours'] or 0) for row in rows}
+    return [
+        {'day': label, 'hours': hours.get(index, 0)}
+        for index, label in enumerate(WEEKDAY_LABELS)
+    ]
@@ -0,0 +1,91 @@
+from django.db.models import Count
+
+from app.cache import CacheNamespace
+from app.models import AssignmentNotification, Notification, User
+
+
+# Compteurs de non-lus par utilisateur, lus par les badges (polling) sans requête.
+# Mis à jour à l'écriture (receivers, vues "tout marquer comme lu") ; le délai
+# d'expiration et reconcile_unread_counters bornent toute dérive.
+ASSIGNMENTS = 'assignments'
+NOTIFICATIONS = 'notifications'
+UNREAD_COUNTER_TIMEOUT = 60 * 60
+# Compteurs vérifiés par lecture groupée du cache lors du réalignement
+RECONCILE_BATCH_SIZE = 1000
+
+counters = CacheNamespace('unread', UNREAD_COUNTER_TIMEOUT)
+
+
+def _unread_queryset(kind):
+    if kind == ASSIGNMENTS:
+        return AssignmentNotification.objects.filter(is_read=False), 'interpreter__user_id'
+    return Notification.objects.filter(read=False), 'recipient_id'
+
+
+def get_counter_key(kind, user_id):
+    return (kind, user_id)
+
+
+def get_unread_count(kind, user_id):
+    """Nombre de non-lus (compté en base seulement si le compteur est absent)"""
+    key = get_counter_key(kind, user_id)
+    count = counters.get(key)
+    if count is None:
+        queryset, user_field = _unread_queryset(kind)
+        count = queryset.filter(**{user_field: user_id}).count()
+        counters.add(key, count)
+    return count
+
+
+def adjust_unread_count(kind, user_id, delta):
+    """
+    Incrémente / décrémente un compteur déjà en cache. Un compteur absent
+    n'est pas créé : il sera compté en base à la prochaine lecture.
+    """
+    if not user_id or not delta:
+        return
+    key = get_counter_key(kind, user_id)
+    try:
+        count = counters.incr(key, delta)
+    except ValueError:
+        return
+    if count < 0:
+        counters.delete(key)
+
+
+def reset_unread_count(kind, user_id):
+    """Après un "tout marquer comme lu" (update() sans signaux)"""
+    counters.set(get_counter_key(kind, user_id), 0)
+
+
+def invalidate_unread_count(kind, user_id):
+    if user_id:
+        counters.delete(get_counter_key(kind, user_id))
+
+
+def reconcile_unread_counters(batch_size=RECONCILE_BATCH_SIZE):
+    """
+    Réaligne les compteurs en cache sur la base. Seuls les compteurs présents
+    sont vérifiés, et un compteur qui diverge est supprimé (recompté à la
+    prochaine lecture) plutôt que réécrit : un adjust_unread_count survenu
+    entre le comptage et l'écriture ne peut pas être écrasé, et le délai
+    d'expiration n'est pas prolongé. Retourne le nombre de compteurs invalidés.
+    """
+    user_ids = list(User.objects.filter(is_active=True).values_list('pk', flat=True))
+    invalidated = 0
+    for kind in (ASSIGNMENTS, NOTIFICATIONS):
+        queryset, user_field = _unread_queryset(kind)
+        for start in range(0, len(user_ids), batch_size):
+            cached = counters.get_many(
+                [get_counter_key(kind, user_id) for user_id in user_ids[start:start + batch_size]]
+            )
+            if not cached:
+                continue
+            counts = dict(
+                queryset.filter(**{f'{user_field}__in': [user_id for _, user_id in cached]})
+                .values_list(user_field).annotate(count=Count('pk')).order_by()
+            )
+            stale = [key for key, count in cached.items() if count != counts.get(key[1], 0)]
+            counters.delete_many(stale)
+            invalidated += len(stale)
+    return invalidated
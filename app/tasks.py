@@ -8,7 +8,9 @@ from celery import shared_task
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
+from django.db import transaction
 from datetime import timedelta
+from smtplib import SMTPException
 
 
 @shared_task
@@ -135,4 +137,175 @@ def send_quote_request_status_email(quote_request_id):
         )
         
     except Exception as e:
-        print(f"Error sending quote request status email: {str(e)}")
\ No newline at end of file
+        print(f"Error sending quote request status email: {str(e)}")
+
+
+@shared_task
+def reconcile_unread_counters():
+    """Réaligne périodiquement les compteurs de non-lus en cache sur la base"""
+    from .services.unread_counters import reconcile_unread_counters as reconcile
+    return reconcile()
+
+
+# Emails hors du cycle requête / réponse : les vues enregistrent en base puis
+# mettent en file (enqueue_on_commit), avec les identifiants seulement ; la
+# tâche relit les objets et rend les templates. Un serveur SMTP lent ou en
+# erreur ne bloque plus de worker web ; les erreurs réseau sont réessayées.
+# Un email par tâche : un nouvel essai ne renvoie pas les emails déjà partis.
+EMAIL_TASK_OPTIONS = {
+    'autoretry_for': (SMTPException, OSError),
+    'retry_backoff': 30,
+    'max_retries': 3,
+}
+
+
+def enqueue_on_commit(task, *args):
+    """
+    Met la tâche en file après le commit de la transaction en cours (tout de
+    suite hors transaction). Une file indisponible est journalisée par Django
+    (robust) sans faire échouer la réponse : l'écriture est déjà validée.
+    """
+    transaction.on_commit(lambda: task.delay(*args), robust=True)
+
+
+def _get_assignment(assignment_id):
+    from .models import Assignment
+    return Assignment.objects.select_related(
+        'interpreter__user', 'service_type', 'source_language', 'target_language'
+    ).get(pk=assignment_id)
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_public_quote_confirmation_email(quote_request_id):
+    """Accusé de réception au demandeur d'un devis public"""
+    from .models import PublicQuoteRequest
+    quote_request = PublicQuoteRequest.objects.get(pk=quote_request_id)
+    context = {
+        'quote_request': quote_request,
+        'name': quote_request.full_name,
+    }
+    send_mail(
+        subject='Quote Request Received - DBD I&T',
+        message=render_to_string('emails/quote_request_confirmation.txt', context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[quote_request.email],
+        html_message=render_to_string('emails/quote_request_confirmation.html', context),
+        fail_silently=False,
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_public_quote_staff_email(quote_request_id, admin_url):
+    """Notification de l'équipe pour un devis public (admin_url : lien absolu vers l'admin)"""
+    from .models import PublicQuoteRequest
+    quote_request = PublicQuoteRequest.objects.get(pk=quote_request_id)
+    context = {
+        'quote_request': quote_request,
+        'admin_url': admin_url,
+    }
+    send_mail(
+        subject=f'New Quote Request: {quote_request.company_name}',
+        message=render_to_string('emails/quote_request_notification.txt', context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[settings.QUOTE_NOTIFICATION_EMAIL],
+        html_message=render_to_string('emails/quote_request_notification.html', context),
+        fail_silently=False,
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_contact_confirmation_email(contact_id):
+    """Accusé de réception à l'expéditeur du formulaire de contact"""
+    from .models import ContactMessage
+    contact = ContactMessage.objects.get(pk=contact_id)
+    send_mail(
+        subject='Thank you for contacting DBD I&T',
+        message=f"""Dear {contact.name},
+
+Thank you for contacting DBD I&T. We have received your message and will get back to you shortly.
+
+Your message details:
+Subject: {contact.subject}
+Reference Number: #{contact.id}
+
+Best regards,
+DBD I&T Team""",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[contact.email],
+        fail_silently=False,
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_contact_staff_email(contact_id, admin_url):
+    """Notification de l'équipe pour un message de contact"""
+    from .models import ContactMessage
+    contact = ContactMessage.objects.get(pk=contact_id)
+    send_mail(
+        subject=f'New Contact Form Submission: {contact.subject}',
+        message=f"""New contact form submission received:
+
+From: {contact.name} <{contact.email}>
+Subject: {contact.subject}
+
+Message:
+{contact.message}
+
+View in admin panel: {admin_url}""",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[settings.CONTACT_NOTIFICATION_EMAIL],
+        fail_silently=False,
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_confirmation_email(assignment_id):
+    """Confirmation (avec ICS) à l'interprète qui accepte une mission"""
+    from .views import send_confirmation_email
+    send_confirmation_email(_get_assignment(assignment_id))
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_admin_notification_email(assignment_id):
+    """Notification des administrateurs : mission acceptée"""
+    from .views import send_admin_notification_email
+    send_admin_notification_email(_get_assignment(assignment_id))
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_completion_email(assignment_id):
+    """Confirmation de fin de mission à l'interprète"""
+    from .views import send_completion_email
+    send_completion_email(_get_assignment(assignment_id))
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_notification_email(assignment_id, email_type, site_url):
+    """Email de statut de mission (AssignmentAdminMixin) ; une erreur SMTP relance la tâche"""
+    from .mixins.assignment_mixins import AssignmentAdminMixin
+    return AssignmentAdminMixin().deliver_assignment_email(
+        site_url, _get_assignment(assignment_id), email_type, fail_silently=False
+    )
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_response_email(assignment_id, action, interpreter_id):
+    """Réponse par lien (accept / decline) : confirmation à l'interprète"""
+    from .assignment_views import AssignmentResponseBaseMixin
+    from .models import Interpreter
+    assignment = _get_assignment(assignment_id)
+    if action == 'accepted':
+        AssignmentResponseBaseMixin().send_confirmation_to_interpreter(assignment)
+    else:
+        # L'interprète a été retiré de la mission : chargé à part
+        interpreter = Interpreter.objects.select_related('user').get(pk=interpreter_id)
+        AssignmentResponseBaseMixin().send_decline_confirmation(assignment, interpreter)
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_assignment_response_admin_email(assignment_id, action, interpreter_id):
+    """Réponse par lien (accept / decline) : notification des administrateurs"""
+    from .assignment_views import AssignmentResponseBaseMixin
+    from .models import Interpreter
+    interpreter = Interpreter.objects.select_related('user').get(pk=interpreter_id)
+    AssignmentResponseBaseMixin().notify_admin(_get_assignment(assignment_id), action, interpreter)
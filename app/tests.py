@@ -1,3 +1,1299 @@
-from django.test import TestCase
+import asyncio
+import itertools
+import json
+import re
+import socketserver
+import threading
+from email import message_from_bytes
+from smtplib import SMTPException
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib import admin
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.models import Session
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.admin import CustomAssignmentForm
+from app.backends import ProfileModelBackend
+from app.cache import CacheNamespace, get_metrics, reset_metrics
+from app.middleware import Actor
+from app.models import (
+    Assignment, AssignmentFeedback, AssignmentNotification, AuditLog, Client, ClientPayment,
+    ContactMessage, Deduction, Expense, FinancialTransaction, Interpreter, InterpreterDailyRollup,
+    InterpreterLanguage, InterpreterPayment, Language, Notification, Payment, PayrollDocument,
+    PublicQuoteRequest, Quote, QuoteRequest, Reimbursement, Service, ServiceType, User
+)
+from app.services.client_dashboard import get_client_snapshot, get_snapshot_key
+from app.services.conflicts import find_batch_conflicts, find_conflicts
+from app.services.events import LocalEventBus, format_sse, get_event_bus, get_user_channel, publish_event
+from app.services.matching import find_matching_interpreters, get_language_index, invalidate_language_index
+from app.services.reference_data import get_snapshot
+from app.services.rollups import ROLLUP_FIELDS, local_day, rebuild_daily_rollups
+from app.services.unread_counters import (
+    ASSIGNMENTS, NOTIFICATIONS, counters, get_counter_key, get_unread_count, reconcile_unread_counters
+)
+from app.tasks import send_assignment_notification_email
+from app.urls import urlpatterns
+from app.views import AssignmentListView
+
+
+class FixtureFactory:
+    """
+    Génère un jeu de données cohérent : référentiels, un client, un interprète,
+    un administrateur, puis `populate(n)` ajoute n lignes de chaque objet métier
+    rattachées à ces comptes (pour mesurer l'effet du volume sur les requêtes).
+    """
+
+    def __init__(self):
+        self.sequence = itertools.count(1)
+        self.days = itertools.count()
+        self.now = timezone.now()
+        self.english = Language.objects.create(name='English', code='en')
+        self.spanish = Language.objects.create(name='Spanish', code='es')
+        self.service_type = ServiceType.objects.create(
+            name='Medical', description='Medical', base_rate=Decimal('50'), cancellation_policy='24h'
+        )
+        self.admin_user = User.objects.create_superuser(
+            username='admin', email='admin@example.com', password='pw', role='ADMIN'
+        )
+        self.interpreter_user = self.user('interpreter', 'INTERPRETER')
+        self.interpreter = Interpreter.objects.create(
+            user=self.interpreter_user, address='1 Main St', city='Boston', state='MA', zip_code='02116'
+        )
+        for language in (self.english, self.spanish):
+            InterpreterLanguage.objects.create(
+                interpreter=self.interpreter, language=language,
+                proficiency=InterpreterLanguage.Proficiency.NATIVE
+            )
+        self.client_user = self.user('client', 'CLIENT')
+        self.client = Client.objects.create(
+            user=self.client_user, company_name='Acme', address='2 Main St', city='Boston', state='MA',
+            zip_code='02116'
+        )
+
+    def next(self):
+        return next(self.sequence)
+
+    def user(self, username, role):
+        return User.objects.create_user(
+            username=username, email=f'{username}@example.com', password='pw', role=role
+        )
+
+    def transaction(self, transaction_type, amount):
+        return FinancialTransaction.objects.create(
+            type=transaction_type, amount=amount, description='Fixture', created_by=self.admin_user
+        )
+
+    def quote_request(self, status=QuoteRequest.Status.QUOTED):
+        return QuoteRequest.objects.create(
+            client=self.client, service_type=self.service_type, requested_date=self.now, duration=120,
+            location='Clinic', city='Boston', state='MA', zip_code='02116',
+            source_language=self.english, target_language=self.spanish, status=status
+        )
+
+    def quote(self, quote_request=None, status=Quote.Status.SENT):
+        return Quote.objects.create(
+            quote_request=quote_request or self.quote_request(), reference_number=f'Q-{self.next()}',
+            amount=Decimal('200'), valid_until=self.now.date() + timedelta(days=30), terms='Net 30',
+            status=status, created_by=self.admin_user
+        )
+
+    def assignment(self, status=Assignment.Status.CONFIRMED, days=0, hours=0, quote=None):
+        start = self.now + timedelta(days=days, hours=hours)
+        return Assignment.objects.create(
+            quote=quote, interpreter=self.interpreter, client_name='Acme',
+            client_email='client@example.com', service_type=self.service_type,
+            source_language=self.english, target_language=self.spanish,
+            start_time=start, end_time=start + timedelta(hours=2), location='Hospital', city='Boston',
+            state='MA', zip_code='02116', status=status, interpreter_rate=Decimal('50'),
+            total_interpreter_payment=Decimal('100'),
+            completed_at=start if status == Assignment.Status.COMPLETED else None
+        )
+
+    def payroll(self):
+        payroll = PayrollDocument.objects.create(
+            interpreter_name='Interpreter', document_number=f'PAY-{self.next()}',
+            document_date=self.now.date()
+        )
+        Service.objects.create(
+            payroll=payroll, date=self.now.date(), client='Acme', source_language='English',
+            target_language='Spanish', duration=Decimal('2'), rate=Decimal('50')
+        )
+        Reimbursement.objects.create(payroll=payroll, description='Parking', amount=Decimal('10'))
+        Deduction.objects.create(payroll=payroll, description='Advance', amount=Decimal('5'))
+        return payroll
+
+    def populate(self, n=1):
+        """
+        Ajoute n exemplaires de chaque objet métier. Les missions d'un même
+        exemplaire occupent un jour distinct, sans chevauchement.
+        """
+        for _ in range(n):
+            sequence = self.next()
+            day = next(self.days)
+            self.quote_request(status=QuoteRequest.Status.PENDING)
+            quote = self.quote()
+            confirmed = self.assignment(days=day, quote=quote)
+            self.assignment(status=Assignment.Status.PENDING, days=day, hours=3)
+            completed = self.assignment(status=Assignment.Status.COMPLETED, days=-1 - day)
+            AssignmentFeedback.objects.create(assignment=completed, rating=5, created_by=self.client_user)
+            AssignmentNotification.objects.create(assignment=confirmed, interpreter=self.interpreter)
+            Notification.objects.create(
+                recipient=self.interpreter_user, type=Notification.Type.ASSIGNMENT_OFFER,
+                title='New assignment', content='New assignment'
+            )
+            Notification.objects.create(
+                recipient=self.client_user, type=Notification.Type.QUOTE_READY,
+                title='Quote ready', content='Quote ready'
+            )
+            Payment.objects.create(
+                assignment=completed, payment_type=Payment.PaymentType.INTERPRETER_PAYMENT,
+                amount=Decimal('100'), payment_method='ACH', transaction_id=f'TX-{sequence}',
+                status=Payment.Status.COMPLETED
+            )
+            InterpreterPayment.objects.create(
+                transaction=self.transaction('EXPENSE', Decimal('100')), interpreter=self.interpreter,
+                assignment=completed, amount=Decimal('100'),
+                payment_method=InterpreterPayment.PaymentMethod.ACH, scheduled_date=self.now,
+                reference_number=f'IP-{sequence}'
+            )
+            ClientPayment.objects.create(
+                transaction=self.transaction('INCOME', Decimal('200')), client=self.client,
+                assignment=confirmed, quote=quote, amount=Decimal('200'), total_amount=Decimal('200'),
+                payment_method=ClientPayment.PaymentMethod.ACH, status=ClientPayment.Status.COMPLETED,
+                invoice_number=f'INV-{sequence}'
+            )
+            Expense.objects.create(
+                transaction=self.transaction('EXPENSE', Decimal('20')),
+                expense_type=Expense.ExpenseType.OPERATIONAL, amount=Decimal('20'), description='Supplies',
+                status=Expense.Status.PAID, date_incurred=self.now
+            )
+            ContactMessage.objects.create(
+                name='Visitor', email='visitor@example.com', subject='Hello', message='Hello'
+            )
+            PublicQuoteRequest.objects.create(
+                full_name='Visitor', email='visitor@example.com', phone='555-0100', company_name='Visitor Co',
+                source_language=self.english, target_language=self.spanish, service_type=self.service_type,
+                requested_date=self.now, duration=60, location='Office', city='Boston', state='MA',
+                zip_code='02116'
+            )
+            AuditLog.objects.create(
+                user=self.admin_user, action='UPDATE', model_name='Assignment',
+                object_id=str(confirmed.pk), changes={}
+            )
+            self.payroll()
+            # Autres comptes : les listes de l'admin et les recherches d'interprètes grossissent aussi
+            interpreter = Interpreter.objects.create(
+                user=self.user(f'interpreter-{sequence}', 'INTERPRETER'), address='3 Main St', city='Boston',
+                state='MA', zip_code='02116'
+            )
+            for language in (self.english, self.spanish):
+                InterpreterLanguage.objects.create(
+                    interpreter=interpreter, language=language,
+                    proficiency=InterpreterLanguage.Proficiency.FLUENT
+                )
+            Client.objects.create(
+                user=self.user(f'client-{sequence}', 'CLIENT'), company_name=f'Client {sequence}',
+                address='4 Main St', city='Boston', state='MA', zip_code='02116'
+            )
+
+
+def _mysql_full_scans(plan):
+    """Tables lues en entier (access_type ALL) sans aucun index utilisable"""
+    scans = []
+    if isinstance(plan, dict):
+        if plan.get('access_type') == 'ALL' and not plan.get('possible_keys'):
+            scans.append(plan.get('table_name'))
+        for value in plan.values():
+            scans.extend(_mysql_full_scans(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            scans.extend(_mysql_full_scans(value))
+    return scans
+
+
+# "SCAN app_x" (ou "SCAN TABLE app_x" selon la version), hors parcours d'index couvrant
+SQLITE_SCAN = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?! USING (?:COVERING )?INDEX)')
+
+
+def get_full_scans(queryset):
+    """
+    EXPLAIN du queryset -> tables parcourues sans index.
+
+    Sur MySQL, une table de test presque vide peut être lue en ALL même avec
+    un index adapté : seul un ALL sans possible_keys est compté. Sur SQLite
+    (développement), tout SCAN hors index.
+    """
+    if connection.vendor == 'mysql':
+        return _mysql_full_scans(json.loads(queryset.explain(format='json')))
+    return SQLITE_SCAN.findall(queryset.explain())
+
+
+class HotQueryIndexTests(TestCase):
+    """Chaque requête chaude de views.py / assignment_mixins.py doit passer par un index"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+        cls.user = cls.factory.interpreter_user
+        cls.interpreter = cls.factory.interpreter
+        cls.client_profile = cls.factory.client
+        cls.assignment = Assignment.objects.filter(status=Assignment.Status.CONFIRMED).order_by('pk').first()
+
+    def get_hot_queries(self):
+        now = timezone.now()
+        return {
+            # Centre de notifications et badges
+            'notifications_unread': Notification.objects.filter(
+                recipient=self.user, read=False
+            ).order_by('-created_at'),
+            'notifications_page': Notification.objects.filter(
+                recipient=self.user
+            ).order_by('-created_at', '-id')[:16],
+            'assignment_notifications_unread': AssignmentNotification.objects.filter(
+                interpreter=self.interpreter, is_read=False
+            ),
+            # QuoteRequestListView
+            'quote_list': QuoteRequest.objects.filter(
+                client=self.client_profile
+            ).order_by('-created_at', '-id')[:11],
+            'quote_status_counts': QuoteRequest.objects.filter(
+                client=self.client_profile
+            ).values('status').annotate(count=Count('id')).order_by(),
+            'quote_list_by_status': QuoteRequest.objects.filter(
+                client=self.client_profile, status=QuoteRequest.Status.PENDING
+            ).order_by('-created_at', '-id')[:11],
+            # Tableau de bord / liste des missions interprète
+            'assignments_by_status': Assignment.objects.filter(
+                interpreter=self.interpreter, status=Assignment.Status.CONFIRMED
+            ).order_by('start_time'),
+            'calendar_range': Assignment.objects.filter(
+                interpreter=self.interpreter, start_time__gte=now, start_time__lt=now + timedelta(days=31)
+            ),
+            'daily_rollups': InterpreterDailyRollup.objects.filter(
+                interpreter=self.interpreter, day__gte=now.date().replace(day=1)
+            ),
+            # Paiements
+            'recent_payments': Payment.objects.filter(
+                assignment__interpreter=self.interpreter,
+                payment_type=Payment.PaymentType.INTERPRETER_PAYMENT
+            ).order_by('-payment_date')[:5],
+            'assignment_payments': Payment.objects.filter(
+                assignment=self.assignment,
+                payment_type=Payment.PaymentType.INTERPRETER_PAYMENT,
+                status=Payment.Status.COMPLETED
+            ).order_by('-payment_date'),
+            'latest_interpreter_payment': InterpreterPayment.objects.filter(
+                assignment=self.assignment
+            ).order_by('-created_at')[:1],
+            # Historique d'audit d'une mission
+            'audit_history': AuditLog.objects.filter(
+                model_name='Assignment', object_id=str(self.assignment.pk)
+            ).order_by('timestamp'),
+            # LoginForm.clean
+            'login_by_email': User.objects.filter(email='interpreter@example.com'),
+        }
+
+    def test_hot_queries_use_an_index(self):
+        if connection.vendor not in ('mysql', 'sqlite'):
+            self.skipTest(f"EXPLAIN non interprété pour {connection.vendor}")
+        for name, queryset in self.get_hot_queries().items():
+            with self.subTest(query=name):
+                self.assertEqual(get_full_scans(queryset), [], f"Full table scan in {name}")
+
+
+# Budget de requêtes SQL par route (nom d'URL de app/urls.py) :
+# (rôle qui l'exerce, méthode HTTP, nombre maximal de requêtes).
+# Les deux premières requêtes d'une route authentifiée sont la session et l'utilisateur.
+ROUTE_BUDGETS = {
+    # Pages publiques et authentification
+    'home': (None, 'get', 0),
+    'quote_request_success': (None, 'get', 0),
+    'contact': (None, 'get', 0),
+    'contact_success': (None, 'get', 0),
+    'login': (None, 'get', 0),
+    'choose_registration': (None, 'get', 0),
+    'logout': ('client', 'post', 4),
+    'client_register': (None, 'get', 0),
+    'client_register_step2': (None, 'get', 0),
+    'client_register_success': (None, 'get', 0),
+    'password_reset': (None, 'get', 0),
+    'password_reset_done': (None, 'get', 0),
+    'password_reset_confirm': (None, 'get', 1),
+    'password_reset_complete': (None, 'get', 0),
+    'interpreter_registration_step1': (None, 'get', 0),
+    'interpreter_registration_step2': (None, 'get', 0),
+    'interpreter_registration_step3': (None, 'get', 0),
+    'assignment-accept': (None, 'get', 0),
+    'assignment-decline': (None, 'get', 0),
+    'new_interpreter_appointments': (None, 'get', 0),
+    # Client
+    'notification_preferences': ('client', 'get', 6),
+    'client_dashboard': ('client', 'get', 2),
+    'client_quote_list': ('client', 'get', 4),
+    'client_quote_create': ('client', 'get', 2),
+    'client_quote_accept': ('client', 'post', 6),
+    'client_quote_reject': ('client', 'post', 6),
+    'client_profile_edit': ('client', 'get', 3),
+    'client_change_password': ('client', 'get', 2),
+    # Interprète
+    'interpreter_dashboard': ('interpreter', 'get', 7),
+    'interpreter_schedule': ('interpreter', 'get', 6),
+    'get_calendar_assignments': ('interpreter', 'get', 3),
+    'interpreter_assignments': ('interpreter', 'get', 4),
+    'assignment_detail': ('interpreter', 'get', 3),
+    'accept_assignment': ('interpreter', 'post', 6),
+    'reject_assignment': ('interpreter', 'post', 6),
+    'start_assignment': ('interpreter', 'post', 6),
+    'complete_assignment': ('interpreter', 'post', 6),
+    'mark-assignment-complete': ('interpreter', 'post', 12),
+    'translator_earnings': ('interpreter', 'get', 6),
+    'earnings_data': ('interpreter', 'get', 3),
+    'earnings_data_year': ('interpreter', 'get', 3),
+    'interpreter_payments': ('interpreter', 'get', 4),
+    'new_interpreter_dashboard': ('interpreter', 'get', 5),
+    'new_interpreter_calendar': ('interpreter', 'get', 4),
+    'interpreter_calendar': ('interpreter', 'get', 4),
+    'calendar_data_api': ('interpreter', 'get', 3),
+    'daily_missions_api': ('interpreter', 'get', 3),
+    'new_interpreter_stats': ('interpreter', 'get', 7),
+    # Notifications
+    'mark_notification_read': ('interpreter', 'post', 4),
+    'clear_all_notifications': ('interpreter', 'post', 3),
+    'unread_notifications_count': ('interpreter', 'get', 3),
+    'interpreter_notifications': ('interpreter', 'get', 4),
+    'notifications_api': ('interpreter', 'get', 3),
+    'notification_mark_read': ('interpreter', 'post', 4),
+    'notifications_mark_all_read': ('interpreter', 'post', 3),
+    'unread_assignments_count': ('interpreter', 'get', 3),
+    'mark_assignments_read': ('interpreter', 'post', 3),
+    # Paie
+    'payroll_create': ('admin', 'get', 0),
+    'payroll_detail': ('admin', 'get', 2),
+    'generate-pdf': ('admin', 'post', 0),
+}
+
+# Routes qui ne peuvent pas être mesurées telles quelles, avec la raison
+UNMEASURED_ROUTES = {
+    'event_stream': "flux SSE sans fin",
+    'client_quote_detail': "le template inverse l'URL inexistante 'quote_accept'",
+    'client_assignment_detail': "filtre Assignment sur un champ 'client' inexistant",
+    'interpreter_settings': "User n'a pas d'attribut phone_number",
+    'payroll_preview': "PayrollPreviewView n'a ni model ni queryset",
+    'export_document': "l'URL passe un argument 'format' que la vue n'accepte pas",
+}
+
+# Budget des listes de l'admin : par défaut, sauf exceptions (modèle -> budget)
+ADMIN_CHANGELIST_BUDGET = 5
+ADMIN_CHANGELIST_BUDGETS = {
+    'app.user': 6,
+    'app.client': 7,
+    'app.interpreter': 8,
+    'app.quoterequest': 6,
+    'app.assignment': 8,
+    'app.auditlog': 7,
+    'app.publicquoterequest': 9,
+    'app.payrolldocument': 7,
+    'django_apscheduler.djangojobexecution': 6,
+    'django_celery_beat.periodictask': 8,
+    'social_django.usersocialauth': 6,
+    'social_django.association': 6,
+}
+
+# Lignes ajoutées pour vérifier que le nombre de requêtes ne dépend pas du volume
+SCALE_ROWS = 5
+
+
+class QueryBudgetMixin:
+    """
+    Mesure les requêtes d'une route : cache vidé avant (sauf les référentiels,
+    chargés une fois par processus), écritures annulées après
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+        cls.users = {
+            'admin': cls.factory.admin_user,
+            'client': cls.factory.client_user,
+            'interpreter': cls.factory.interpreter_user,
+        }
+
+    def count_queries(self, role, method, url, data=None):
+        client = self.client_class()
+        if role:
+            client.force_login(self.users[role])
+        cache.clear()
+        get_snapshot()
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                response = getattr(client, method)(url, data or {})
+            transaction.set_rollback(True)
+        self.assertLess(response.status_code, 500, f"{method.upper()} {url}")
+        return len(queries)
+
+    def assert_budgets(self, measurements):
+        """measurements : nom -> (budget, fonction de mesure)"""
+        baseline = {name: measure() for name, (budget, measure) in measurements.items()}
+        self.factory.populate(SCALE_ROWS)
+        for name, (budget, measure) in measurements.items():
+            scaled = measure()
+            with self.subTest(route=name):
+                self.assertLessEqual(baseline[name], budget, f"{name}: over budget")
+                self.assertEqual(scaled, baseline[name], f"{name}: query count grows with rows")
+
+
+class RouteQueryBudgetTests(QueryBudgetMixin, TestCase):
+
+    def get_route_arguments(self, name):
+        """(kwargs d'URL, paramètres) d'une route, sur les premières données de la fabrique"""
+        today = timezone.localdate()
+        assignment = Assignment.objects.filter(status=Assignment.Status.CONFIRMED).order_by('pk').first()
+        pending = Assignment.objects.filter(status=Assignment.Status.PENDING).order_by('pk').first()
+        notification = Notification.objects.filter(
+            recipient=self.factory.interpreter_user
+        ).order_by('pk').first()
+        quote = Quote.objects.order_by('pk').first()
+        kwargs = {
+            'client_quote_accept': {'pk': quote.pk},
+            'client_quote_reject': {'pk': quote.pk},
+            'password_reset_confirm': {'uidb64': 'MQ', 'token': 'invalid-token'},
+            'assignment-accept': {'assignment_token': 'invalid-token'},
+            'assignment-decline': {'assignment_token': 'invalid-token'},
+            'assignment_detail': {'pk': assignment.pk},
+            'accept_assignment': {'pk': pending.pk},
+            'reject_assignment': {'pk': pending.pk},
+            'start_assignment': {'pk': assignment.pk},
+            'complete_assignment': {'pk': assignment.pk},
+            'mark-assignment-complete': {'assignment_id': assignment.pk},
+            'earnings_data_year': {'year': today.year},
+            'earnings_data': {'period': 'month'},
+            'calendar_data_api': {'year': today.year, 'month': today.month},
+            'daily_missions_api': {'date_str': today.isoformat()},
+            'notification_mark_read': {'pk': notification.pk},
+            'payroll_detail': {'pk': PayrollDocument.objects.order_by('pk').first().pk},
+        }.get(name, {})
+        data = {
+            'get_calendar_assignments': {
+                'start': (today - timedelta(days=7)).isoformat(),
+                'end': (today + timedelta(days=7)).isoformat(),
+            },
+            'mark_notification_read': {'notification_id': notification.pk},
+        }.get(name)
+        return kwargs, data
+
+    def test_every_route_has_a_budget(self):
+        names = {pattern.name for pattern in urlpatterns}
+        self.assertEqual(names - set(ROUTE_BUDGETS) - set(UNMEASURED_ROUTES), set())
+        self.assertEqual((set(ROUTE_BUDGETS) | set(UNMEASURED_ROUTES)) - names, set())
+
+    def test_route_query_budgets(self):
+        measurements = {}
+        for name, (role, method, budget) in ROUTE_BUDGETS.items():
+            def measure(name=name, role=role, method=method):
+                kwargs, data = self.get_route_arguments(name)
+                url = reverse(f'dbdint:{name}', kwargs=kwargs)
+                return self.count_queries(role, method, url, data)
+            measurements[name] = (budget, measure)
+        self.assert_budgets(measurements)
+
+
+class AdminChangelistQueryBudgetTests(QueryBudgetMixin, TestCase):
+
+    def test_changelist_query_budgets(self):
+        measurements = {}
+        for model in admin.site._registry:
+            label = f'{model._meta.app_label}.{model._meta.model_name}'
+            url = reverse(f'admin:{model._meta.app_label}_{model._meta.model_name}_changelist')
+            budget = ADMIN_CHANGELIST_BUDGETS.get(label, ADMIN_CHANGELIST_BUDGET)
+            measurements[label] = (budget, lambda url=url: self.count_queries('admin', 'get', url))
+        self.assert_budgets(measurements)
+
+
+class RollupMaintenanceTests(TestCase):
+    """Agrégats journaliers maintenus par les signaux : identiques à une reconstruction complète"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.other = Interpreter.objects.create(
+            user=cls.factory.user('other', 'INTERPRETER'), address='3 Main St', city='Boston', state='MA',
+            zip_code='02116'
+        )
+
+    def rollup_rows(self):
+        return list(
+            InterpreterDailyRollup.objects.order_by('interpreter_id', 'day')
+            .values('interpreter_id', 'day', *ROLLUP_FIELDS)
+        )
+
+    def payment(self, assignment, status=Payment.Status.COMPLETED):
+        return Payment.objects.create(
+            assignment=assignment, payment_type=Payment.PaymentType.INTERPRETER_PAYMENT,
+            amount=Decimal('100'), payment_method='ACH', transaction_id=f'TX-{self.factory.next()}',
+            status=status
+        )
+
+    def test_incremental_rollups_match_rebuild(self):
+        factory = self.factory
+        with self.captureOnCommitCallbacks(execute=True):
+            completed = factory.assignment(Assignment.Status.COMPLETED, days=-1)
+            confirmed = factory.assignment(Assignment.Status.CONFIRMED, days=1)
+            cancelled = factory.assignment(Assignment.Status.CONFIRMED, days=2)
+            paid = self.payment(completed)
+            pending = self.payment(confirmed, Payment.Status.PENDING)
+            removed = self.payment(cancelled, Payment.Status.PENDING)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            # Réaffectation : l'ancien interprète perd la mission, le nouveau la gagne
+            confirmed.interpreter = self.other
+            confirmed.save()
+            # Report : la mission change de jour et de statut
+            cancelled.start_time += timedelta(days=1)
+            cancelled.end_time += timedelta(days=1)
+            cancelled.status = Assignment.Status.CANCELLED
+            cancelled.save()
+            # Paiement déplacé d'une mission et d'un jour à l'autre
+            paid.assignment = confirmed
+            paid.payment_date -= timedelta(days=1)
+            paid.status = Payment.Status.PENDING
+            paid.save()
+            pending.status = Payment.Status.COMPLETED
+            pending.save()
+            removed.delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            unpaid = factory.assignment(Assignment.Status.PENDING, days=3)
+            unpaid.delete()
+
+        incremental = self.rollup_rows()
+        self.assertTrue(incremental)
+        self.assertEqual(
+            {row['interpreter_id'] for row in incremental}, {factory.interpreter.pk, self.other.pk}
+        )
+
+        start_day = local_day(factory.now - timedelta(days=3))
+        end_day = local_day(factory.now + timedelta(days=4))
+        rebuild_daily_rollups(start_day, end_day)
+        self.assertEqual(self.rollup_rows(), incremental)
+
+
+class ScheduleConflictTests(TestCase):
+    """Conflits d'horaire : chevauchement strict avec les missions engagées de l'interprète"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.booked = cls.factory.assignment(Assignment.Status.CONFIRMED, days=1)
+        cls.factory.assignment(Assignment.Status.CANCELLED, days=1)
+        cls.factory.assignment(Assignment.Status.PENDING, days=1, hours=4)
+
+    def window(self, hours, duration=2):
+        start = self.booked.start_time + timedelta(hours=hours)
+        return start, start + timedelta(hours=duration)
+
+    def test_strict_overlap(self):
+        before, touching, overlapping, pending_slot = find_conflicts(
+            self.factory.interpreter,
+            [self.window(-2), self.window(2), self.window(1), self.window(4)]
+        )
+        self.assertEqual(before, [])
+        self.assertEqual(touching, [])
+        self.assertEqual(overlapping, [self.booked])
+        # Missions en attente ou annulées : l'agenda n'est pas bloqué
+        self.assertEqual(pending_slot, [])
+
+    def test_exclude_ids(self):
+        window = [(self.booked.start_time, self.booked.end_time)]
+        self.assertEqual(find_conflicts(self.factory.interpreter, window), [[self.booked]])
+        self.assertEqual(
+            find_conflicts(self.factory.interpreter, window, exclude_ids=[self.booked.pk]), [[]]
+        )
+
+    def test_batch_conflicts(self):
+        def unsaved(hours):
+            start, end = self.window(hours)
+            return Assignment(interpreter=self.factory.interpreter, start_time=start, end_time=end)
+
+        first, second, free, existing = unsaved(10), unsaved(11), unsaved(20), unsaved(-1)
+        with self.assertNumQueries(1):
+            conflicts = find_batch_conflicts([first, second, free, existing])
+        self.assertEqual([assignment for assignment, _ in conflicts], [first, second, existing])
+        self.assertEqual([found for _, found in conflicts], [[second], [first], [self.booked]])
+
+    def test_admin_form_rejects_conflict(self):
+        start, end = self.window(1)
+        form = CustomAssignmentForm(instance=Assignment())
+        form.cleaned_data = {
+            'interpreter': self.factory.interpreter, 'status': Assignment.Status.PENDING,
+            'start_time': start, 'end_time': end,
+        }
+        with self.assertRaises(ValidationError) as raised:
+            form.clean()
+        self.assertIn(f'#{self.booked.pk}', str(raised.exception.message_dict['interpreter']))
+
+        # Mission modifiée sur son propre créneau : pas de conflit avec elle-même
+        form = CustomAssignmentForm(instance=self.booked)
+        form.cleaned_data = {
+            'interpreter': self.factory.interpreter, 'status': Assignment.Status.CONFIRMED,
+            'start_time': self.booked.start_time, 'end_time': self.booked.end_time,
+        }
+        self.assertEqual(form.clean()['start_time'], self.booked.start_time)
+
+
+class InterpreterFragmentCacheTests(TestCase):
+    """Fragments par interprète : servis depuis le cache, jamais périmés après un changement de mission"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.factory.interpreter_user)
+
+    def get_page(self, name):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(f'dbdint:{name}'))
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode(), len(queries)
+
+    def test_fragments_are_served_from_cache(self):
+        for name in ('new_interpreter_dashboard', 'new_interpreter_calendar', 'new_interpreter_stats'):
+            with self.subTest(page=name):
+                _, first_queries = self.get_page(name)
+                _, second_queries = self.get_page(name)
+                self.assertLess(second_queries, first_queries)
+
+    def test_status_change_invalidates_fragments(self):
+        pending = Assignment.objects.filter(status=Assignment.Status.PENDING).order_by('pk').first()
+        marker = f'id="mission-{pending.pk}"'
+        self.assertIn(marker, self.get_page('new_interpreter_dashboard')[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pending.status = Assignment.Status.CANCELLED
+            pending.save()
+        self.assertNotIn(marker, self.get_page('new_interpreter_dashboard')[0])
+
+    def test_payment_change_invalidates_fragments(self):
+        self.get_page('new_interpreter_stats')
+        _, cached_queries = self.get_page('new_interpreter_stats')
+
+        payment = Payment.objects.order_by('pk').first()
+        with self.captureOnCommitCallbacks(execute=True):
+            payment.status = Payment.Status.PENDING
+            payment.save()
+        _, queries = self.get_page('new_interpreter_stats')
+        self.assertGreater(queries, cached_queries)
+
+
+class ClientDashboardSnapshotTests(TestCase):
+    """Snapshot du dashboard client : version en cache, invalidée après commit sans écrire la ligne Client"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_quote_request_invalidates_snapshot(self):
+        client = self.factory.client
+        self.assertEqual(get_client_snapshot(client)['stats']['pending_quotes'], 1)
+        key = get_snapshot_key(client)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.factory.quote_request(status=QuoteRequest.Status.PENDING)
+        self.assertFalse([q for q in queries if q['sql'].startswith('UPDATE "app_client"')])
+        self.assertNotEqual(get_snapshot_key(client), key)
+        self.assertEqual(get_client_snapshot(client)['stats']['pending_quotes'], 2)
+
+    def test_assignment_save_invalidates_only_displayed_changes(self):
+        client = self.factory.client
+        assignment = Assignment.objects.get(quote__isnull=False)
+        key = get_snapshot_key(client)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                assignment.notes = 'Parking on site'
+                assignment.save()
+        self.assertEqual(get_snapshot_key(client), key)
+        self.assertFalse([q for q in queries if 'app_quote' in q['sql']])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assignment.status = Assignment.Status.CANCELLED
+            assignment.save()
+        self.assertNotEqual(get_snapshot_key(client), key)
+        self.assertEqual(get_client_snapshot(client)['stats']['active_assignments'], 0)
+
+    def test_payment_invalidates_snapshot(self):
+        client = self.factory.client
+        assignment = Assignment.objects.get(quote__isnull=False)
+        self.assertEqual(get_client_snapshot(client)['stats']['total_spent'], Decimal('0.00'))
+        key = get_snapshot_key(client)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Payment.objects.create(
+                assignment=assignment, payment_type=Payment.PaymentType.CLIENT_PAYMENT,
+                amount=Decimal('200'), payment_method='ACH', transaction_id='TX-CLIENT',
+                status=Payment.Status.COMPLETED
+            )
+        self.assertNotEqual(get_snapshot_key(client), key)
+        self.assertEqual(get_client_snapshot(client)['stats']['total_spent'], Decimal('200'))
+
+
+class UnreadCounterTests(TestCase):
+    """Compteurs de non-lus : deltas appliqués après commit, réalignement des seuls compteurs en cache"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+        cls.user = cls.factory.interpreter_user
+
+    def setUp(self):
+        cache.clear()
+        self.assertEqual(get_unread_count(NOTIFICATIONS, self.user.pk), 1)
+
+    def notify(self, recipient):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Notification.objects.create(
+                recipient=recipient, type=Notification.Type.SYSTEM, title='Update', content='Update'
+            )
+
+    def assert_counts(self, expected, user=None):
+        user = user or self.user
+        with self.assertNumQueries(0):
+            self.assertEqual(get_unread_count(NOTIFICATIONS, user.pk), expected)
+
+    def test_create_read_delete(self):
+        notification = self.notify(self.user)
+        self.assert_counts(2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notification.read = True
+            notification.save()
+        self.assert_counts(1)
+
+        unread = self.notify(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            unread.delete()
+        self.assert_counts(1)
+
+    def test_recipient_change_invalidates_both_counters(self):
+        client_user = self.factory.client_user
+        self.assertEqual(get_unread_count(NOTIFICATIONS, client_user.pk), 1)
+        notification = Notification.objects.get(pk=self.notify(self.user).pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notification.recipient = client_user
+            notification.save()
+        self.assertIsNone(counters.get(get_counter_key(NOTIFICATIONS, self.user.pk)))
+        self.assertIsNone(counters.get(get_counter_key(NOTIFICATIONS, client_user.pk)))
+        self.assertEqual(get_unread_count(NOTIFICATIONS, self.user.pk), 1)
+        self.assertEqual(get_unread_count(NOTIFICATIONS, client_user.pk), 2)
+
+    def test_assignment_offer_counter(self):
+        self.assertEqual(get_unread_count(ASSIGNMENTS, self.user.pk), 1)
+        assignment = self.factory.assignment(status=Assignment.Status.PENDING, days=30)
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = AssignmentNotification.objects.create(
+                assignment=assignment, interpreter=self.factory.interpreter
+            )
+        self.assertEqual(counters.get(get_counter_key(ASSIGNMENTS, self.user.pk)), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.is_read = True
+            offer.save()
+        self.assertEqual(counters.get(get_counter_key(ASSIGNMENTS, self.user.pk)), 1)
+
+    def test_reconcile_only_invalidates_stale_cached_counters(self):
+        client_key = get_counter_key(NOTIFICATIONS, self.factory.client_user.pk)
+        user_key = get_counter_key(NOTIFICATIONS, self.user.pk)
+        # Écriture sans signal : le compteur en cache diverge
+        Notification.objects.filter(recipient=self.user).update(read=True)
+
+        self.assertEqual(reconcile_unread_counters(), 1)
+        self.assertIsNone(counters.get(user_key))
+        self.assertIsNone(counters.get(client_key))  # absent : pas créé
+        self.assertEqual(get_unread_count(NOTIFICATIONS, self.user.pk), 0)
+        self.assertEqual(reconcile_unread_counters(), 0)
+        self.assertEqual(counters.get(user_key), 0)
+
+
+class CacheNamespaceTests(SimpleTestCase):
+    """Espaces du cache partagé : versions par entité, recalcul anticipé, métriques"""
+
+    def setUp(self):
+        cache.clear()
+        reset_metrics()
+        self.namespace = CacheNamespace('tests', timeout=60)
+
+    def test_bump_changes_version(self):
+        version = self.namespace.get_version(1)
+        self.assertEqual(self.namespace.get_version(1), version)
+        self.namespace.bump(1)
+        self.assertGreater(self.namespace.get_version(1), version)
+
+    def test_get_or_build_counts_hits_and_misses(self):
+        builds = []
+        for _ in range(3):
+            self.assertEqual(self.namespace.get_or_build('value', lambda: builds.append(1) or 42), 42)
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(get_metrics()['tests'], {'misses': 1, 'hits': 2})
+
+    def test_get_or_build_refreshes_before_expiry(self):
+        key = self.namespace.make_key('value')
+        # Échéance logique atteinte, entrée encore présente : recalculée
+        cache.set(key, ('stale', 1.0, timezone.now().timestamp()), 60)
+        self.assertEqual(self.namespace.get_or_build('value', lambda: 'fresh'), 'fresh')
+        self.assertEqual(get_metrics()['tests'], {'early_refreshes': 1})
+
+
+class InterpreterRegistrationWizardTests(TestCase):
+    """Inscription interprète : état des étapes dans le cache sous un jeton signé, jamais dans django_session"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+
+    def post_step(self, step, data):
+        response = self.client.post(reverse(f'dbdint:interpreter_registration_step{step}'), data)
+        self.assertEqual(response.status_code, 302)
+        return response
+
+    def test_wizard_does_not_write_sessions(self):
+        self.post_step(1, {
+            'username': 'newcomer', 'email': 'newcomer@example.com', 'first_name': 'New',
+            'last_name': 'Comer', 'phone': '5550100', 'password1': 'Xq7!long-pass', 'password2': 'Xq7!long-pass',
+        })
+        # Le cookie ne porte que le jeton signé
+        token = signing.loads(self.client.cookies['dbdint_wizard'].value, salt='app.wizard')
+        self.assertIsInstance(token, str)
+        self.assertNotIn('newcomer', token)
+        self.post_step(2, {'languages': [self.factory.english.pk, self.factory.spanish.pk]})
+        self.assertFalse(Session.objects.exists())
+
+        self.post_step(3, {
+            'address': '3 Main St', 'city': 'Boston', 'state': 'MA', 'zip_code': '02116', 'w9_on_file': 'on',
+        })
+        user = User.objects.get(username='newcomer')
+        self.assertEqual(self.client.session['_auth_user_id'], str(user.pk))
+        self.assertTrue(user.check_password('Xq7!long-pass'))
+        self.assertEqual(user.interpreter_profile.languages.count(), 2)
+        self.assertEqual(self.client.cookies['dbdint_wizard'].value, '')
+
+    def test_tampered_state_restarts_wizard(self):
+        self.client.cookies['dbdint_wizard'] = 'tampered'
+        response = self.client.get(reverse('dbdint:interpreter_registration_step2'))
+        self.assertRedirects(response, reverse('dbdint:interpreter_registration_step1'))
+
+
+class ActorTests(TestCase):
+    """request.actor : utilisateur et profil du rôle chargés en une requête"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+
+    def load_actor(self, user):
+        with self.assertNumQueries(1):
+            actor = Actor(ProfileModelBackend().get_user(user.pk))
+        return actor
+
+    def test_interpreter_profile_loaded_with_user(self):
+        actor = self.load_actor(self.factory.interpreter_user)
+        self.assertTrue(actor.is_interpreter)
+        self.assertEqual(actor.interpreter, self.factory.interpreter)
+        self.assertIsNone(actor.client)
+
+    def test_client_profile_loaded_with_user(self):
+        actor = self.load_actor(self.factory.client_user)
+        self.assertTrue(actor.is_client)
+        self.assertEqual(actor.client, self.factory.client)
+        with self.assertNumQueries(0):
+            self.assertFalse(hasattr(actor.user, 'interpreter_profile'))
+
+    def test_async_user_loads_profile(self):
+        with self.assertNumQueries(1):
+            user = async_to_sync(ProfileModelBackend().aget_user)(self.factory.interpreter_user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.interpreter_profile, self.factory.interpreter)
+
+    def test_session_from_model_backend_still_resolves(self):
+        # Session ouverte avant ProfileModelBackend
+        self.client.force_login(self.factory.interpreter_user, backend='django.contrib.auth.backends.ModelBackend')
+        response = self.client.get(reverse('dbdint:interpreter_assignments'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.actor.interpreter, self.factory.interpreter)
+
+    def test_anonymous(self):
+        actor = Actor(AnonymousUser())
+        self.assertIsNone(actor.role)
+        self.assertIsNone(actor.interpreter)
+        self.assertFalse(actor.is_client)
+
+
+class LanguageIndexInvalidationTests(TestCase):
+    """Index de matching : invalidé par les actions d'admin en masse et la (dés)activation d'un compte"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.pair = (cls.factory.english.pk, cls.factory.spanish.pk)
+
+    def setUp(self):
+        cache.clear()
+        self.assertIn(self.factory.interpreter.pk, get_language_index()['pairs'][self.pair])
+
+    def assert_removed_from_index(self):
+        self.assertNotIn(self.pair, get_language_index()['pairs'])
+
+    def test_admin_deactivate_interpreters(self):
+        self.client.force_login(self.factory.admin_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin:app_interpreter_changelist'), {
+                'action': 'deactivate_interpreters', '_selected_action': [self.factory.interpreter.pk],
+            })
+        self.assert_removed_from_index()
+
+    def test_admin_mark_users_inactive(self):
+        self.client.force_login(self.factory.admin_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin:app_user_changelist'), {
+                'action': 'mark_as_inactive', '_selected_action': [self.factory.interpreter_user.pk],
+            })
+        self.assertFalse(User.objects.get(pk=self.factory.interpreter_user.pk).is_active)
+        self.assert_removed_from_index()
+
+    def test_user_deactivated_by_save(self):
+        user = User.objects.get(pk=self.factory.interpreter_user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.is_active = False
+            user.save()
+        self.assert_removed_from_index()
+
+    def test_interpreter_saves(self):
+        interpreter = Interpreter.objects.get(pk=self.factory.interpreter.pk)
+        with self.captureOnCommitCallbacks() as callbacks:
+            interpreter.bank_name = 'Bank'
+            interpreter.save()
+        self.assertNotIn(invalidate_language_index, callbacks)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            interpreter.radius_of_service = 10
+            interpreter.save()
+        self.assertIn(invalidate_language_index, callbacks)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            interpreter.active = False
+            interpreter.save()
+        self.assert_removed_from_index()
+
+
+class MatchingTests(TestCase):
+    """Matching : paire de langues, statut, rayon de service, agenda, puis classement"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        Proficiency = InterpreterLanguage.Proficiency
+        cls.certified = cls.interpreter('certified', '01730', Proficiency.FLUENT, certified=True)
+        cls.nearby = cls.interpreter('nearby', '02138', Proficiency.FLUENT)
+        cls.interpreter('distant', '01001', Proficiency.NATIVE, radius_of_service=20)
+        cls.interpreter('inactive', '02116', Proficiency.NATIVE, active=False)
+        cls.interpreter('english_only', '02116', Proficiency.NATIVE, languages=[cls.factory.english])
+        busy = cls.interpreter('busy', '02116', Proficiency.NATIVE)
+        booked = cls.factory.assignment(Assignment.Status.CONFIRMED, days=5)
+        booked.interpreter = busy
+        booked.save()
+        cls.start = booked.start_time
+        cls.end = booked.end_time
+
+    @classmethod
+    def interpreter(cls, username, zip_code, proficiency, certified=False, languages=None, **fields):
+        interpreter = Interpreter.objects.create(
+            user=cls.factory.user(username, 'INTERPRETER'), address='1 Main St', city='Boston', state='MA',
+            zip_code=zip_code, **fields
+        )
+        for language in languages or (cls.factory.english, cls.factory.spanish):
+            InterpreterLanguage.objects.create(
+                interpreter=interpreter, language=language, proficiency=proficiency, certified=certified
+            )
+        return interpreter
+
+    def setUp(self):
+        cache.clear()
+
+    def match(self, **kwargs):
+        results = find_matching_interpreters(
+            self.factory.english, self.factory.spanish, self.factory.service_type,
+            self.start, self.end, **kwargs
+        )
+        return [result['interpreter'] for result in results]
+
+    def test_ranking(self):
+        # Certifié d'abord ; à distance égale (même tranche), la meilleure maîtrise
+        self.assertEqual(
+            self.match(zip_code='02116'), [self.certified, self.factory.interpreter, self.nearby]
+        )
+
+    def test_requires_certification(self):
+        self.factory.service_type.requires_certification = True
+        self.assertEqual(self.match(zip_code='02116'), [self.certified])
+
+    def test_unknown_zip_code_skips_radius(self):
+        self.assertEqual(len(self.match()), 4)
+
+
+class AssignmentTabsTests(TestCase):
+    """Missions de l'interprète : un onglet affiché, paginé par curseur"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(3)
+
+    def setUp(self):
+        self.client.force_login(self.factory.interpreter_user)
+
+    def get_tab(self, **params):
+        return self.client.get(reverse('dbdint:interpreter_assignments'), params)
+
+    def test_unknown_tab_shows_pending(self):
+        response = self.get_tab(tab='unknown')
+        self.assertEqual(response.context['active_tab'], 'pending')
+        self.assertEqual(
+            {assignment.status for assignment in response.context['assignments']},
+            {Assignment.Status.PENDING}
+        )
+
+    def test_completed_tab_is_paginated_by_cursor(self):
+        with mock.patch.object(AssignmentListView, 'paginate_by', 2):
+            response = self.get_tab(tab='completed')
+        assignments = response.context['assignments']
+        self.assertEqual(len(assignments), 2)
+        self.assertTrue(all(a.status == Assignment.Status.COMPLETED for a in assignments))
+        self.assertIn('tab=completed', response.context['page_obj']['next_url'])
+        self.assertContains(response, response.context['page_obj']['next_url'].replace('&', '&amp;'))
+
+
+class ServerTimingTests(TestCase):
+    """En-tête Server-Timing et ligne de log JSON par requête"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+        cls.factory.populate(1)
+
+    def setUp(self):
+        self.client.force_login(self.factory.interpreter_user)
+
+    def get_logged(self, url):
+        with self.assertLogs('app.request_timing', 'INFO') as logs:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        line = json.loads(logs.records[-1].getMessage().removeprefix('request_timing '))
+        return response, line
+
+    def test_header_and_log_line(self):
+        response, line = self.get_logged(reverse('dbdint:interpreter_assignments'))
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=')
+        self.assertIn('total;dur=', response['Server-Timing'])
+        self.assertEqual(line['url_name'], 'dbdint:interpreter_assignments')
+        self.assertEqual(line['user_id'], self.factory.interpreter_user.pk)
+        self.assertGreater(line['db_queries'], 0)
+
+    def test_async_view_logs_user(self):
+        today = timezone.localdate()
+        url = reverse('dbdint:calendar_data_api', kwargs={'year': today.year, 'month': today.month})
+        _, line = self.get_logged(url)
+        self.assertEqual(line['user_id'], self.factory.interpreter_user.pk)
+
+    def test_header_can_be_disabled(self):
+        with self.settings(SERVER_TIMING_HEADER=False):
+            response, _ = self.get_logged(reverse('dbdint:interpreter_assignments'))
+        self.assertNotIn('Server-Timing', response)
+
+
+class EventBusTests(SimpleTestCase):
+    """Bus d'événements en mémoire et publication vers les canaux utilisateur"""
+
+    async def test_local_bus_delivers_to_channel_subscribers(self):
+        bus = LocalEventBus()
+        async with bus.subscribe('a') as queue_a, bus.subscribe('b') as queue_b:
+            bus.publish('a', 'hello')
+            self.assertEqual(await asyncio.wait_for(queue_a.get(), 1), 'hello')
+            self.assertTrue(queue_b.empty())
+        self.assertEqual(dict(bus._subscribers), {})
+
+    async def test_full_queue_drops_events(self):
+        bus = LocalEventBus()
+        with mock.patch('app.services.events.SUBSCRIBER_QUEUE_SIZE', 1):
+            async with bus.subscribe('a') as queue:
+                with self.assertLogs('app.services.events', 'WARNING'):
+                    bus.publish('a', 'first')
+                    bus.publish('a', 'second')
+                    await asyncio.sleep(0)
+                self.assertEqual(queue.get_nowait(), 'first')
+                self.assertTrue(queue.empty())
+
+    async def test_publish_event_to_user_channel(self):
+        async with get_event_bus().subscribe(get_user_channel(7)) as queue:
+            publish_event(None, 'notification', {'id': 1})
+            publish_event(7, 'notification', {'id': 1})
+            message = await asyncio.wait_for(queue.get(), 1)
+        self.assertEqual(format_sse(message), 'event: notification\ndata: {"id": 1}\n\n')
+
+
+class EventStreamTests(TestCase):
+    """Flux SSE : authentification requise, événements de l'utilisateur seulement"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+
+    async def test_anonymous_rejected(self):
+        response = await self.async_client.get(reverse('dbdint:event_stream'))
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_delivers_user_events(self):
+        await self.async_client.aforce_login(self.factory.interpreter_user)
+        response = await self.async_client.get(reverse('dbdint:event_stream'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = aiter(response.streaming_content)
+        self.assertEqual(await anext(chunks), b'retry: 5000\n\n')
+
+        publish_event(self.factory.client_user.pk, 'notification', {'id': 1})
+        publish_event(self.factory.interpreter_user.pk, 'assignment_offer', {'id': 2})
+        chunk = await asyncio.wait_for(anext(chunks), 1)
+        self.assertEqual(chunk, b'event: assignment_offer\ndata: {"id": 2}\n\n')
+        await chunks.aclose()
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Serveur SMTP minimal sur un port local libre (tests) : accepte tout et
+    garde les messages reçus dans `messages` (expéditeur, destinataires, email).
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), LocalSMTPHandler)
+        self.messages = []
+        self.port = self.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class LocalSMTPHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        self.reply('220 localhost')
+        sender, recipients = None, []
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb == 'EHLO':
+                self.reply('250-localhost')
+                self.reply('250 8BITMIME')
+            elif verb == 'MAIL':
+                sender, recipients = command.split(':', 1)[1].strip(), []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip())
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while (data_line := self.rfile.readline()) not in (b'.\r\n', b''):
+                    data.append(data_line[1:] if data_line.startswith(b'..') else data_line)
+                self.server.messages.append((sender, recipients, message_from_bytes(b''.join(data))))
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:  # HELO, RSET, NOOP
+                self.reply('250 OK')
+
+
+class EmailTaskTests(TestCase):
+    """Emails envoyés par Celery après commit, par le vrai backend SMTP (serveur local)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = FixtureFactory()
+
+    def setUp(self):
+        self.smtp = self.enterContext(LocalSMTPServer())
+        self.enterContext(override_settings(
+            EMAIL_BACKEND='app.utils.request_timing.TimedSMTPEmailBackend', EMAIL_HOST='127.0.0.1',
+            EMAIL_PORT=self.smtp.port, EMAIL_USE_TLS=False, EMAIL_HOST_USER='', EMAIL_HOST_PASSWORD='',
+            DEFAULT_FROM_EMAIL='noreply@example.com', CONTACT_NOTIFICATION_EMAIL='staff@example.com',
+            CELERY_TASK_ALWAYS_EAGER=True,  # Tâches exécutées sur place, sans broker
+        ))
+
+    def recipients(self):
+        return sorted(recipient for _, recipients, _ in self.smtp.messages for recipient in recipients)
+
+    def test_contact_emails_sent_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(reverse('dbdint:contact'), {
+                'name': 'Ann', 'email': 'ann@example.com', 'subject': 'Hello', 'message': 'Question',
+            })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.smtp.messages, [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.recipients(), ['<ann@example.com>', '<staff@example.com>'])
+
+    def test_accept_assignment_emails_sent_after_commit(self):
+        assignment = self.factory.assignment(status=Assignment.Status.PENDING, days=3)
+        self.client.force_login(self.factory.interpreter_user)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(reverse('dbdint:accept_assignment', args=[assignment.pk]))
+        self.assertEqual(response.json(), {'status': 'success'})
+        self.assertEqual(self.smtp.messages, [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.recipients(), ['<admin@example.com>', '<interpreter@example.com>'])
+        confirmation = next(message for _, _, message in self.smtp.messages if 'Confirmation' in message['Subject'])
+        self.assertIn('text/calendar', [part.get_content_type() for part in confirmation.walk()])
+
+    def test_assignment_email_retried_on_smtp_error(self):
+        assignment = self.factory.assignment(status=Assignment.Status.COMPLETED, days=-1)
+        with mock.patch('django.core.mail.EmailMultiAlternatives.send', side_effect=SMTPException) as send:
+            with self.assertLogs('app.mixins.assignment_mixins', 'ERROR'):
+                result = send_assignment_notification_email.apply(
+                    args=(assignment.pk, 'completed', 'http://testserver')
+                )
+        self.assertTrue(result.failed())
+        self.assertIsInstance(result.result, SMTPException)
+        self.assertEqual(send.call_count, 1 + send_assignment_notification_email.max_retries)
@@ -88,7 +88,7 @@ urlpatterns = [
          views.InterpreterScheduleView.as_view(),
          name='interpreter_schedule'),
     path('interpreter/schedule/assignments/',
-         views.get_calendar_assignments,
+         views.get_calendar_assignments_async,
          name='get_calendar_assignments'),
     
     # Assignment Management (Interpreter)
@@ -96,7 +96,7 @@ urlpatterns = [
          views.AssignmentListView.as_view(),
          name='interpreter_assignments'),
     path('interpreter/assignments/<int:pk>/details/',
-         views.AssignmentDetailView.as_view(),
+         views.AssignmentDetailAsyncView.as_view(),
          name='assignment_detail'),
     path('interpreter/assignments/<int:pk>/accept/',
          views.accept_assignment,
@@ -129,6 +129,24 @@ urlpatterns = [
     path('api/notifications/clear-all/',
          views.ClearAllNotificationsView.as_view(),
          name='clear_all_notifications'),
+    path('api/notifications/unread-count/',
+         views.get_unread_notifications_count,
+         name='unread_notifications_count'),
+    path('events/stream/',
+         views.event_stream,
+         name='event_stream'),
+    path('interpreter/notifications/',
+         views.NotificationListView.as_view(),
+         name='interpreter_notifications'),
+    path('interpreter/notifications/api/',
+         views.notifications_api,
+         name='notifications_api'),
+    path('interpreter/notifications/<int:pk>/mark-read/',
+         views.mark_notification_as_read,
+         name='notification_mark_read'),
+    path('interpreter/notifications/mark-all-read/',
+         views.mark_all_notifications_as_read,
+         name='notifications_mark_all_read'),
     path('interpreter/assignments/notifications/count/',
          views.get_unread_assignments_count,
          name='unread_assignments_count'),
@@ -148,14 +166,14 @@ urlpatterns = [
     path('int/schedule/', views.calendar_view, name='new_interpreter_calendar'),
         path('schedule/', views.calendar_view, name='interpreter_calendar'),
     path('api/interpreter/calendar-data/<int:year>/<int:month>/', 
-         views.calendar_data_api, 
+         views.calendar_data_api_async,
          name='calendar_data_api'),
     path('api/interpreter/missions/<str:date_str>/', 
-         views.daily_missions_api, 
+         views.daily_missions_api_async,
          name='daily_missions_api'),
     path('int/missions/', views.appointments_view, name='new_interpreter_appointments'),
     path('int/stats/', views.stats_view, name='new_interpreter_stats'),
-    path('api/earnings/<str:period>/', views.earnings_data_api, name='earnings_data'),
+    path('api/earnings/<str:period>/', views.earnings_data_api_async, name='earnings_data'),
     path('assignments/<int:assignment_id>/complete/', 
      views.mark_assignment_complete, 
      name='mark-assignment-complete'),
@@ -0,0 +1,88 @@
+import re
+
+# Interpreter.availability : {"monday": ["9:00-17:00"], ...}
+WEEKDAYS = {
+    'monday': 0, 'mon': 0,
+    'tuesday': 1, 'tue': 1, 'tues': 1,
+    'wednesday': 2, 'wed': 2,
+    'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6,
+}
+MINUTES_PER_DAY = 24 * 60
+
+TIME_RE = re.compile(r'^\s*(\d{1,2})(?::(\d{2}))?\s*([ap])?\.?\s*m?\.?\s*$', re.IGNORECASE)
+
+
+def parse_time(value):
+    """'9:00', '17:30', '9am', '5:30 PM', '24:00' -> minutes depuis minuit (ou None)"""
+    match = TIME_RE.match(str(value))
+    if not match:
+        return None
+    hours, minutes, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if meridiem:
+        if not 1 <= hours <= 12:
+            return None
+        hours = hours % 12 + (12 if meridiem.lower() == 'p' else 0)
+    if minutes > 59 or hours * 60 + minutes > MINUTES_PER_DAY:
+        return None
+    return hours * 60 + minutes
+
+
+def _parse_range(value):
+    if isinstance(value, dict):
+        start, end = value.get('start'), value.get('end')
+    elif isinstance(value, str) and '-' in value:
+        start, end = value.split('-', 1)
+    else:
+        return None
+    start, end = parse_time(start), parse_time(end)
+    if start is None or end is None or start == end:
+        return None
+    return start, end
+
+
+def parse_availability(data):
+    """
+    Convertit le JSON de disponibilités en créneaux (weekday, start, end),
+    weekday 0 = lundi. Les plages de nuit (22:00-02:00) sont coupées à minuit,
+    les plages qui se chevauchent sont fusionnées, les entrées invalides ignorées.
+    """
+    if not isinstance(data, dict):
+        return []
+
+    by_day = {weekday: [] for weekday in range(7)}
+    for day, ranges in data.items():
+        weekday = WEEKDAYS.get(str(day).strip().lower())
+        if weekday is None:
+            continue
+        if isinstance(ranges, (str, dict)):
+            ranges = [ranges]
+        for value in ranges or []:
+            parsed = _parse_range(value)
+            if parsed is None:
+                continue
+            start, end = parsed
+            if end > start:
+                by_day[weekday].append((start, end))
+            else:
+                by_day[weekday].append((start, MINUTES_PER_DAY))
+                if end > 0:
+                    by_day[(weekday + 1) % 7].append((0, end))
+
+    slots = []
+    for weekday, ranges in by_day.items():
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        slots.extend((weekday, start, end) for start, end in merged)
+    return slots
+
+
+def format_minutes(minutes):
+    """600 -> '10:00'"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
@@ -2,7 +2,7 @@
 
 from django.utils import timezone
 import pytz
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from typing import Optional
 
 # utils/datetime_handlers.py
@@ -39,4 +39,23 @@ class DateTimeHandler:
         if not dt:
             return ""
         boston_time = dt.astimezone(cls.BOSTON_TZ)
-        return boston_time.strftime("%m/%d/%Y %I:%M %p %Z")
\ No newline at end of file
+        return boston_time.strftime("%m/%d/%Y %I:%M %p %Z")
+
+    @classmethod
+    def day_range(cls, first_day, last_day=None):
+        """
+        Retourne l'intervalle semi-ouvert [début, fin) en datetimes aware
+        couvrant les jours de Boston first_day à last_day inclus.
+        À utiliser avec start_time__gte / start_time__lt (l'index reste utilisable).
+        """
+        last_day = last_day or first_day
+        start = cls.BOSTON_TZ.localize(datetime.combine(first_day, time.min))
+        end = cls.BOSTON_TZ.localize(datetime.combine(last_day + timedelta(days=1), time.min))
+        return start, end
+
+    @classmethod
+    def month_range(cls, year, month):
+        """Intervalle semi-ouvert [début, fin) d'un mois complet à Boston"""
+        first_day = datetime(year, month, 1).date()
+        next_month = datetime(year + month // 12, month % 12 + 1, 1).date()
+        return cls.day_range(first_day, next_month - timedelta(days=1))
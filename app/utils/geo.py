@@ -0,0 +1,61 @@
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# Centroïdes embarqués (aucun appel réseau) : zip,latitude,longitude
+ZIP_CENTROIDS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'zip_centroids.csv')
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = 69.0
+
+
+def normalize_zip(zip_code):
+    """'02116-1234' / ' 2116 ' -> 2116 (entier des 5 premiers chiffres), ou None"""
+    digits = ''.join(character for character in str(zip_code or '') if character.isdigit())
+    if not digits:
+        return None
+    return int(digits[:5]) if len(digits) >= 5 else int(digits.zfill(5))
+
+
+@lru_cache(maxsize=1)
+def load_zip_centroids():
+    """
+    Charge le fichier en trois tableaux NumPy triés par code postal :
+    codes (int32), latitudes et longitudes (float64, en degrés).
+    """
+    data = np.loadtxt(ZIP_CENTROIDS_PATH, delimiter=',', comments='#', dtype=np.float64, ndmin=2)
+    order = np.argsort(data[:, 0])
+    data = data[order]
+    return data[:, 0].astype(np.int32), data[:, 1].copy(), data[:, 2].copy()
+
+
+def zip_to_coordinates(zip_code):
+    """(latitude, longitude) du centroïde d'un code postal, ou None s'il est inconnu"""
+    value = normalize_zip(zip_code)
+    if value is None:
+        return None
+    zips, latitudes, longitudes = load_zip_centroids()
+    position = np.searchsorted(zips, value)
+    if position >= len(zips) or zips[position] != value:
+        return None
+    return float(latitudes[position]), float(longitudes[position])
+
+
+def haversine_miles(latitude, longitude, latitudes, longitudes):
+    """Distances (miles) d'un point vers un tableau de points, vectorisé"""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(np.asarray(longitudes, dtype=np.float64) - longitude)
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box(latitude, longitude, radius_miles):
+    """(lat_min, lat_max, lon_min, lon_max) englobant le cercle, pour un préfiltre SQL"""
+    delta_lat = radius_miles / MILES_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    delta_lon = radius_miles / (MILES_PER_DEGREE_LAT * cos_lat)
+    return latitude - delta_lat, latitude + delta_lat, longitude - delta_lon, longitude + delta_lon
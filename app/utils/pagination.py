@@ -0,0 +1,84 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(value, pk):
+    """(valeur du champ de tri, pk) -> jeton opaque pour l'URL"""
+    if hasattr(value, 'isoformat'):
+        # isoformat complet : DjangoJSONEncoder tronque aux millisecondes
+        value = value.isoformat()
+    raw = json.dumps([value, pk], cls=DjangoJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, field):
+    """Jeton -> (valeur typée selon model.field, pk) ; InvalidCursor si illisible"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        value = model._meta.get_field(field).to_python(value)
+        pk = model._meta.pk.to_python(pk)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, ValidationError):
+        raise InvalidCursor(cursor)
+    if value is None or pk is None:
+        raise InvalidCursor(cursor)
+    return value, pk
+
+
+def _after(queryset, field, cursor, descending):
+    """Lignes situées après le curseur dans l'ordre de tri"""
+    value, pk = decode_cursor(cursor, queryset.model, field)
+    lookup = 'lt' if descending else 'gt'
+    return queryset.filter(
+        Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'pk__{lookup}': pk})
+    )
+
+
+def _cursor_for(obj, field):
+    return encode_cursor(getattr(obj, field), obj.pk)
+
+
+def paginate_by_cursor(queryset, cursor=None, page_size=20, field='created_at', descending=True,
+                       before=None):
+    """
+    Pagination par curseur (keyset) sur (field, pk) : chaque page est une
+    requête "WHERE (field, pk) après le curseur ORDER BY field, pk LIMIT n+1",
+    servie par un index, quel que soit le rang de la page. Pas de COUNT(*).
+
+    `cursor` donne la page suivante, `before` la page précédente (même
+    requête en ordre inverse). Retourne {'items', 'next_cursor', 'has_next',
+    'previous_cursor', 'has_previous'}.
+    """
+    if before:
+        prefix = '' if descending else '-'
+        queryset = _after(queryset.order_by(f'{prefix}{field}', f'{prefix}pk'), field, before, not descending)
+        items = list(queryset[:page_size + 1])
+        has_previous = len(items) > page_size
+        items = items[:page_size][::-1]
+        has_next = True
+    else:
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{field}', f'{prefix}pk')
+        if cursor:
+            queryset = _after(queryset, field, cursor, descending)
+        items = list(queryset[:page_size + 1])
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        has_previous = bool(cursor)
+
+    return {
+        'items': items,
+        'next_cursor': _cursor_for(items[-1], field) if has_next and items else None,
+        'has_next': has_next and bool(items),
+        'previous_cursor': _cursor_for(items[0], field) if has_previous and items else None,
+        'has_previous': has_previous and bool(items),
+    }
@@ -0,0 +1,138 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.mail.backends.smtp import EmailBackend
+from django.template.backends.django import DjangoTemplates, Template
+
+# Mesures de la requête en cours (None hors requête : Celery, commandes...)
+_current = ContextVar('request_metrics', default=None)
+# Vrai pendant un get_many, dont l'implémentation par défaut appelle get()
+_in_get_many = ContextVar('request_metrics_in_get_many', default=False)
+_MISSING = object()
+
+
+class RequestMetrics:
+    """Compteurs et durées (ms) d'une requête"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.template_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.outbound_ms = {}
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """À passer à connection.execute_wrapper() : compte et chronomètre les requêtes SQL"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_ms += (time.perf_counter() - started) * 1000
+
+
+def start_request():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def get_current_metrics():
+    return _current.get()
+
+
+@contextmanager
+def track_outbound(service):
+    """Chronomètre un appel sortant (smtp, supabase...) pour la requête en cours"""
+    metrics = _current.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            metrics.outbound_ms[service] = metrics.outbound_ms.get(service, 0.0) + elapsed
+
+
+def record_cache(hits=0, misses=0):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+class TimedTemplate(Template):
+    """Template dont le rendu est chronométré (seul le rendu le plus externe compte)"""
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_ms += (time.perf_counter() - started) * 1000
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Moteur DjangoTemplates qui mesure le temps de rendu des templates"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+class InstrumentedCacheMixin:
+    """Compte les hits / misses des lectures du cache pour la requête en cours"""
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        if not _in_get_many.get():
+            record_cache(hits=value is not _MISSING, misses=value is _MISSING)
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        token = _in_get_many.set(True)
+        try:
+            values = super().get_many(keys, version=version)
+        finally:
+            _in_get_many.reset(token)
+        record_cache(hits=len(values), misses=len(keys) - len(values))
+        return values
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    pass
+
+
+class TimedSMTPEmailBackend(EmailBackend):
+    """Backend SMTP dont les envois comptent comme appels sortants 'smtp'"""
+
+    def send_messages(self, email_messages):
+        with track_outbound('smtp'):
+            return super().send_messages(email_messages)
@@ -1,4 +1,5 @@
 # Standard Library Imports
+import asyncio
 import io
 import json
 import logging
@@ -30,20 +31,22 @@ from reportlab.pdfgen import canvas
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import login
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.contrib.auth.views import LoginView, LogoutView, PasswordChangeView
-from django.core.mail import send_mail, EmailMessage
+from django.contrib.auth.views import LoginView, LogoutView, PasswordChangeView, redirect_to_login
+from django.core.mail import EmailMessage
 from django.core.paginator import Paginator
 from django.db import IntegrityError
 from django.db.models import Avg, Count, Q, Sum
 from django.db.models.functions import ExtractDay, TruncMonth, TruncYear
-from django.http import HttpResponse, JsonResponse, FileResponse
+from django.http import Http404, HttpResponse, JsonResponse, FileResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string, get_template
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from django.utils.decorators import method_decorator
+from django.utils.functional import SimpleLazyObject
 from django.views import View
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_exempt
@@ -89,6 +92,7 @@ from .models import (
     Client,
     ContactMessage,
     Interpreter,
+    InterpreterDailyRollup,
     Language,
     Notification,
     NotificationPreference,
@@ -102,7 +106,32 @@ from .models import (
     User,
 )
 from .mixins.assignment_mixins import AssignmentAdminMixin
+from .mixins.pagination_mixins import KeysetPaginationMixin
+from .mixins.role_mixins import ClientRequiredMixin, InterpreterRequiredMixin
+from .mixins.wizard_mixins import CachedWizardMixin
+from .services.availability import get_upcoming_exceptions, get_weekly_availability
+from .services.calendar import aget_month_summary, get_month_summary
+from .services.client_dashboard import get_client_snapshot
+from .services.conflicts import describe_conflicts, get_conflicts
+from .services.events import format_sse, get_event_bus, get_user_channel
+from .services.interpreter_fragments import FRAGMENT_TIMEOUT, get_fragment_key
+from .services.notifications import (
+    NOTIFICATION_TABS, get_notification_counts, get_notification_page, serialize_notification
+)
+from .services.reference_data import attach_reference_data, get_active_languages, get_active_service_types
+from .services.rollups import aget_rollup_series, get_rollup_series, get_rollup_totals
+from .services.stats import (
+    get_assignment_stats, get_hours_by_weekday, get_hours_totals, get_quote_status_counts
+)
+from .services.unread_counters import ASSIGNMENTS, NOTIFICATIONS, get_unread_count, reset_unread_count
 from .assignment_views import AssignmentAcceptView, AssignmentDeclineView
+from .utils.datetime_handlers import DateTimeHandler
+from .utils.pagination import InvalidCursor
+from .tasks import (
+    enqueue_on_commit, send_assignment_admin_notification_email, send_assignment_completion_email,
+    send_assignment_confirmation_email, send_assignment_notification_email, send_contact_confirmation_email,
+    send_contact_staff_email, send_public_quote_confirmation_email, send_public_quote_staff_email
+)
 
 # Constants
 BOSTON_TZ = pytz.timezone('America/New_York')
@@ -563,40 +592,13 @@ class PublicQuoteRequestView(CreateView):
         response = super().form_valid(form)
         quote_request = self.object
 
-        # Send confirmation email to customer
-        customer_context = {
-            'quote_request': quote_request,
-            'name': quote_request.full_name,
-        }
-        customer_email_html = render_to_string('emails/quote_request_confirmation.html', customer_context)
-        customer_email_txt = render_to_string('emails/quote_request_confirmation.txt', customer_context)
-
-        send_mail(
-            subject='Quote Request Received - DBD I&T',
-            message=customer_email_txt,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[quote_request.email],
-            html_message=customer_email_html,
-            fail_silently=False,
-        )
-
-        # Send notification to staff
-        staff_context = {
-            'quote_request': quote_request,
-            'admin_url': self.request.build_absolute_uri(
-                reverse('dbdint:app_publicquoterequest_change', args=[quote_request.id])
+        # Emails (client, équipe) envoyés par Celery après commit
+        enqueue_on_commit(send_public_quote_confirmation_email, quote_request.id)
+        enqueue_on_commit(
+            send_public_quote_staff_email, quote_request.id,
+            self.request.build_absolute_uri(
+                reverse('admin:app_publicquoterequest_change', args=[quote_request.id])
             )
-        }
-        staff_email_html = render_to_string('emails/quote_request_notification.html', staff_context)
-        staff_email_txt = render_to_string('emails/quote_request_notification.txt', staff_context)
-
-        send_mail(
-            subject=f'New Quote Request: {quote_request.company_name}',
-            message=staff_email_txt,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[settings.QUOTE_NOTIFICATION_EMAIL],
-            html_message=staff_email_html,
-            fail_silently=False,
         )
 
         messages.success(
@@ -632,39 +634,11 @@ class ContactView(CreateView):
         response = super().form_valid(form)
         contact = self.object
 
-        # Send confirmation email to the sender
-        send_mail(
-            subject='Thank you for contacting DBD I&T',
-            message=f"""Dear {contact.name},
-
-Thank you for contacting DBD I&T. We have received your message and will get back to you shortly.
-
-Your message details:
-Subject: {contact.subject}
-Reference Number: #{contact.id}
-
-Best regards,
-DBD I&T Team""",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[contact.email],
-            fail_silently=False,
-        )
-
-        # Send notification to staff
-        send_mail(
-            subject=f'New Contact Form Submission: {contact.subject}',
-            message=f"""New contact form submission received:
-
-From: {contact.name} <{contact.email}>
-Subject: {contact.subject}
-
-Message:
-{contact.message}
-
-View in admin panel: {self.request.build_absolute_uri(reverse('dbdint:app_contactmessage_change', args=[contact.id]))}""",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[settings.CONTACT_NOTIFICATION_EMAIL],
-            fail_silently=False,
+        # Emails (expéditeur, équipe) envoyés par Celery après commit
+        enqueue_on_commit(send_contact_confirmation_email, contact.id)
+        enqueue_on_commit(
+            send_contact_staff_email, contact.id,
+            self.request.build_absolute_uri(reverse('admin:app_contactmessage_change', args=[contact.id]))
         )
 
         messages.success(
@@ -751,7 +725,7 @@ class ClientRegistrationView(FormView):
             )
 
             # Connecter l'utilisateur
-            login(self.request, user)
+            login(self.request, user, backend='app.backends.ProfileModelBackend')
             
             logger.info(
                 f"Step 1 completed successfully",
@@ -892,24 +866,25 @@ class ClientDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView)
     permission_denied_message = "Access denied. This area is for clients only."
     
     def test_func(self):
-        user = self.request.user
+        actor = self.request.actor
+        user = actor.user
         
         logger.debug(
             "Testing client dashboard access",
             extra={
                 'user_id': user.id,
-                'role': getattr(user, 'role', 'NO_ROLE'),
-                'has_client_profile': hasattr(user, 'client_profile'),
+                'role': actor.role or 'NO_ROLE',
+                'has_client_profile': actor.client is not None,
                 'registration_complete': user.registration_complete
             }
         )
         
-        if not user.role:
+        if not actor.role:
             logger.error(f"User {user.id} has no role assigned")
             return False
 
-        return (user.role == User.Roles.CLIENT and 
-                hasattr(user, 'client_profile') and 
+        return (actor.is_client and 
+                actor.client is not None and 
                 user.registration_complete)
 
     def handle_no_permission(self):
@@ -941,58 +916,13 @@ class ClientDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView)
         context = super().get_context_data(**kwargs)
         
         try:
-            client = self.request.user.client_profile
-            thirty_days_ago = timezone.now() - timedelta(days=30)
-            
-            # Statistiques de base
-            context['stats'] = {
-                'pending_quotes': QuoteRequest.objects.filter(
-                    client=client, 
-                    status='PENDING'
-                ).count(),
-                'active_assignments': Assignment.objects.filter(
-                    client=client, 
-                    status__in=['CONFIRMED', 'IN_PROGRESS']
-                ).count(),
-                'completed_assignments': Assignment.objects.filter(
-                    client=client, 
-                    status='COMPLETED', 
-                    completed_at__gte=thirty_days_ago
-                ).count(),
-                'total_spent': Payment.objects.filter(
-                    assignment__client=client,
-                    status='COMPLETED',
-                    payment_date__gte=thirty_days_ago
-                ).aggregate(total=Sum('amount'))['total'] or 0
-            }
-            
-            # Données récentes
+            client = self.request.actor.client
+
+            # Statistiques et données récentes : snapshot en cache,
+            # invalidé par version quand les données du client changent
+            context.update(get_client_snapshot(client))
+
             context.update({
-                'recent_quotes': QuoteRequest.objects.filter(
-                    client=client
-                ).select_related(
-                    'service_type',
-                    'source_language',
-                    'target_language'
-                ).order_by('-created_at')[:5],
-                
-                'upcoming_assignments': Assignment.objects.filter(
-                    client=client,
-                    status__in=['CONFIRMED', 'IN_PROGRESS'],
-                    start_time__gte=timezone.now()
-                ).select_related(
-                    'service_type',
-                    'source_language',
-                    'target_language'
-                ).order_by('start_time')[:5],
-                
-                'recent_payments': Payment.objects.filter(
-                    assignment__client=client
-                ).select_related(
-                    'assignment',
-                    'assignment__service_type'
-                ).order_by('-payment_date')[:5],
-                
                 'unread_notifications': Notification.objects.filter(
                     recipient=self.request.user,
                     read=False
@@ -1099,11 +1029,8 @@ class ClearAllNotificationsView(LoginRequiredMixin, View):
             )
             
             # Update all notifications
-            count = notifications.count()
-            notifications.update(
-                read=True,
-                read_at=timezone.now()
-            )
+            count = notifications.update(read=True)
+            reset_unread_count(NOTIFICATIONS, request.user.pk)
 
             return JsonResponse({
                 'success': True,
@@ -1126,26 +1053,23 @@ class ClearAllNotificationsView(LoginRequiredMixin, View):
 
 
 
-class ClientRequiredMixin(UserPassesTestMixin):
-    """Mixin to ensure user is a client"""
-    def test_func(self):
-        return self.request.user.role == 'CLIENT'
-class QuoteRequestListView(LoginRequiredMixin, ClientRequiredMixin, ListView):
+class QuoteRequestListView(LoginRequiredMixin, ClientRequiredMixin, KeysetPaginationMixin, ListView):
     """
-    Display all quote requests for the client with filtering and pagination
+    Display all quote requests for the client with filtering and cursor pagination
     """
     model = QuoteRequest
     template_name = 'client/quote_list.html'
     context_object_name = 'quotes'
     paginate_by = 10
+    keyset_field = 'created_at'
 
     def get_queryset(self):
         queryset = QuoteRequest.objects.filter(
-            client=self.request.user.client_profile
-        ).order_by('-created_at')
+            client=self.request.actor.client
+        ).select_related('service_type', 'source_language', 'target_language')
 
-        # Apply filters from form
-        filter_form = QuoteFilterForm(self.request.GET)
+        # Apply filters from form (validé une seule fois, réutilisé par get_context_data)
+        self.filter_form = filter_form = QuoteFilterForm(self.request.GET)
         if filter_form.is_valid():
             # Status filter
             status = filter_form.cleaned_data.get('status')
@@ -1168,29 +1092,43 @@ class QuoteRequestListView(LoginRequiredMixin, ClientRequiredMixin, ListView):
 
         return queryset
 
+    def serialize_object(self, quote):
+        return {
+            'id': quote.id,
+            'status': quote.status,
+            'service_type': quote.service_type.name,
+            'requested_date': quote.requested_date.isoformat(),
+            'duration': quote.duration,
+            'source_language': quote.source_language.name,
+            'target_language': quote.target_language.name,
+            'city': quote.city,
+            'state': quote.state,
+            'created_at': quote.created_at.isoformat(),
+        }
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Add filter form
-        context['filter_form'] = QuoteFilterForm(self.request.GET)
+        context['filter_form'] = self.filter_form
         
         # Add choices for dropdowns
         context['status_choices'] = QuoteRequest.Status.choices
-        # Pour le service_type, on doit faire une requête car c'est un modèle
-        context['service_types'] = ServiceType.objects.filter(active=True).values_list('id', 'name')
+        # Types de service actifs depuis le cache des référentiels (aucune requête)
+        context['service_types'] = [(service_type.pk, service_type.name) for service_type in get_active_service_types()]
         
-        # Add statistics
-        base_queryset = self.get_queryset()
+        # Add statistics : une requête groupée sur le queryset déjà filtré
+        status_counts = get_quote_status_counts(self.object_list)
         context['stats'] = {
-            'pending_count': base_queryset.filter(status=QuoteRequest.Status.PENDING).count(),
-            'processing_count': base_queryset.filter(status=QuoteRequest.Status.PROCESSING).count(),
-            'quoted_count': base_queryset.filter(status=QuoteRequest.Status.QUOTED).count(),
-            'accepted_count': base_queryset.filter(status=QuoteRequest.Status.ACCEPTED).count()
+            'pending_count': status_counts[QuoteRequest.Status.PENDING],
+            'processing_count': status_counts[QuoteRequest.Status.PROCESSING],
+            'quoted_count': status_counts[QuoteRequest.Status.QUOTED],
+            'accepted_count': status_counts[QuoteRequest.Status.ACCEPTED]
         }
 
         # Add current filters to context for pagination
         context['current_filters'] = self.request.GET.dict()
-        if 'page' in context['current_filters']:
-            del context['current_filters']['page']
+        for key in ('page', self.cursor_param, self.before_param):
+            context['current_filters'].pop(key, None)
             
         return context
 
@@ -1209,7 +1147,7 @@ class QuoteRequestCreateView(LoginRequiredMixin, ClientRequiredMixin, CreateView
         return kwargs
 
     def form_valid(self, form):
-        form.instance.client = self.request.user.client_profile
+        form.instance.client = self.request.actor.client
         form.instance.status = QuoteRequest.Status.PENDING
         response = super().form_valid(form)
         
@@ -1229,7 +1167,7 @@ class QuoteRequestDetailView(LoginRequiredMixin, ClientRequiredMixin, DetailView
 
     def get_queryset(self):
         return QuoteRequest.objects.filter(
-            client=self.request.user.client_profile
+            client=self.request.actor.client
         )
 
     def get_context_data(self, **kwargs):
@@ -1295,7 +1233,7 @@ class QuoteAcceptView(LoginRequiredMixin, ClientRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         quote = get_object_or_404(
             Quote,
-            quote_request__client=request.user.client_profile,
+            quote_request__client=request.actor.client,
             pk=kwargs['pk'],
             status='SENT'
         )
@@ -1321,7 +1259,7 @@ class QuoteRejectView(LoginRequiredMixin, ClientRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         quote = get_object_or_404(
             Quote,
-            quote_request__client=request.user.client_profile,
+            quote_request__client=request.actor.client,
             pk=kwargs['pk'],
             status='SENT'
         )
@@ -1347,7 +1285,7 @@ class AssignmentDetailClientView(LoginRequiredMixin, ClientRequiredMixin, Detail
 
     def get_queryset(self):
         return Assignment.objects.filter(
-            client=self.request.user.client_profile
+            client=self.request.actor.client
         )
 
     def get_context_data(self, **kwargs):
@@ -1450,7 +1388,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 @method_decorator(never_cache, name='dispatch')
-class InterpreterRegistrationStep1View(FormView):
+class InterpreterRegistrationStep1View(CachedWizardMixin, FormView):
    template_name = 'trad/auth/step1.html'
    form_class = InterpreterRegistrationForm1
    success_url = reverse_lazy('dbdint:interpreter_registration_step2')
@@ -1470,16 +1408,17 @@ class InterpreterRegistrationStep1View(FormView):
            session_data = {
                'username': form.cleaned_data['username'],
                'email': form.cleaned_data['email'],
-               'password': form.cleaned_data['password1'],
+               # Haché dès cette étape : jamais de mot de passe en clair dans le cache
+               'password': make_password(form.cleaned_data['password1']),
                'first_name': form.cleaned_data['first_name'],
                'last_name': form.cleaned_data['last_name'],
                'phone': form.cleaned_data['phone']
            }
-           self.request.session['dbdint:interpreter_registration_step1'] = session_data
-           logger.info(f"Session data saved successfully for username: {session_data['username']}, email: {session_data['email']}")
+           self.set_wizard_step('step1', session_data)
+           logger.info(f"Registration data saved successfully for username: {session_data['username']}, email: {session_data['email']}")
            
        except Exception as e:
-           logger.error(f"Error saving session data: {str(e)}")
+           logger.error(f"Error saving registration data: {str(e)}")
            messages.error(self.request, 'An error occurred while saving your information.')
            return self.form_invalid(form)
        
@@ -1503,7 +1442,7 @@ class InterpreterRegistrationStep1View(FormView):
        return super().post(request, *args, **kwargs)
 
 @method_decorator(never_cache, name='dispatch')
-class InterpreterRegistrationStep2View(FormView):
+class InterpreterRegistrationStep2View(CachedWizardMixin, FormView):
    template_name = 'trad/auth/step2.html'
    form_class = InterpreterRegistrationForm2
    success_url = reverse_lazy('dbdint:interpreter_registration_step3')
@@ -1513,10 +1452,10 @@ class InterpreterRegistrationStep2View(FormView):
        context = super().get_context_data(**kwargs)
        
        try:
-           context['languages'] = Language.objects.filter(is_active=True)
-           logger.debug(f"Found {context['languages'].count()} active languages")
+           context['languages'] = get_active_languages()
+           logger.debug(f"Found {len(context['languages'])} active languages")
            
-           step2_data = self.request.session.get('dbdint:interpreter_registration_step2')
+           step2_data = self.get_wizard_step('step2')
            if step2_data and 'languages' in step2_data:
                context['selected_languages'] = step2_data['languages']
                logger.debug(f"Retrieved previously selected languages: {step2_data['languages']}")
@@ -1528,12 +1467,12 @@ class InterpreterRegistrationStep2View(FormView):
    def dispatch(self, request, *args, **kwargs):
        logger.info("Dispatch called for InterpreterRegistrationStep2View")
        
-       if not request.session.get('dbdint:interpreter_registration_step1'):
-           logger.warning("Step 1 data not found in session. Redirecting to step 1.")
+       if not self.get_wizard_step('step1'):
+           logger.warning("Step 1 data not found. Redirecting to step 1.")
            messages.error(request, 'Please complete step 1 first.')
            return redirect('dbdint:interpreter_registration_step1')
            
-       logger.debug("Step 1 data found in session. Proceeding with step 2.")
+       logger.debug("Step 1 data found. Proceeding with step 2.")
        return super().dispatch(request, *args, **kwargs)
 
    def form_valid(self, form):
@@ -1543,13 +1482,13 @@ class InterpreterRegistrationStep2View(FormView):
            selected_languages = [str(lang.id) for lang in form.cleaned_data['languages']]
            logger.debug(f"Selected languages: {selected_languages}")
            
-           self.request.session['dbdint:interpreter_registration_step2'] = {
+           self.set_wizard_step('step2', {
                'languages': selected_languages
-           }
-           logger.info("Session data saved successfully")
+           })
+           logger.info("Registration data saved successfully")
            
        except Exception as e:
-           logger.error(f"Error saving session data: {str(e)}")
+           logger.error(f"Error saving registration data: {str(e)}")
            messages.error(self.request, 'An error occurred while saving your information.')
            return self.form_invalid(form)
            
@@ -1566,7 +1505,7 @@ class InterpreterRegistrationStep2View(FormView):
        initial = super().get_initial()
        
        try:
-           step2_data = self.request.session.get('dbdint:interpreter_registration_step2')
+           step2_data = self.get_wizard_step('step2')
            if step2_data and 'languages' in step2_data:
                initial['languages'] = [int(lang_id) for lang_id in step2_data['languages']]
                logger.debug(f"Retrieved initial languages data: {initial['languages']}")
@@ -1591,7 +1530,7 @@ class InterpreterRegistrationStep2View(FormView):
 
 
 @method_decorator(never_cache, name='dispatch')
-class InterpreterRegistrationStep3View(FormView):
+class InterpreterRegistrationStep3View(CachedWizardMixin, FormView):
    template_name = 'trad/auth/step3.html'
    form_class = InterpreterRegistrationForm3 
    success_url = reverse_lazy('dbdint:new_interpreter_dashboard')
@@ -1620,8 +1559,8 @@ class InterpreterRegistrationStep3View(FormView):
 
    def dispatch(self, request, *args, **kwargs):
        logger.info("Dispatch called for InterpreterRegistrationStep3View")
-       step1_exists = 'dbdint:interpreter_registration_step1' in request.session
-       step2_exists = 'dbdint:interpreter_registration_step2' in request.session
+       step1_exists = self.get_wizard_step('step1') is not None
+       step2_exists = self.get_wizard_step('step2') is not None
        
        if not all([step1_exists, step2_exists]):
            logger.warning("Previous steps data missing")
@@ -1632,18 +1571,20 @@ class InterpreterRegistrationStep3View(FormView):
    def form_valid(self, form):
        logger.info("Form validation successful")
        try:
-           step1_data = self.request.session['dbdint:interpreter_registration_step1']
-           step2_data = self.request.session['dbdint:interpreter_registration_step2']
+           step1_data = self.get_wizard_step('step1')
+           step2_data = self.get_wizard_step('step2')
            
-           user = User.objects.create_user(
-               username=step1_data['username'],
-               email=step1_data['email'],
+           # Équivalent de create_user, avec le mot de passe déjà haché à l'étape 1
+           user = User(
+               username=User.normalize_username(step1_data['username']),
+               email=User.objects.normalize_email(step1_data['email']),
                password=step1_data['password'],
                first_name=step1_data['first_name'],
                last_name=step1_data['last_name'],
                phone=step1_data['phone'],
                role='INTERPRETER'
            )
+           user.save()
            logger.info(f"User created: {user.email}")
 
            interpreter = form.save(commit=False)
@@ -1653,10 +1594,9 @@ class InterpreterRegistrationStep3View(FormView):
            for language_id in step2_data['languages']:
                interpreter.languages.add(language_id)
            
-           del self.request.session['dbdint:interpreter_registration_step1']
-           del self.request.session['dbdint:interpreter_registration_step2']
+           self.clear_wizard_state()
 
-           login(self.request, user)
+           login(self.request, user, backend='app.backends.ProfileModelBackend')
            messages.success(self.request, 'Your interpreter account has been created successfully! Our team will review your application.')
            return super().form_valid(form)
 
@@ -1671,65 +1611,45 @@ class InterpreterRegistrationStep3View(FormView):
        return super().form_invalid(form)
 
 
-class InterpreterDashboardView(LoginRequiredMixin, UserPassesTestMixin,TemplateView):
+class InterpreterDashboardView(LoginRequiredMixin, InterpreterRequiredMixin, TemplateView):
     template_name = 'trad/home.html'
     
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Récupérer l'interprète
-        interpreter = self.request.user.interpreter_profile
-        
-        # Période pour les statistiques
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+        interpreter = self.request.actor.interpreter
         
-        # Statistiques générales
+        # Statistiques générales (une seule requête agrégée)
+        assignment_stats = get_assignment_stats(interpreter)
         context['stats'] = {
-            'pending_assignments': Assignment.objects.filter(
-                interpreter=interpreter, 
-                status='PENDING'
-            ).count(),
-            'upcoming_assignments': Assignment.objects.filter(
-                interpreter=interpreter,
-                status='CONFIRMED',
-                start_time__gte=timezone.now()
-            ).count(),
-            'completed_assignments': Assignment.objects.filter(
-                interpreter=interpreter,
-                status='COMPLETED',
-                completed_at__gte=thirty_days_ago
-            ).count(),
-            'total_earnings': Payment.objects.filter(
-                assignment__interpreter=interpreter,
-                payment_type='INTERPRETER_PAYMENT',
-                status='COMPLETED',
-                payment_date__gte=thirty_days_ago
-            ).aggregate(total=Sum('amount'))['total'] or 0
+            'pending_assignments': assignment_stats['pending'],
+            'upcoming_assignments': assignment_stats['upcoming'],
+            'completed_assignments': assignment_stats['completed_recent'],
+            'total_earnings': assignment_stats['recent_earnings']
         }
         
         # Missions du jour
-        today = timezone.now().date()
+        day_start, day_end = DateTimeHandler.day_range(timezone.localdate())
         context['today_assignments'] = Assignment.objects.filter(
             interpreter=interpreter,
-            start_time__date=today,
+            start_time__gte=day_start,
+            start_time__lt=day_end,
             status__in=['CONFIRMED', 'IN_PROGRESS']
-        ).order_by('start_time')
+        ).select_related('service_type', 'source_language', 'target_language').order_by('start_time')
         
         # Prochaines missions
         context['upcoming_assignments'] = Assignment.objects.filter(
             interpreter=interpreter,
             status='CONFIRMED',
             start_time__gt=timezone.now()
-        ).order_by('start_time')[:5]
+        ).select_related('service_type', 'source_language', 'target_language').order_by('start_time')[:5]
         
         # Derniers paiements
         context['recent_payments'] = Payment.objects.filter(
             assignment__interpreter=interpreter,
             payment_type='INTERPRETER_PAYMENT'
-        ).order_by('-payment_date')[:5]
+        ).select_related('assignment').order_by('-payment_date')[:5]
         
         # Notifications non lues
         context['unread_notifications'] = Notification.objects.filter(
@@ -1738,23 +1658,10 @@ class InterpreterDashboardView(LoginRequiredMixin, UserPassesTestMixin,TemplateV
         ).order_by('-created_at')[:5]
         
         # Statistiques de performance
-        assignments_completed = Assignment.objects.filter(
-            interpreter=interpreter,
-            status='COMPLETED'
-        )
-        
         context['performance'] = {
-            'total_hours': sum((a.end_time - a.start_time).total_seconds() / 3600 
-                             for a in assignments_completed),
-            'average_rating': assignments_completed.aggregate(
-                avg_rating=Avg('assignmentfeedback__rating')
-            )['avg_rating'] or 0,
-            'completion_rate': (
-                assignments_completed.count() / 
-                Assignment.objects.filter(interpreter=interpreter).count() * 100
-                if Assignment.objects.filter(interpreter=interpreter).exists() 
-                else 0
-            )
+            'total_hours': assignment_stats['lifetime_hours'],
+            'average_rating': assignment_stats['average_rating'],
+            'completion_rate': assignment_stats['completion_rate']
         }
         
         return context
@@ -1764,12 +1671,9 @@ class InterpreterDashboardView(LoginRequiredMixin, UserPassesTestMixin,TemplateV
 # views.py
 
 
-class InterpreterSettingsView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class InterpreterSettingsView(LoginRequiredMixin, InterpreterRequiredMixin, TemplateView):
     template_name = 'trad/settings.html'
     
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
-
     def get_notification_preferences(self):
         try:
             return NotificationPreference.objects.get(user=self.request.user)
@@ -1865,40 +1769,85 @@ class InterpreterSettingsView(LoginRequiredMixin, UserPassesTestMixin, TemplateV
 # views.py
 
 
-class NotificationListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
-    model = Notification
+class NotificationListView(LoginRequiredMixin, InterpreterRequiredMixin, TemplateView):
+    """
+    Centre de notifications : une page par curseur (sans COUNT(*) ni OFFSET)
+    et les compteurs des onglets en une requête groupée.
+    """
     template_name = 'trad/notifications.html'
-    context_object_name = 'notifications'
-    paginate_by = 15
 
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
-
-    def get_queryset(self):
-        return Notification.objects.filter(
-            recipient=self.request.user
-        ).order_by('-created_at')
+    def get_category(self):
+        category = self.request.GET.get('category', 'all')
+        if category not in NOTIFICATION_TABS:
+            return 'all'
+        return category
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        
-        # Grouper les notifications par catégorie
-        context['unread_notifications'] = self.get_queryset().filter(read=False)
-        context['quote_notifications'] = self.get_queryset().filter(
-            Q(type='QUOTE_REQUEST') | Q(type='QUOTE_READY')
-        )
-        context['assignment_notifications'] = self.get_queryset().filter(
-            Q(type='ASSIGNMENT_OFFER') | Q(type='ASSIGNMENT_REMINDER')
-        )
-        context['payment_notifications'] = self.get_queryset().filter(
-            type='PAYMENT_RECEIVED'
-        )
-        context['system_notifications'] = self.get_queryset().filter(
-            type='SYSTEM'
-        )
-        
+        category = self.get_category()
+        try:
+            page = get_notification_page(self.request.user, category, self.request.GET.get('cursor'))
+        except InvalidCursor:
+            page = get_notification_page(self.request.user, category)
+
+        context['notifications'] = page['items']
+        context['next_cursor'] = page['next_cursor']
+        context['counts'] = get_notification_counts(self.request.user)
+        context['category'] = category
         return context
 
+
+@login_required
+@require_GET
+def notifications_api(request):
+    """Page suivante du centre de notifications (défilement infini)"""
+    category = request.GET.get('category', 'all')
+    if category not in NOTIFICATION_TABS:
+        return JsonResponse({'error': 'Invalid category'}, status=400)
+    try:
+        page = get_notification_page(request.user, category, request.GET.get('cursor'))
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+
+    return JsonResponse({
+        'notifications': [serialize_notification(notification) for notification in page['items']],
+        'html': render_to_string('trad/notification_items.html', {'notifications': page['items']}, request=request),
+        'next_cursor': page['next_cursor'],
+        'has_next': page['has_next'],
+    })
+
+# Intervalle des commentaires keep-alive (proxies qui coupent les connexions inactives)
+EVENT_STREAM_HEARTBEAT = 25
+
+
+async def event_stream(request):
+    """
+    Flux Server-Sent Events de l'utilisateur connecté : offres de mission,
+    notifications et changements de statut (voir app.services.events).
+    Servi par config/asgi.py ; remplace le polling des badges.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+
+    async def stream():
+        async with get_event_bus().subscribe(get_user_channel(user.pk)) as queue:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), EVENT_STREAM_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield format_sse(message)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
 @require_POST
 def mark_notification_as_read(request, pk):
     notification = get_object_or_404(Notification, pk=pk, recipient=request.user)
@@ -1906,26 +1855,25 @@ def mark_notification_as_read(request, pk):
     notification.save()
     return JsonResponse({'status': 'success'})
 
+@login_required
 @require_POST
 def mark_all_notifications_as_read(request):
     Notification.objects.filter(
         recipient=request.user,
         read=False
     ).update(read=True)
+    reset_unread_count(NOTIFICATIONS, request.user.pk)
     return JsonResponse({'status': 'success'})
 
 
 # views.py
 
-class InterpreterScheduleView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class InterpreterScheduleView(LoginRequiredMixin, InterpreterRequiredMixin, TemplateView):
     template_name = 'trad/schedule.html'
 
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        interpreter = self.request.user.interpreter_profile
+        interpreter = self.request.actor.interpreter
 
         # Récupérer la date actuelle
         now = timezone.now()
@@ -1935,34 +1883,90 @@ class InterpreterScheduleView(LoginRequiredMixin, UserPassesTestMixin, TemplateV
             interpreter=interpreter,
             status__in=['CONFIRMED', 'ASSIGNED'],
             start_time__gte=now
-        ).order_by('start_time')[:5]
+        ).select_related('service_type', 'source_language', 'target_language').order_by('start_time')[:5]
 
         # Missions en cours
         context['current_assignments'] = Assignment.objects.filter(
             interpreter=interpreter,
             status='IN_PROGRESS'
-        )
+        ).select_related('service_type', 'source_language', 'target_language')
 
         # Statistiques de la semaine
         week_start = now - timedelta(days=now.weekday())
         week_end = week_start + timedelta(days=7)
-        weekly_assignments = Assignment.objects.filter(
+        weekly_totals = get_hours_totals(Assignment.objects.filter(
             interpreter=interpreter,
             start_time__range=(week_start, week_end),
             status__in=['CONFIRMED', 'IN_PROGRESS', 'COMPLETED']
-        )
+        ))
 
         context['weekly_stats'] = {
-            'total_assignments': weekly_assignments.count(),
-            'total_hours': sum(
-                (a.end_time - a.start_time).total_seconds() / 3600 
-                for a in weekly_assignments
-            ),
-            'earnings': sum(a.total_interpreter_payment or 0 for a in weekly_assignments)
+            'total_assignments': weekly_totals['count'],
+            'total_hours': weekly_totals['hours'],
+            'earnings': weekly_totals['earnings']
         }
 
+        # Disponibilités (créneaux normalisés et exceptions à venir)
+        context['weekly_availability'] = get_weekly_availability(interpreter)
+        context['availability_exceptions'] = get_upcoming_exceptions(interpreter)
+
         return context
 
+async def _aget_interpreter(user):
+    """Profil interprète d'un utilisateur (vues async), ou None"""
+    if not user.is_authenticated:
+        return None
+    try:
+        # Déjà chargé avec l'utilisateur par ProfileModelBackend (request.auser() compris)
+        if User.interpreter_profile.is_cached(user):
+            return user.interpreter_profile
+        # Sessions ouvertes avec ModelBackend : profil non chargé
+        return await Interpreter.objects.aget(user=user)
+    except Interpreter.DoesNotExist:
+        return None
+
+
+CALENDAR_STATUS_COLORS = {
+    'PENDING': '#FFA500',    # Orange
+    'ASSIGNED': '#4299e1',   # Bleu clair
+    'CONFIRMED': '#48bb78',  # Vert
+    'IN_PROGRESS': '#805ad5', # Violet
+    'COMPLETED': '#718096',  # Gris
+    'CANCELLED': '#f56565',  # Rouge
+    'NO_SHOW': '#ed8936',    # Orange foncé
+}
+
+
+def _calendar_event(assignment):
+    """Événement FullCalendar d'une mission (source_language, target_language, service_type chargés)"""
+    color = CALENDAR_STATUS_COLORS.get(assignment.status)
+    return {
+        'id': assignment.id,
+        'title': f"{assignment.client_name or 'Unspecified Client'} - {assignment.service_type.name}",
+        'start': assignment.start_time.isoformat(),
+        'end': assignment.end_time.isoformat(),
+        'backgroundColor': color,
+        'borderColor': color,
+        'extendedProps': {
+            'status': assignment.status,
+            'location': assignment.location,
+            'city': assignment.city,
+            'languages': f"{assignment.source_language.name} → {assignment.target_language.name}",
+            'rate': float(assignment.interpreter_rate),
+            'hours': float(assignment.duration_hours or 0),
+            'total_payment': float(assignment.total_interpreter_payment or 0),
+            'special_requirements': assignment.special_requirements or 'None'
+        }
+    }
+
+
+def _calendar_assignments_queryset(interpreter, start, end):
+    return Assignment.objects.filter(
+        interpreter=interpreter,
+        start_time__range=[start, end]
+    ).select_related('service_type', 'source_language', 'target_language')
+
+
 def get_calendar_assignments(request):
     """Vue API pour récupérer les missions pour le calendrier"""
     if not request.user.is_authenticated or request.user.role != 'INTERPRETER':
@@ -1970,94 +1974,96 @@ def get_calendar_assignments(request):
 
     start = request.GET.get('start')
     end = request.GET.get('end')
+    if not start or not end:
+        return JsonResponse({'error': 'start and end are required'}, status=400)
     interpreter = request.user.interpreter_profile
 
-    assignments = Assignment.objects.filter(
-        interpreter=interpreter,
-        start_time__range=[start, end]
-    ).select_related('client', 'service_type')
-
-    events = []
-    status_colors = {
-        'PENDING': '#FFA500',    # Orange
-        'ASSIGNED': '#4299e1',   # Bleu clair
-        'CONFIRMED': '#48bb78',  # Vert
-        'IN_PROGRESS': '#805ad5', # Violet
-        'COMPLETED': '#718096',  # Gris
-        'CANCELLED': '#f56565',  # Rouge
-        'NO_SHOW': '#ed8936',    # Orange foncé
-    }
+    events = [
+        _calendar_event(assignment)
+        for assignment in _calendar_assignments_queryset(interpreter, start, end)
+    ]
+    return JsonResponse(events, safe=False)
 
-    for assignment in assignments:
-        events.append({
-            'id': assignment.id,
-            'title': f"{assignment.client.full_name} - {assignment.service_type.name}",
-            'start': assignment.start_time.isoformat(),
-            'end': assignment.end_time.isoformat(),
-            'backgroundColor': status_colors[assignment.status],
-            'borderColor': status_colors[assignment.status],
-            'extendedProps': {
-                'status': assignment.status,
-                'location': assignment.location,
-                'city': assignment.city,
-                'languages': f"{assignment.source_language.name} → {assignment.target_language.name}",
-                'rate': float(assignment.interpreter_rate),
-                'hours': (assignment.end_time - assignment.start_time).total_seconds() / 3600,
-                'total_payment': float(assignment.total_interpreter_payment or 0),
-                'special_requirements': assignment.special_requirements or 'None'
-            }
-        })
 
+async def get_calendar_assignments_async(request):
+    """Version async (ORM async) de get_calendar_assignments"""
+    user = await request.auser()
+    if not user.is_authenticated or user.role != 'INTERPRETER':
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+
+    start = request.GET.get('start')
+    end = request.GET.get('end')
+    if not start or not end:
+        return JsonResponse({'error': 'start and end are required'}, status=400)
+    interpreter = await _aget_interpreter(user)
+    if interpreter is None:
+        return JsonResponse({'error': 'Interpreter profile required'}, status=403)
+
+    events = [
+        _calendar_event(assignment)
+        async for assignment in _calendar_assignments_queryset(interpreter, start, end)
+    ]
     return JsonResponse(events, safe=False)
 
 
 
 
 
-class AssignmentListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class AssignmentListView(LoginRequiredMixin, InterpreterRequiredMixin, KeysetPaginationMixin, ListView):
+    """
+    Missions de l'interprète par onglet (?tab=), chaque onglet paginé par
+    curseur : seule la page de l'onglet affiché est chargée.
+    """
     template_name = 'trad/assignment.html'
     context_object_name = 'assignments'
+    # onglet -> (champ du curseur, ordre décroissant)
+    TABS = {
+        'pending': ('start_time', False),
+        'upcoming': ('start_time', False),
+        'in-progress': ('start_time', False),
+        'completed': ('completed_at', True),
+    }
+    DEFAULT_TAB = 'pending'
 
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
+    def get_tab(self):
+        tab = self.request.GET.get('tab')
+        return tab if tab in self.TABS else self.DEFAULT_TAB
 
     def get_queryset(self):
-        return Assignment.objects.filter(
-            interpreter=self.request.user.interpreter_profile
-        ).order_by('start_time')
+        self.tab = self.get_tab()
+        self.keyset_field, self.keyset_descending = self.TABS[self.tab]
+        now = timezone.now()
+        queryset = Assignment.objects.filter(
+            interpreter=self.request.actor.interpreter
+        ).select_related('service_type', 'source_language', 'target_language')
+
+        if self.tab == 'pending':
+            return queryset.filter(status=Assignment.Status.PENDING)
+        if self.tab == 'upcoming':
+            return queryset.filter(status=Assignment.Status.CONFIRMED, start_time__gt=now)
+        if self.tab == 'in-progress':
+            return queryset.filter(status=Assignment.Status.IN_PROGRESS)
+        # Terminées (derniers 30 jours)
+        return queryset.filter(
+            status=Assignment.Status.COMPLETED,
+            completed_at__gte=now - timedelta(days=30)
+        )
+
+    def serialize_object(self, assignment):
+        return _assignment_detail(assignment)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        interpreter = self.request.user.interpreter_profile
-        now = timezone.now()
-        
-        # Assignments en attente de confirmation (PENDING)
-        context['pending_assignments'] = Assignment.objects.filter(
-            interpreter=interpreter,
-            status='PENDING'
-        ).order_by('start_time')
-        
-        # Assignments confirmés à venir
-        context['upcoming_assignments'] = Assignment.objects.filter(
-            interpreter=interpreter,
-            status='CONFIRMED',
-            start_time__gt=now
-        ).order_by('start_time')
-        
-        # Assignments en cours
-        context['in_progress_assignments'] = Assignment.objects.filter(
-            interpreter=interpreter,
-            status='IN_PROGRESS'
-        ).order_by('start_time')
-        
-        # Assignments terminés (derniers 30 jours)
-        thirty_days_ago = now - timedelta(days=30)
-        context['completed_assignments'] = Assignment.objects.filter(
-            interpreter=interpreter,
-            status='COMPLETED',
-            completed_at__gte=thirty_days_ago
-        ).order_by('-completed_at')
         
+        # Compteurs des onglets (une seule requête agrégée)
+        stats = get_assignment_stats(self.request.actor.interpreter)
+        context['assignment_counts'] = {
+            'pending': stats['pending'],
+            'upcoming': stats['upcoming'],
+            'in_progress': stats['in_progress'],
+            'completed': stats['completed_recent']
+        }
+        context['active_tab'] = self.tab
         return context
 
 
@@ -2310,66 +2316,83 @@ def accept_assignment(request, pk):
     if not assignment.can_be_confirmed():
         return JsonResponse({'error': 'Invalid status'}, status=400)
     
-    conflicting_assignments = Assignment.objects.filter(
-        interpreter=request.user.interpreter_profile,
-        status__in=['CONFIRMED', 'IN_PROGRESS'],
-        start_time__lt=assignment.end_time,
-        end_time__gt=assignment.start_time
-    ).exists()
+    conflicting_assignments = get_conflicts(assignment)
     
     if conflicting_assignments:
         return JsonResponse({
             'error': 'Schedule conflict',
-            'message': 'You already have an assignment during this time period'
+            'message': 'You already have an assignment during this time period',
+            'conflicts': describe_conflicts(conflicting_assignments)
         }, status=400)
     
     if assignment.confirm():
-        try:
-            send_confirmation_email(assignment)
-        except Exception as e:
-            print(f"Error sending confirmation email: {str(e)}")
-            
-        try:
-            send_admin_notification_email(assignment)
-        except Exception as e:
-            print(f"Error sending admin notification email: {str(e)}")
-            
+        enqueue_on_commit(send_assignment_confirmation_email, assignment.id)
+        enqueue_on_commit(send_assignment_admin_notification_email, assignment.id)
         return JsonResponse({'status': 'success'})
     
     return JsonResponse({'error': 'Could not confirm assignment'}, status=400)
 
-class AssignmentDetailView(LoginRequiredMixin, UserPassesTestMixin, View):
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
+def _assignment_detail(assignment):
+    return {
+        'id': assignment.id,
+        'start_time': assignment.start_time.isoformat(),
+        'end_time': assignment.end_time.isoformat(),
+        'location': assignment.location,
+        'city': assignment.city,
+        'state': assignment.state,
+        'zip_code': assignment.zip_code,
+        'service_type': assignment.service_type.name,
+        'source_language': assignment.source_language.name,
+        'target_language': assignment.target_language.name,
+        'interpreter_rate': str(assignment.interpreter_rate),
+        'minimum_hours': assignment.minimum_hours,
+        'status': assignment.status,
+        'special_requirements': assignment.special_requirements or '',
+        'notes': assignment.notes or '',
+        'can_start': assignment.can_be_started(),
+        'can_complete': assignment.can_be_completed(),
+        'can_cancel': assignment.can_be_cancelled()
+    }
+
 
+class AssignmentDetailView(LoginRequiredMixin, InterpreterRequiredMixin, View):
     def get(self, request, pk):
-        assignment = get_object_or_404(Assignment, pk=pk)
+        assignment = get_object_or_404(
+            Assignment.objects.select_related('service_type', 'source_language', 'target_language'),
+            pk=pk
+        )
         
-        if assignment.interpreter != request.user.interpreter_profile:
+        if assignment.interpreter_id != request.actor.interpreter.pk:
             return JsonResponse({'error': 'Unauthorized'}, status=403)
 
-        data = {
-            'id': assignment.id,
-            'start_time': assignment.start_time.isoformat(),
-            'end_time': assignment.end_time.isoformat(),
-            'location': assignment.location,
-            'city': assignment.city,
-            'state': assignment.state,
-            'zip_code': assignment.zip_code,
-            'service_type': assignment.service_type.name,
-            'source_language': assignment.source_language.name,
-            'target_language': assignment.target_language.name,
-            'interpreter_rate': str(assignment.interpreter_rate),
-            'minimum_hours': assignment.minimum_hours,
-            'status': assignment.status,
-            'special_requirements': assignment.special_requirements or '',
-            'notes': assignment.notes or '',
-            'can_start': assignment.can_be_started(),
-            'can_complete': assignment.can_be_completed(),
-            'can_cancel': assignment.can_be_cancelled()
-        }
-        
-        return JsonResponse(data)
+        return JsonResponse(_assignment_detail(assignment))
+
+
+class AssignmentDetailAsyncView(View):
+    """
+    Version async (ORM async) d'AssignmentDetailView. Les mixins d'accès
+    étant synchrones, l'authentification est vérifiée dans get().
+    """
+
+    async def get(self, request, pk):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        if user.role != 'INTERPRETER':
+            return JsonResponse({'error': 'Unauthorized'}, status=403)
+
+        interpreter = await _aget_interpreter(user)
+        try:
+            assignment = await Assignment.objects.select_related(
+                'service_type', 'source_language', 'target_language'
+            ).aget(pk=pk)
+        except Assignment.DoesNotExist:
+            raise Http404('No Assignment matches the given query.')
+
+        if interpreter is None or assignment.interpreter_id != interpreter.pk:
+            return JsonResponse({'error': 'Unauthorized'}, status=403)
+
+        return JsonResponse(_assignment_detail(assignment))
 
 @require_POST
 @login_required
@@ -2422,11 +2445,7 @@ def complete_assignment(request, pk):
         return JsonResponse({'error': 'Invalid status'}, status=400)
         
     if assignment.complete():
-        try:
-            send_completion_email(assignment)
-        except Exception as e:
-            print(f"Error sending completion email: {str(e)}")
-            
+        enqueue_on_commit(send_assignment_completion_email, assignment.id)
         return JsonResponse({
             'status': 'success',
             'payment': str(assignment.total_interpreter_payment)
@@ -2439,13 +2458,13 @@ def get_assignment_counts(request):
     if request.user.role != 'INTERPRETER':
         return JsonResponse({'error': 'Unauthorized'}, status=403)
     
-    interpreter = request.user.interpreter_profile
+    stats = get_assignment_stats(request.user.interpreter_profile)
     
     counts = {
-        'pending': Assignment.objects.filter(interpreter=interpreter, status='PENDING').count(),
-        'upcoming': Assignment.objects.filter(interpreter=interpreter, status='CONFIRMED').count(),
-        'in_progress': Assignment.objects.filter(interpreter=interpreter, status='IN_PROGRESS').count(),
-        'completed': Assignment.objects.filter(interpreter=interpreter, status='COMPLETED').count()
+        'pending': stats['pending'],
+        'upcoming': stats['confirmed'],
+        'in_progress': stats['in_progress'],
+        'completed': stats['completed']
     }
     
     return JsonResponse(counts)
@@ -2458,6 +2477,7 @@ def mark_assignments_as_read(request):
         interpreter=interpreter,
         is_read=False
     ).update(is_read=True)
+    reset_unread_count(ASSIGNMENTS, request.user.pk)
     return JsonResponse({'status': 'success'})
 
 @login_required
@@ -2465,65 +2485,58 @@ def get_unread_assignments_count(request):
     if request.user.role != 'INTERPRETER':
         return JsonResponse({'count': 0})
         
-    count = AssignmentNotification.get_unread_count(request.user.interpreter_profile)
+    # Compteur en cache (clé par utilisateur) : aucune requête quand il est chaud
+    count = get_unread_count(ASSIGNMENTS, request.user.pk)
     return JsonResponse({'count': count})
+
+
+@login_required
+def get_unread_notifications_count(request):
+    return JsonResponse({'count': get_unread_count(NOTIFICATIONS, request.user.pk)})
 # views.py
 
 
-class TranslatorEarningsView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+class TranslatorEarningsView(LoginRequiredMixin, InterpreterRequiredMixin, TemplateView):
     template_name = 'trad/earnings.html'
 
-    def test_func(self):
-        return self.request.user.role == 'INTERPRETER'
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        interpreter = self.request.user.interpreter_profile
-        now = timezone.now()
+        interpreter = self.request.actor.interpreter
+        today = timezone.localdate()
 
         # Statistiques générales
         all_payments = Payment.objects.filter(
             assignment__interpreter=interpreter,
             payment_type='INTERPRETER_PAYMENT'
         )
+        # Agrégats journaliers pré-calculés (InterpreterDailyRollup)
+        rollups = InterpreterDailyRollup.objects.filter(interpreter=interpreter)
 
         # Statistiques du mois en cours
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        current_month_payments = all_payments.filter(payment_date__gte=current_month_start)
+        current_month = get_rollup_totals(rollups.filter(day__gte=today.replace(day=1)))
 
         context['current_month'] = {
-            'earnings': current_month_payments.filter(status='COMPLETED').aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00'),
-            'pending': current_month_payments.filter(status='PENDING').aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00'),
-            'assignments': current_month_payments.count(),
+            'earnings': current_month['payments_completed'],
+            'pending': current_month['payments_pending'],
+            'assignments': current_month['payments_count'],
         }
 
         # Statistiques des 12 derniers mois
-        twelve_months_ago = now - timedelta(days=365)
-        monthly_earnings = all_payments.filter(
-            payment_date__gte=twelve_months_ago,
-            status='COMPLETED'
-        ).annotate(
-            month=TruncMonth('payment_date')
-        ).values('month').annotate(
-            total=Sum('amount'),
-            count=Count('id')
-        ).order_by('month')
+        twelve_months_ago = today - timedelta(days=365)
+        monthly_earnings = [
+            {'month': row['period'], 'total': row['payments_completed'], 'count': row['payments_completed_count']}
+            for row in get_rollup_series(rollups.filter(day__gte=twelve_months_ago), TruncMonth('day'))
+            if row['payments_completed_count']
+        ]
 
         context['monthly_earnings'] = monthly_earnings
 
         # Statistiques annuelles
-        yearly_earnings = all_payments.filter(
-            status='COMPLETED'
-        ).annotate(
-            year=TruncYear('payment_date')
-        ).values('year').annotate(
-            total=Sum('amount'),
-            count=Count('id')
-        ).order_by('-year')
+        yearly_earnings = [
+            {'year': row['period'], 'total': row['payments_completed'], 'count': row['payments_completed_count']}
+            for row in reversed(get_rollup_series(rollups, TruncYear('day')))
+            if row['payments_completed_count']
+        ]
 
         context['yearly_earnings'] = yearly_earnings
 
@@ -2538,23 +2551,19 @@ class TranslatorEarningsView(LoginRequiredMixin, UserPassesTestMixin, TemplateVi
         ).select_related('assignment').order_by('-payment_date')
 
         # Statistiques globales
+        lifetime = get_rollup_totals(rollups)
         context['total_stats'] = {
-            'lifetime_earnings': all_payments.filter(status='COMPLETED').aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00'),
-            'total_assignments': all_payments.filter(status='COMPLETED').count(),
-            'pending_amount': all_payments.filter(status='PENDING').aggregate(
-                total=Sum('amount')
-            )['total'] or Decimal('0.00'),
-            'average_payment': all_payments.filter(
-                status='COMPLETED'
-            ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00') / (
-                all_payments.filter(status='COMPLETED').count() or 1
+            'lifetime_earnings': lifetime['payments_completed'],
+            'total_assignments': lifetime['payments_completed_count'],
+            'pending_amount': lifetime['payments_pending'],
+            'average_payment': (
+                lifetime['payments_completed'] / lifetime['payments_completed_count']
+                if lifetime['payments_completed_count'] else Decimal('0.00')
             )
         }
 
         # Liste des années pour le filtre
-        context['years'] = yearly_earnings.values_list('year', flat=True)
+        context['years'] = [row['year'] for row in yearly_earnings]
 
         return context
 
@@ -2564,23 +2573,17 @@ class TranslatorEarningsView(LoginRequiredMixin, UserPassesTestMixin, TemplateVi
 def get_earnings_data(request, year=None):
     """Vue API pour obtenir les données des gains pour les graphiques"""
     interpreter = request.user.interpreter_profile
-    payments = Payment.objects.filter(
-        assignment__interpreter=interpreter,
-        payment_type='INTERPRETER_PAYMENT'
-    )
+    rollups = InterpreterDailyRollup.objects.filter(interpreter=interpreter)
 
     if year:
-        payments = payments.filter(payment_date__year=year)
+        rollups = rollups.filter(day__year=year)
 
-    # Données mensuelles
-    monthly_data = payments.filter(
-        status='COMPLETED'
-    ).annotate(
-        month=TruncMonth('payment_date')
-    ).values('month').annotate(
-        total=Sum('amount'),
-        count=Count('id')
-    ).order_by('month')
+    # Données mensuelles (depuis les agrégats journaliers)
+    monthly_data = [
+        {'month': row['period'], 'total': row['payments_completed'], 'count': row['payments_completed_count']}
+        for row in get_rollup_series(rollups, TruncMonth('day'))
+        if row['payments_completed_count']
+    ]
 
     # Formatter les données pour les graphiques
     chart_data = {
@@ -2614,7 +2617,7 @@ def dashboard_view(request):
     logger.info(f"Accès au dashboard: User ID={user_id}, Username={username}")
     
     # Vérifier si l'utilisateur a un profil d'interprète
-    if not hasattr(request.user, 'interpreter_profile'):
+    if request.actor.interpreter is None:
         logger.warning(f"Accès refusé: User ID={user_id} n'a pas de profil d'interprète")
         return render(request, 'error.html', {
             'message': 'Access denied. Interpreter profile required.',
@@ -2622,36 +2625,22 @@ def dashboard_view(request):
             'user_id': user_id
         })
 
-    interpreter = request.user.interpreter_profile
+    interpreter = request.actor.interpreter
     logger.info(f"Profil d'interprète trouvé: ID={interpreter.id}")
 
     try:
-        # Log du début de chaque étape principale
-        logger.info(f"Début du calcul des statistiques pour interpreter_id={interpreter.id}")
-        # Calcul des statistiques
-        stats = get_interpreter_stats(interpreter)
-        logger.info(f"Statistiques calculées avec succès pour interpreter_id={interpreter.id}")
-
-        # Récupération des missions
-        logger.info(f"Récupération des missions en attente pour interpreter_id={interpreter.id}")
-        pending_assignments = get_pending_assignments(interpreter)
-        logger.info(f"Nombre de missions en attente: {len(pending_assignments)}")
-        
-        logger.info(f"Récupération des missions confirmées pour interpreter_id={interpreter.id}")
-        confirmed_assignments = get_confirmed_assignments(interpreter)
-        logger.info(f"Nombre de missions confirmées: {len(confirmed_assignments)}")
-
-        # Préparation des données
-        logger.info("Préparation des données des missions en attente")
-        pending_data = prepare_assignments_data(request, pending_assignments, 'PENDING')
-        
-        logger.info("Préparation des données des missions confirmées")
-        confirmed_data = prepare_assignments_data(request, confirmed_assignments, 'CONFIRMED')
-
+        # Statistiques et missions calculées au rendu, seulement si le
+        # fragment correspondant n'est pas en cache
         context = {
-            'stats': stats,
-            'pending_assignments': pending_data,
-            'confirmed_assignments': confirmed_data
+            'stats': SimpleLazyObject(lambda: get_interpreter_stats(interpreter)),
+            'pending_assignments': SimpleLazyObject(lambda: prepare_assignments_data(
+                request, get_pending_assignments(interpreter), 'PENDING'
+            )),
+            'confirmed_assignments': SimpleLazyObject(lambda: prepare_assignments_data(
+                request, get_confirmed_assignments(interpreter), 'CONFIRMED'
+            )),
+            'fragment_key': get_fragment_key(interpreter),
+            'fragment_timeout': FRAGMENT_TIMEOUT,
         }
 
         logger.info(f"Rendu du template interpreter/int_main.html pour interpreter_id={interpreter.id}")
@@ -2684,63 +2673,36 @@ def get_interpreter_stats(interpreter):
     - Nombre de missions en attente
     - Nombre de missions confirmées et futures
     """
-    # Obtenir le début et la fin de la semaine courante
-    today = timezone.now()
-    start_of_week = today - timedelta(days=today.weekday())
-    start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_week = start_of_week + timedelta(days=7)
-
-    # Calculer les gains de la semaine
-    weekly_earnings = Assignment.objects.filter(
-        interpreter=interpreter,
-        status='COMPLETED',
-        completed_at__range=(start_of_week, end_of_week)
-    ).aggregate(total=Sum('total_interpreter_payment'))['total']
-
-    pending_count = Assignment.objects.filter(
-        interpreter=interpreter,
-        status='PENDING'
-    ).count()
-
-    upcoming_count = Assignment.objects.filter(
-        interpreter=interpreter,
-        status='CONFIRMED',
-        start_time__gt=timezone.now()
-    ).count()
+    stats = get_assignment_stats(interpreter)
+    weekly_earnings = stats['weekly_earnings']
 
     return {
-        'weekly_earnings': '-' if weekly_earnings is None else round(weekly_earnings, 2),
+        'weekly_earnings': '-' if not weekly_earnings else round(weekly_earnings, 2),
         'earnings_info': 'Click on Payments for more details',  # Message d'information
-        'pending_missions': pending_count,
-        'upcoming_missions': upcoming_count
+        'pending_missions': stats['pending'],
+        'upcoming_missions': stats['upcoming']
     }
 
 
 def get_pending_assignments(interpreter):
     """
-    Récupère les missions en attente avec les relations nécessaires.
+    Récupère les missions en attente (langues et type de service : voir
+    prepare_assignments_data).
     """
     return Assignment.objects.filter(
         interpreter=interpreter,
         status='PENDING'
-    ).select_related(
-        'service_type',
-        'source_language',
-        'target_language'
     ).order_by('start_time')
 
 
 def get_confirmed_assignments(interpreter):
     """
-    Récupère les missions confirmées avec les relations nécessaires.
+    Récupère les missions confirmées (langues et type de service : voir
+    prepare_assignments_data).
     """
     return Assignment.objects.filter(
         interpreter=interpreter,
         status='CONFIRMED'
-    ).select_related(
-        'service_type',
-        'source_language',
-        'target_language'
     ).order_by('start_time')
 
 
@@ -2752,7 +2714,8 @@ def prepare_assignments_data(request, assignments, status_type):
     mixin = AssignmentAdminMixin()
     assignments_data = []
 
-    for assignment in assignments:
+    # Langues et type de service depuis le cache des référentiels, sans jointure
+    for assignment in attach_reference_data(assignments):
         # Génération des tokens ou URLs d'action selon le type de statut
         action_urls = {}
         if status_type == 'PENDING':
@@ -2856,16 +2819,13 @@ def mark_assignment_complete(request, assignment_id):
             mixin.handle_status_change(request, assignment, old_status)
             logger.info("Status change handled successfully")
 
-            # Envoi de l'email de completion
-            email_sent = mixin.send_assignment_email(request, assignment, 'completed')
-            if email_sent:
-                logger.info("Email de completion envoyé avec succès")
-            else:
-                logger.warning("L'email de completion n'a pas pu être envoyé")
-                
-            # Gestion des notifications de changement de statut
-            mixin.handle_status_change_notification(request, assignment, old_status)
-            logger.info("Notifications de changement de statut envoyées")
+            # Email de completion (celui de la notification de changement de statut),
+            # envoyé une seule fois par Celery après commit
+            enqueue_on_commit(
+                send_assignment_notification_email, assignment.id, 'completed',
+                f"{request.scheme}://{request.get_host()}"
+            )
+            logger.info("Email de completion mis en file")
 
         except Exception as e:
             logger.error(f"Erreur lors de la gestion des notifications: {str(e)}")
@@ -2883,59 +2843,20 @@ def mark_assignment_complete(request, assignment_id):
             'message': str(e)
         }, status=500)
 
-@login_required
-def calendar_view(request):
-    """
-    Vue pour afficher le calendrier des rendez-vous de l'interprète
-    """
-    # Vérifier si l'utilisateur a un profil d'interprète
-    if not hasattr(request.user, 'interpreter_profile'):
-        return render(request, 'error.html', {
-            'message': 'Access denied. Interpreter profile required.'
-        })
-
-    interpreter = request.user.interpreter_profile
-
-    # Récupérer le mois actuel ou le mois demandé dans les paramètres
-    try:
-        year = int(request.GET.get('year', timezone.now().year))
-        month = int(request.GET.get('month', timezone.now().month))
-    except ValueError:
-        year = timezone.now().year
-        month = timezone.now().month
-
-    # Créer les dates de début et fin du mois
-    start_date = timezone.datetime(year, month, 1)
-    if month == 12:
-        end_date = timezone.datetime(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = timezone.datetime(year, month + 1, 1) - timedelta(days=1)
-
+def get_month_missions_by_date(interpreter, month_start, month_end):
+    """Missions du mois de l'interprète, groupées par jour local avec le nombre par statut"""
     # Récupérer toutes les missions du mois pour l'interprète
+    # (intervalle semi-ouvert sur start_time, calculé à Boston)
     assignments = Assignment.objects.filter(
         interpreter=interpreter,
-        start_time__date__range=[start_date, end_date]
-    ).select_related(
-        
-        'source_language', 
-        'target_language'
+        start_time__gte=month_start,
+        start_time__lt=month_end
     ).order_by('start_time')
 
-    # Récupération des prochaines missions (aujourd'hui et à venir)
-    now = timezone.now()
-    upcoming_assignments = Assignment.objects.filter(
-        interpreter=interpreter,
-        start_time__gte=now
-    ).select_related(
-        
-        'source_language', 
-        'target_language'
-    ).order_by('start_time')[:5]  # Limite aux 5 prochaines missions
-
-    # Grouper les missions par jour avec leur statut
+    # Grouper les missions par jour avec leur statut (langues depuis le cache des référentiels)
     assignments_by_date = {}
-    for assignment in assignments:
-        date_key = assignment.start_time.date()
+    for assignment in attach_reference_data(assignments):
+        date_key = timezone.localtime(assignment.start_time).date()
         if date_key not in assignments_by_date:
             assignments_by_date[date_key] = {
                 'missions': [],
@@ -2971,9 +2892,21 @@ def calendar_view(request):
         assignments_by_date[date_key]['missions'].append(mission_details)
         assignments_by_date[date_key]['status_count'][assignment.status] += 1
 
-    # Préparation des données pour les missions à venir
+    return assignments_by_date
+
+
+def get_upcoming_mission_details(interpreter):
+    """Détails des 5 prochaines missions de l'interprète"""
+    # Récupération des prochaines missions (aujourd'hui et à venir)
+    now = timezone.now()
+    upcoming_assignments = Assignment.objects.filter(
+        interpreter=interpreter,
+        start_time__gte=now
+    ).order_by('start_time')[:5]  # Limite aux 5 prochaines missions
+
+    # Préparation des données pour les missions à venir (langues depuis le cache des référentiels)
     upcoming_missions_details = []
-    for assignment in upcoming_assignments:
+    for assignment in attach_reference_data(upcoming_assignments):
         upcoming_mission = {
             'id': assignment.id,
             'start_time': assignment.start_time,
@@ -3001,26 +2934,54 @@ def calendar_view(request):
         }
         upcoming_missions_details.append(upcoming_mission)
 
-    # Récupérer les missions du jour actuel
-    today = timezone.now().date()
-    todays_assignments = []
-    
-    # Filtrer les missions pour aujourd'hui
-    if today in assignments_by_date:
-        todays_assignments = assignments_by_date[today]['missions']
+    return upcoming_missions_details
+
+
+@login_required
+def calendar_view(request):
+    """
+    Vue pour afficher le calendrier des rendez-vous de l'interprète
+    """
+    # Vérifier si l'utilisateur a un profil d'interprète
+    if request.actor.interpreter is None:
+        return render(request, 'error.html', {
+            'message': 'Access denied. Interpreter profile required.'
+        })
+
+    interpreter = request.actor.interpreter
+
+    # Récupérer le mois actuel ou le mois demandé dans les paramètres
+    today = timezone.localdate()
+    try:
+        year = int(request.GET.get('year', today.year))
+        month = int(request.GET.get('month', today.month))
+        month_start, month_end = DateTimeHandler.month_range(year, month)
+    except ValueError:
+        year, month = today.year, today.month
+        month_start, month_end = DateTimeHandler.month_range(year, month)
+
+    # Missions calculées au rendu, seulement si le fragment n'est pas en cache
+    assignments_by_date = SimpleLazyObject(
+        lambda: get_month_missions_by_date(interpreter, month_start, month_end)
+    )
+    todays_assignments = SimpleLazyObject(
+        lambda: assignments_by_date[today]['missions'] if today in assignments_by_date else []
+    )
 
     # Créer le contexte avec toutes les données nécessaires
     context = {
         'current_year': year,
         'current_month': month,
         'assignments_by_date': assignments_by_date,
-        'upcoming_missions': upcoming_missions_details,
+        'upcoming_missions': SimpleLazyObject(lambda: get_upcoming_mission_details(interpreter)),
         'todays_assignments': todays_assignments,  # Ajout des missions du jour
         'statuses': Assignment.Status.choices,
         'today': today,
         'interpreter': interpreter,
         'current_time': timezone.now(),
-        'has_appointments_today': len(todays_assignments) > 0  # Indicateur pour savoir s'il y a des missions aujourd'hui
+        'has_appointments_today': SimpleLazyObject(lambda: len(todays_assignments) > 0),
+        'fragment_key': get_fragment_key(interpreter),
+        'fragment_timeout': FRAGMENT_TIMEOUT,
     }
 
     return render(request, 'interpreter/int_calend.html', context)
@@ -3032,41 +2993,30 @@ def calendar_data_api(request, year, month):
     """
     API pour récupérer les données du calendrier pour un mois spécifique
     """
-    if not hasattr(request.user, 'interpreter_profile'):
+    if request.actor.interpreter is None:
         return JsonResponse({'error': 'Interpreter profile required'}, status=403)
 
-    interpreter = request.user.interpreter_profile
-    
-    # Créer les dates de début et fin du mois
-    start_date = date(year, month, 1)
-    if month == 12:
-        end_date = date(year + 1, 1, 1)
-    else:
-        end_date = date(year, month + 1, 1)
+    interpreter = request.actor.interpreter
 
-    # Récupérer toutes les missions du mois
-    assignments = Assignment.objects.filter(
-        interpreter=interpreter,
-        start_time__date__range=[start_date, end_date - timedelta(days=1)]
-    ).values('start_time__date', 'status')
-
-    # Organiser les données par date
-    dates_data = {}
-    for assignment in assignments:
-        date_str = assignment['start_time__date'].isoformat()
-        if date_str not in dates_data:
-            dates_data[date_str] = {
-                'has_missions': True,
-                'mission_count': 1,
-                'status_summary': {status[0]: 0 for status in Assignment.Status.choices}
-            }
-        else:
-            dates_data[date_str]['mission_count'] += 1
-        dates_data[date_str]['status_summary'][assignment['status']] += 1
+    if not 1 <= month <= 12:
+        return JsonResponse({'error': 'Invalid month'}, status=400)
 
-    return JsonResponse({
-        'dates': dates_data
-    })
+    # days[i] = [nombre de missions, masque des statuts] pour le jour i + 1
+    return JsonResponse(get_month_summary(interpreter, year, month))
+
+
+@login_required
+@require_http_methods(["GET"])
+async def calendar_data_api_async(request, year, month):
+    """Version async (ORM async) de calendar_data_api"""
+    interpreter = await _aget_interpreter(await request.auser())
+    if interpreter is None:
+        return JsonResponse({'error': 'Interpreter profile required'}, status=403)
+
+    if not 1 <= month <= 12:
+        return JsonResponse({'error': 'Invalid month'}, status=400)
+
+    return JsonResponse(await aget_month_summary(interpreter, year, month))
 
 @login_required
 @require_http_methods(["GET"])
@@ -3074,10 +3024,10 @@ def daily_missions_api(request, date_str):
     """
     API pour récupérer les missions d'une journée spécifique
     """
-    if not hasattr(request.user, 'interpreter_profile'):
+    if request.actor.interpreter is None:
         return JsonResponse({'error': 'Interpreter profile required'}, status=403)
 
-    interpreter = request.user.interpreter_profile
+    interpreter = request.actor.interpreter
     
     try:
         # Convertir la date string en objet date
@@ -3085,57 +3035,179 @@ def daily_missions_api(request, date_str):
     except ValueError:
         return JsonResponse({'error': 'Invalid date format'}, status=400)
 
-    # Récupérer les missions du jour
-    assignments = Assignment.objects.filter(
-        interpreter=interpreter,
-        start_time__date=target_date
-    ).select_related(
-        'client',
-        'source_language',
-        'target_language'
-    )
+    missions_data = [
+        _mission_data(assignment)
+        for assignment in _daily_missions_queryset(interpreter, target_date)
+    ]
 
-    missions_data = []
-    for assignment in assignments:
-        missions_data.append({
-            'id': assignment.id,
-            'start_time': assignment.start_time.isoformat(),
-            'end_time': assignment.end_time.isoformat(),
-            'client_info': {
-                'name': assignment.client_name,
-                'phone': assignment.client_phone,
-                'email': assignment.client_email
-            },
-            'location': {
-                'address': assignment.location,
-                'city': assignment.city,
-                'state': assignment.state,
-                'zip_code': assignment.zip_code,
-                'full_address': f"{assignment.location}, {assignment.city}, {assignment.state} {assignment.zip_code}"
-            },
-            'languages': {
-                'source': assignment.source_language.name,
-                'target': assignment.target_language.name
-            },
-            'status': assignment.status,
-            'can_be_started': assignment.can_be_started(),
-            'can_be_completed': assignment.can_be_completed(),
-            'can_be_cancelled': assignment.can_be_cancelled(),
-            'notes': assignment.notes,
-            'special_requirements': assignment.special_requirements
-        })
+    return JsonResponse({
+        'date': date_str,
+        'missions': missions_data
+    })
+
+
+@login_required
+@require_http_methods(["GET"])
+async def daily_missions_api_async(request, date_str):
+    """Version async (ORM async) de daily_missions_api"""
+    interpreter = await _aget_interpreter(await request.auser())
+    if interpreter is None:
+        return JsonResponse({'error': 'Interpreter profile required'}, status=403)
+
+    try:
+        target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+    except ValueError:
+        return JsonResponse({'error': 'Invalid date format'}, status=400)
+
+    missions_data = [
+        _mission_data(assignment)
+        async for assignment in _daily_missions_queryset(interpreter, target_date)
+    ]
 
     return JsonResponse({
         'date': date_str,
         'missions': missions_data
     })
 
+
+def _daily_missions_queryset(interpreter, target_date):
+    """Missions du jour (intervalle semi-ouvert à Boston)"""
+    day_start, day_end = DateTimeHandler.day_range(target_date)
+    return Assignment.objects.filter(
+        interpreter=interpreter,
+        start_time__gte=day_start,
+        start_time__lt=day_end
+    ).select_related(
+        'source_language',
+        'target_language'
+    ).order_by('start_time')
+
+
+def _mission_data(assignment):
+    return {
+        'id': assignment.id,
+        'start_time': assignment.start_time.isoformat(),
+        'end_time': assignment.end_time.isoformat(),
+        'client_info': {
+            'name': assignment.client_name,
+            'phone': assignment.client_phone,
+            'email': assignment.client_email
+        },
+        'location': {
+            'address': assignment.location,
+            'city': assignment.city,
+            'state': assignment.state,
+            'zip_code': assignment.zip_code,
+            'full_address': f"{assignment.location}, {assignment.city}, {assignment.state} {assignment.zip_code}"
+        },
+        'languages': {
+            'source': assignment.source_language.name,
+            'target': assignment.target_language.name
+        },
+        'status': assignment.status,
+        'can_be_started': assignment.can_be_started(),
+        'can_be_completed': assignment.can_be_completed(),
+        'can_be_cancelled': assignment.can_be_cancelled(),
+        'notes': assignment.notes,
+        'special_requirements': assignment.special_requirements
+    }
+
 def appointments_view(request):
     """
     Vue pour afficher la liste des rendez-vous
     """
     return render(request, 'interpreter/appointment.html')
 
+def get_stats_page_data(interpreter):
+    """Cartes, taux et données des graphiques de la page statistiques (mois en cours)"""
+    # Définir la période (par défaut le mois en cours, jours locaux)
+    today = timezone.localdate()
+    start_of_month = today.replace(day=1)
+    last_month_start = (start_of_month - timedelta(days=1)).replace(day=1)
+    
+    # Agrégats journaliers pré-calculés (InterpreterDailyRollup)
+    rollups = InterpreterDailyRollup.objects.filter(interpreter=interpreter)
+    current_month_rollups = rollups.filter(day__gte=start_of_month, day__lte=today)
+    current_month = get_rollup_totals(current_month_rollups)
+    last_month = get_rollup_totals(
+        rollups.filter(day__gte=last_month_start, day__lt=start_of_month)
+    )
+    
+    # Statistiques du mois en cours
+    current_earnings = current_month['earnings']
+    total_hours = float(current_month['completed_hours'])
+    
+    # Statistiques du mois précédent
+    last_month_earnings = last_month['earnings']
+    last_month_hours = float(last_month['completed_hours'])
+    last_month_stats = {
+        'completed': last_month['completed_count'],
+        'cancelled': last_month['cancelled_count'],
+        'no_show': last_month['no_show_count'],
+    }
+    
+    # Calcul des données pour les graphiques
+    earnings_data = [
+        {
+            'month': f"{row['period'].year}-{row['period'].month}",
+            'amount': float(row['earnings'])
+        }
+        for row in get_rollup_series(current_month_rollups, TruncMonth('day'))
+        if row['completed_count']
+    ]
+    
+    # Statistiques des missions actuelles
+    mission_stats = {
+        'completed': current_month['completed_count'],
+        'cancelled': current_month['cancelled_count'],
+        'no_show': current_month['no_show_count'],
+    }
+    
+    # Distribution des langues
+    languages_distribution = Assignment.objects.filter(
+        interpreter=interpreter,
+        start_time__gte=DateTimeHandler.day_range(start_of_month)[0],
+        status='COMPLETED'
+    ).values(
+        'target_language__name'
+    ).annotate(
+        value=Count('id')
+    ).order_by('-value')
+    
+    # Répartition des heures par jour de la semaine
+    hours_by_day = get_hours_by_weekday(
+        current_month_rollups, date_field='day', hours_field='completed_hours'
+    )
+
+    # Calcul des tendances
+    earnings_trend = calculate_trend(current_earnings, last_month_earnings)
+    hours_trend = calculate_trend(total_hours, last_month_hours)
+    mission_trend = calculate_trend(
+        mission_stats['completed'],
+        last_month_stats.get('completed', 0)
+    )
+
+    return {
+        'total_earnings': current_earnings,
+        'total_hours': round(total_hours, 1),
+        'completed_missions': mission_stats['completed'],
+        'earnings_trend': earnings_trend,
+        'earnings_trend_abs': abs(earnings_trend),
+        'hours_trend': hours_trend,
+        'hours_trend_abs': abs(hours_trend),
+        'mission_trend': mission_trend,
+        'mission_trend_abs': abs(mission_trend),
+        'mission_stats': {
+            'completed_rate': calculate_percentage(mission_stats['completed'], sum(mission_stats.values())),
+            'cancelled_rate': calculate_percentage(mission_stats['cancelled'], sum(mission_stats.values())),
+            'no_show_rate': calculate_percentage(mission_stats['no_show'], sum(mission_stats.values())),
+        },
+        'earnings_data': json.dumps(earnings_data),
+        'languages_data': json.dumps(list(languages_distribution)),
+        'hours_data': json.dumps(hours_by_day),
+    }
+
+
 @login_required
 def stats_view(request):
     """
@@ -3144,166 +3216,22 @@ def stats_view(request):
     logger.info(f"Accessing stats view for user: {request.user.username}")
 
     # Vérifier si l'utilisateur a un profil d'interprète
-    if not hasattr(request.user, 'interpreter_profile'):
+    if request.actor.interpreter is None:
         logger.error(f"User {request.user.username} does not have interpreter profile")
         return render(request, 'error.html', {
             'message': 'Access denied. Interpreter profile required.'
         })
 
     # Récupérer l'interprète connecté
-    interpreter = request.user.interpreter_profile
+    interpreter = request.actor.interpreter
     logger.info(f"Retrieved interpreter profile for user: {interpreter}")
     
     try:
-        # Définir la période (par défaut le mois en cours)
-        today = timezone.now()
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        last_month_start = (start_of_month - timedelta(days=1)).replace(day=1)
-        
-        logger.info(f"Calculating stats for period: {start_of_month} to {today}")
-        
-        # Requêtes pour le mois en cours
-        current_month_assignments = Assignment.objects.filter(
-            interpreter=interpreter,
-            start_time__gte=start_of_month,
-            start_time__lte=today
-        )
-        
-        # Requêtes pour le mois précédent
-        last_month_assignments = Assignment.objects.filter(
-            interpreter=interpreter,
-            start_time__gte=last_month_start,
-            start_time__lt=start_of_month
-        )
-        
-        # Calcul des statistiques du mois en cours
-        current_earnings = current_month_assignments.filter(
-            status='COMPLETED'
-        ).aggregate(
-            total=Sum('total_interpreter_payment')
-        )['total'] or Decimal('0')
-        
-        # Calcul des heures totales actuelles
-        completed_assignments = current_month_assignments.filter(status='COMPLETED')
-        total_hours = sum(
-            (assignment.end_time - assignment.start_time).total_seconds() / 3600
-            for assignment in completed_assignments
-        )
-        
-        # Calcul des heures du mois précédent
-        last_month_completed = last_month_assignments.filter(status='COMPLETED')
-        last_month_hours = sum(
-            (assignment.end_time - assignment.start_time).total_seconds() / 3600
-            for assignment in last_month_completed
-        )
-        
-        # Statistiques du mois précédent
-        last_month_earnings = last_month_assignments.filter(
-            status='COMPLETED'
-        ).aggregate(
-            total=Sum('total_interpreter_payment')
-        )['total'] or Decimal('0')
-        
-        last_month_stats = last_month_assignments.aggregate(
-            completed=Count('id', filter=Q(status='COMPLETED')),
-            cancelled=Count('id', filter=Q(status='CANCELLED')),
-            no_show=Count('id', filter=Q(status='NO_SHOW'))
-        )
-        
-        # Calcul des données pour les graphiques
-        earnings_by_period = current_month_assignments.filter(
-            status='COMPLETED'
-        ).annotate(
-            month=ExtractMonth('start_time'),
-            year=ExtractYear('start_time')
-        ).values('month', 'year').annotate(
-            amount=Sum('total_interpreter_payment')
-        ).order_by('year', 'month')
-
-        # Préparation des données pour les graphiques
-        earnings_data = [
-            {
-                'month': f"{item['year']}-{item['month']}",
-                'amount': float(item['amount'])
-            }
-            for item in earnings_by_period
-        ]
-        
-        # Statistiques des missions actuelles
-        mission_stats = current_month_assignments.aggregate(
-            completed=Count('id', filter=Q(status='COMPLETED')),
-            cancelled=Count('id', filter=Q(status='CANCELLED')),
-            no_show=Count('id', filter=Q(status='NO_SHOW'))
-        )
-        
-        # Distribution des langues
-        languages_distribution = current_month_assignments.filter(
-            status='COMPLETED'
-        ).values(
-            'target_language__name'
-        ).annotate(
-            value=Count('id')
-        ).order_by('-value')
-        
-        # Répartition des heures par jour avec gestion des erreurs
-        hours_by_day = []
-        days_of_week = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        
-        for assignment in completed_assignments:
-            day_index = assignment.start_time.weekday()
-            duration = (assignment.end_time - assignment.start_time).total_seconds() / 3600
-            
-            # Chercher si le jour existe déjà dans hours_by_day
-            day_entry = next(
-                (item for item in hours_by_day if item['day'] == days_of_week[day_index]), 
-                None
-            )
-            
-            if day_entry:
-                day_entry['hours'] += duration
-            else:
-                hours_by_day.append({
-                    'day': days_of_week[day_index],
-                    'hours': duration
-                })
-        
-        # Trier les jours dans l'ordre
-        hours_by_day.sort(key=lambda x: days_of_week.index(x['day']))
-
-        # Remplir les jours manquants avec 0 heures
-        existing_days = [entry['day'] for entry in hours_by_day]
-        for day in days_of_week:
-            if day not in existing_days:
-                hours_by_day.append({'day': day, 'hours': 0})
-        
-        hours_by_day.sort(key=lambda x: days_of_week.index(x['day']))
-
-        # Calcul des tendances
-        earnings_trend = calculate_trend(current_earnings, last_month_earnings)
-        hours_trend = calculate_trend(total_hours, last_month_hours)
-        mission_trend = calculate_trend(
-            mission_stats['completed'],
-            last_month_stats.get('completed', 0)
-        )
-
+        # Statistiques calculées au rendu, seulement si le fragment n'est pas en cache
         context = {
-            'total_earnings': current_earnings,
-            'total_hours': round(total_hours, 1),
-            'completed_missions': mission_stats['completed'],
-            'earnings_trend': earnings_trend,
-            'earnings_trend_abs': abs(earnings_trend),
-            'hours_trend': hours_trend,
-            'hours_trend_abs': abs(hours_trend),
-            'mission_trend': mission_trend,
-            'mission_trend_abs': abs(mission_trend),
-            'mission_stats': {
-                'completed_rate': calculate_percentage(mission_stats['completed'], sum(mission_stats.values())),
-                'cancelled_rate': calculate_percentage(mission_stats['cancelled'], sum(mission_stats.values())),
-                'no_show_rate': calculate_percentage(mission_stats['no_show'], sum(mission_stats.values())),
-            },
-            'earnings_data': json.dumps(earnings_data),
-            'languages_data': json.dumps(list(languages_distribution)),
-            'hours_data': json.dumps(hours_by_day),
+            'stats': SimpleLazyObject(lambda: get_stats_page_data(interpreter)),
+            'fragment_key': get_fragment_key(interpreter),
+            'fragment_timeout': FRAGMENT_TIMEOUT,
         }
         
         logger.info("Successfully prepared context for template")
@@ -3339,106 +3267,128 @@ def calculate_percentage(part, total):
         return 0
     
     
+def _earnings_week(start_date, daily):
+    return [
+        {
+            'day': day.strftime('%a'),
+            'amount': float(daily.get(day, 0))
+        } for day in (start_date + timedelta(days=i) for i in range(7))
+    ]
+
+
+def _earnings_month(daily):
+    return [
+        {
+            'day': str(i),
+            'amount': float(daily.get(i, 0))
+        } for i in range(1, 32)
+    ]
+
+
+def _earnings_year(today, series):
+    monthly = {row['period'].month: row['earnings'] for row in series}
+    return [
+        {
+            'month': (today.replace(month=i, day=1)).strftime('%b'),
+            'amount': float(monthly.get(i, 0))
+        } for i in range(1, 13)
+    ]
+
+
 def earnings_data_api(request, period):
     """
     API pour récupérer les données de gains selon la période
     """
-    if not hasattr(request.user, 'interpreter_profile'):
+    if request.actor.interpreter is None:
         return JsonResponse({'error': 'Interpreter profile required'}, status=403)
 
-    interpreter = request.user.interpreter_profile
-    today = timezone.now()
+    interpreter = request.actor.interpreter
+    today = timezone.localdate()
+    # Lecture des agrégats journaliers pré-calculés (InterpreterDailyRollup)
+    rollups = InterpreterDailyRollup.objects.filter(interpreter=interpreter)
 
     try:
         if period == 'week':
-            start_date = today - timedelta(days=7)
-            assignments = Assignment.objects.filter(
-                interpreter=interpreter,
-                start_time__gte=start_date,
-                status='COMPLETED'
-            ).annotate(
-                day=ExtractDay('start_time')
-            ).values('day').annotate(
-                amount=Sum('total_interpreter_payment')
-            ).order_by('day')
-
-            data = [
-                {
-                    'day': (start_date + timedelta(days=i)).strftime('%a'),
-                    'amount': 0
-                } for i in range(7)
-            ]
-
-            for entry in assignments:
-                day_index = (entry['day'] - start_date.day) % 7
-                if 0 <= day_index < 7:
-                    data[day_index]['amount'] = float(entry['amount'])
+            start_date = today - timedelta(days=6)
+            data = _earnings_week(start_date, dict(rollups.filter(
+                day__gte=start_date,
+                day__lte=today
+            ).values_list('day', 'earnings')))
 
         elif period == 'month':
-            start_date = today.replace(day=1)
-            assignments = Assignment.objects.filter(
-                interpreter=interpreter,
-                start_time__year=today.year,
-                start_time__month=today.month,
-                status='COMPLETED'
-            ).annotate(
-                day=ExtractDay('start_time')
-            ).values('day').annotate(
-                amount=Sum('total_interpreter_payment')
-            ).order_by('day')
-
-            data = [
-                {
-                    'day': str(i),
-                    'amount': 0
-                } for i in range(1, 32)
-            ]
-
-            for entry in assignments:
-                if 1 <= entry['day'] <= 31:
-                    data[entry['day']-1]['amount'] = float(entry['amount'])
+            data = _earnings_month(dict(rollups.filter(
+                day__year=today.year,
+                day__month=today.month
+            ).values_list('day__day', 'earnings')))
 
         else:  # year
-            assignments = Assignment.objects.filter(
-                interpreter=interpreter,
-                start_time__year=today.year,
-                status='COMPLETED'
-            ).annotate(
-                month=ExtractMonth('start_time')
-            ).values('month').annotate(
-                amount=Sum('total_interpreter_payment')
-            ).order_by('month')
-
-            data = [
-                {
-                    'month': (today.replace(month=i, day=1)).strftime('%b'),
-                    'amount': 0
-                } for i in range(1, 13)
-            ]
-
-            for entry in assignments:
-                if 1 <= entry['month'] <= 12:
-                    data[entry['month']-1]['amount'] = float(entry['amount'])
+            data = _earnings_year(
+                today,
+                get_rollup_series(rollups.filter(day__year=today.year), TruncMonth('day'))
+            )
 
         return JsonResponse(data, safe=False)
 
     except Exception as e:
         logger.error(f"Error in earnings_data_api: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
+
+
+async def earnings_data_api_async(request, period):
+    """Version async (ORM async) de earnings_data_api"""
+    interpreter = await _aget_interpreter(await request.auser())
+    if interpreter is None:
+        return JsonResponse({'error': 'Interpreter profile required'}, status=403)
+
+    today = timezone.localdate()
+    rollups = InterpreterDailyRollup.objects.filter(interpreter=interpreter)
+
+    try:
+        if period == 'week':
+            start_date = today - timedelta(days=6)
+            daily = {
+                day: earnings async for day, earnings in rollups.filter(
+                    day__gte=start_date,
+                    day__lte=today
+                ).values_list('day', 'earnings')
+            }
+            data = _earnings_week(start_date, daily)
+
+        elif period == 'month':
+            daily = {
+                day: earnings async for day, earnings in rollups.filter(
+                    day__year=today.year,
+                    day__month=today.month
+                ).values_list('day__day', 'earnings')
+            }
+            data = _earnings_month(daily)
+
+        else:  # year
+            data = _earnings_year(
+                today,
+                await aget_rollup_series(rollups.filter(day__year=today.year), TruncMonth('day'))
+            )
+
+        return JsonResponse(data, safe=False)
+
+    except Exception as e:
+        logger.error(f"Error in earnings_data_api_async: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
     
     
     
-class PaymentListView(ListView):
+class PaymentListView(KeysetPaginationMixin, ListView):
     model = Assignment
     template_name = 'interpreter/payment_list.html'
     context_object_name = 'assignments'
+    keyset_field = 'start_time'
     
     def dispatch(self, request, *args, **kwargs):
         """Check if user has interpreter profile before proceeding"""
         if not request.user.is_authenticated:
             return redirect('login')
             
-        if not hasattr(request.user, 'interpreter_profile'):
+        if request.actor.interpreter is None:
             return render(request, 'error.html', {
                 'message': 'Access denied. Interpreter profile required.'
             })
@@ -3448,32 +3398,37 @@ class PaymentListView(ListView):
     def get_queryset(self):
         """Return assignments completed by the current interpreter"""
         # Get interpreter profile
-        interpreter = self.request.user.interpreter_profile
+        interpreter = self.request.actor.interpreter
         
         return Assignment.objects.filter(
             interpreter=interpreter,
             # Only show completed assignments
             status=Assignment.Status.COMPLETED
-        ).order_by('-start_time')
+        ).select_related('service_type')
+
+    def serialize_object(self, assignment):
+        return {
+            'id': assignment.id,
+            'start_time': assignment.start_time.isoformat(),
+            'service_type': assignment.service_type.name,
+            'total_interpreter_payment': str(assignment.total_interpreter_payment or ''),
+            'status': assignment.status,
+            'is_paid': bool(assignment.is_paid),
+        }
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Get interpreter profile
-        interpreter = self.request.user.interpreter_profile
+        interpreter = self.request.actor.interpreter
             
-        # Get all completed assignments for the interpreter
-        completed_assignments = Assignment.objects.filter(
-            interpreter=interpreter,
-            status=Assignment.Status.COMPLETED
-        )
+        # All revenue and payment counters in a single aggregate query
+        now = timezone.localtime()
+        stats = get_assignment_stats(interpreter, now=now)
         
         # Calculate date ranges
-        now = timezone.now()
-        week_start = now - timedelta(days=now.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = stats['week_start']
         week_end = week_start + timedelta(days=6)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         
         # Format date strings
         current_month_name = now.strftime('%B %Y')
@@ -3481,38 +3436,17 @@ class PaymentListView(ListView):
         week_end_str = week_end.strftime('%b %d, %Y')
         week_date_range = f"{week_start_str} - {week_end_str}"
         
-        # This week's revenue
-        weekly_revenue = completed_assignments.filter(
-            start_time__gte=week_start
-        ).aggregate(
-            sum=Sum('total_interpreter_payment')
-        )['sum'] or 0
-        
-        # This month's revenue
-        monthly_revenue = completed_assignments.filter(
-            start_time__gte=month_start
-        ).aggregate(
-            sum=Sum('total_interpreter_payment')
-        )['sum'] or 0
-        
-        # Total revenue
-        total_revenue = completed_assignments.aggregate(
-            sum=Sum('total_interpreter_payment')
-        )['sum'] or 0
-        
         # Add revenue data to context
-        context['weekly_revenue'] = weekly_revenue
-        context['monthly_revenue'] = monthly_revenue
-        context['total_revenue'] = total_revenue
+        context['weekly_revenue'] = stats['weekly_earnings']
+        context['monthly_revenue'] = stats['monthly_earnings']
+        context['total_revenue'] = stats['lifetime_earnings']
         
         # Add date information
         context['current_month'] = current_month_name
         context['week_date_range'] = week_date_range
         
         # Payment statistics
-        context['paid_count'] = completed_assignments.filter(is_paid=True).count()
-        context['unpaid_count'] = completed_assignments.filter(
-            Q(is_paid=False) | Q(is_paid=None)
-        ).count()
+        context['paid_count'] = stats['paid']
+        context['unpaid_count'] = stats['unpaid']
         
         return context
\ No newline at end of file
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 from datetime import timedelta
 import dj_database_url
 from supabase import create_client
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext_lazy as _
 
 # Charger les variables d'environnement
@@ -81,6 +82,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "app.middleware.ServerTimingMiddleware",  # En premier : mesure toute la requête
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",  # Internationalisation middleware
@@ -89,6 +91,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "app.middleware.ActorMiddleware",  # request.actor : rôle et profil de l'utilisateur
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     'social_django.middleware.SocialAuthExceptionMiddleware',
@@ -96,9 +99,44 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "config.urls"
 
+# En-tête Server-Timing (db, tpl, cache, smtp, supabase, total) ; la ligne de log est toujours écrite
+SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', 'True') == 'True'
+
+# Cache partagé entre workers et serveurs (Redis) ; sans REDIS_CACHE_URL (tests, dev),
+# cache local au processus. Accès applicatifs via app.cache.CacheNamespace.
+# Obligatoire hors DEBUG : versions de fragments, compteurs de non-lus, génération des
+# référentiels et tâches Celery (beat) n'invalident que le processus courant en locmem
+REDIS_CACHE_URL = os.getenv('REDIS_CACHE_URL')
+if not REDIS_CACHE_URL and not DEBUG:
+    raise ImproperlyConfigured("REDIS_CACHE_URL is required when DEBUG is off (shared cache)")
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'app.utils.request_timing.InstrumentedRedisCache',  # RedisCache + hits / misses
+            'LOCATION': REDIS_CACHE_URL,
+            'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'dbdint'),
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'app.utils.request_timing.InstrumentedLocMemCache',  # LocMemCache + hits / misses
+        }
+    }
+
+# Avec le cache partagé : sessions lues depuis le cache (une requête seulement en cas
+# d'absence), écrites en base et en cache. Sans lui, un cache par processus servirait des
+# sessions périmées (déconnexion, rotation) : sessions en base seulement.
+# L'inscription interprète garde son état hors session (CachedWizardMixin)
+if REDIS_CACHE_URL:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "app.utils.request_timing.TimedDjangoTemplates",  # DjangoTemplates + temps de rendu
         "DIRS": [
             BASE_DIR / 'templates',
         ],
@@ -223,7 +261,7 @@ CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'True') == 'True'
 CSRF_TRUSTED_ORIGINS = os.getenv('CSRF_TRUSTED_ORIGINS', '').split(',') if os.getenv('CSRF_TRUSTED_ORIGINS') else []
 
 # Email Configuration
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = 'app.utils.request_timing.TimedSMTPEmailBackend'  # SMTP chronométré
 QUOTE_NOTIFICATION_EMAIL = os.getenv('DEFAULT_FROM_EMAIL')
 EMAIL_HOST = os.getenv('EMAIL_HOST')
 EMAIL_PORT = int(os.getenv('EMAIL_PORT', 587))
@@ -241,10 +279,24 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Sans broker (dev) : tâches exécutées dans le processus appelant (emails compris)
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', 'False') == 'True'
+# Événements temps réel (SSE) : Redis pub/sub entre workers et tâches Celery, par défaut
+# sur le Redis du cache (obligatoire hors DEBUG) ; sans aucune URL (dev), bus en mémoire
+PUSH_EVENTS_REDIS_URL = os.getenv('PUSH_EVENTS_REDIS_URL') or REDIS_CACHE_URL
+CELERY_BEAT_SCHEDULE = {
+    # Réalignement des compteurs de non-lus (badges) sur la base
+    'reconcile-unread-counters': {
+        'task': 'app.tasks.reconcile_unread_counters',
+        'schedule': 15 * 60,
+    },
+}
 
 # Social Auth Configuration
+# Plusieurs backends : login() sans authenticate() doit préciser backend=
 AUTHENTICATION_BACKENDS = (
-    'django.contrib.auth.backends.ModelBackend',
+    'app.backends.ProfileModelBackend',  # ModelBackend, utilisateur + profil en une requête
+    'django.contrib.auth.backends.ModelBackend',  # sessions ouvertes avant ProfileModelBackend
 )
 
 SOCIAL_AUTH_GOOGLE_OAUTH2_KEY = os.getenv('SOCIAL_AUTH_GOOGLE_CLIENT_ID')
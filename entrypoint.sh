@@ -8,5 +8,5 @@ python manage.py collectstatic --noinput
 
 
 
-# Démarrer Gunicorn
-exec gunicorn --bind 0.0.0.0:8000 config.wsgi:application
\ No newline at end of file
+# Démarrer Gunicorn (workers ASGI : flux SSE /events/stream/)
+exec gunicorn --bind 0.0.0.0:8000 -k uvicorn_worker.UvicornWorker config.asgi:application
\ No newline at end of file
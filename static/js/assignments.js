@@ -6,35 +6,10 @@ document.addEventListener('DOMContentLoaded', function() {
     updateAssignmentCounts();
 });
 
-// Gestion des onglets
+// Gestion des onglets : liens ?tab= (une page paginée par onglet), seul l'onglet actif est rendu
 function initializeTabs() {
-    const tabs = document.querySelectorAll('.tab-button');
-    const contents = document.querySelectorAll('.tab-content');
-
-    // Masquer tous les contenus sauf le premier au démarrage
-    contents.forEach(content => {
-        content.style.display = 'none';
-    });
-    document.getElementById('pending-content').style.display = 'block';
-
-    tabs.forEach(tab => {
-        tab.addEventListener('click', () => {
-            // Mise à jour des onglets
-            tabs.forEach(t => t.classList.remove('active'));
-            contents.forEach(content => {
-                content.style.display = 'none';
-                content.classList.remove('active');
-            });
-
-            // Activation de l'onglet sélectionné
-            tab.classList.add('active');
-            const contentId = `${tab.dataset.tab}-content`;
-            const activeContent = document.getElementById(contentId);
-            if (activeContent) {
-                activeContent.style.display = 'block';
-                activeContent.classList.add('active');
-            }
-        });
+    document.querySelectorAll('.tab-content').forEach(content => {
+        content.style.display = content.classList.contains('active') ? 'block' : 'none';
     });
 }
 
@@ -16,9 +16,49 @@ function updateAssignmentBadge() {
         });
 }
 
-function initializeNotifications() {
+function updateNotificationCount() {
+    fetch('/api/notifications/unread-count/')
+        .then(response => response.json())
+        .then(data => {
+            const count = document.getElementById('notification-count');
+            if (!count) return;
+            count.textContent = data.count;
+            count.style.display = data.count > 0 ? 'flex' : 'none';
+        });
+}
+
+function refreshBadges() {
     updateAssignmentBadge();
-    setInterval(updateAssignmentBadge, 30000);
+    updateNotificationCount();
+}
+
+const BADGE_POLL_INTERVAL = 30000;
+
+function initializeNotifications() {
+    refreshBadges();
+
+    // Push (SSE) : badges rafraîchis à chaque événement ; polling si EventSource est indisponible
+    if (window.EventSource) {
+        const events = new EventSource('/events/stream/');
+        let poll = null;
+        events.addEventListener('assignment_offer', updateAssignmentBadge);
+        events.addEventListener('assignment_status', updateAssignmentBadge);
+        events.addEventListener('notification', updateNotificationCount);
+        // (Re)connexion : les événements publiés pendant la coupure sont perdus, on relit les compteurs
+        events.addEventListener('open', () => {
+            clearInterval(poll);
+            poll = null;
+            refreshBadges();
+        });
+        // Coupure : polling jusqu'à la reconnexion
+        events.addEventListener('error', () => {
+            if (!poll) {
+                poll = setInterval(refreshBadges, BADGE_POLL_INTERVAL);
+            }
+        });
+    } else {
+        setInterval(refreshBadges, BADGE_POLL_INTERVAL);
+    }
 
     document.querySelector('.nav-item').addEventListener('click', function() {
         const iconWrapper = this.querySelector('.notification-icon-wrapper');